@@ -16,6 +16,9 @@ LOG_DIR="$PROJECT_DIR/logs"
 LOG_FILE="$LOG_DIR/webui.log"
 HOST="127.0.0.1"
 PORT="8000"
+# Processus uvicorn. Garder 1 tant que les jobs du pipeline sont suivis en
+# mémoire : GET /api/pipeline/jobs/{id} doit atteindre le worker du job.
+WORKERS="${INDEXAO_WORKERS:-1}"
 
 # Couleurs pour l'affichage
 RED='\033[0;31m'
@@ -135,8 +138,11 @@ start() {
     print_status "Lancement du serveur sur http://$HOST:$PORT"
     print_status "Logs: $LOG_FILE"
     
-    # Démarrer en arrière-plan
-    nohup python -m indexao.webui > "$LOG_FILE" 2>&1 &
+    # Démarrer en arrière-plan (uvicorn choisit uvloop + httptools s'ils sont installés)
+    nohup python -m uvicorn indexao.webui:app \
+        --host "$HOST" --port "$PORT" \
+        --workers "$WORKERS" --backlog 2048 \
+        > "$LOG_FILE" 2>&1 &
     local pid=$!
     
     # Sauvegarder le PID
@@ -270,6 +276,7 @@ ${GREEN}Exemples:${NC}
 ${GREEN}Configuration:${NC}
     Host:     $HOST
     Port:     $PORT
+    Workers:  $WORKERS (INDEXAO_WORKERS)
     PID File: $PID_FILE
     Logs:     $LOG_FILE
     Venv:     $VENV_DIR
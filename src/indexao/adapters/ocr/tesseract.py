@@ -38,6 +38,9 @@ class TesseractOCR:
         >>> print(result.text)
     """
     
+    # OCR limitée par le CPU : le processor l'exécute dans des processus séparés
+    cpu_bound = True
+    
     def __init__(self, tesseract_cmd: Optional[str] = None):
         """Initialise l'adaptateur Tesseract.
         
@@ -50,9 +53,15 @@ class TesseractOCR:
                 "Dependencies manquantes. Installez: pip install pytesseract pdf2image Pillow"
             )
         
+        self._tesseract_cmd = tesseract_cmd
         if tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
         
+        # Caches : chaque appel pytesseract lance un sous-processus tesseract,
+        # on évite donc de redemander version/langues à chaque document
+        self._version: Optional[str] = None
+        self._languages: Optional[List[str]] = None
+        
         # Vérifier que Tesseract est disponible
         if not self.is_available():
             raise RuntimeError(
@@ -60,6 +69,16 @@ class TesseractOCR:
                 "Installez avec: brew install tesseract tesseract-lang (macOS)"
             )
     
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restaure l'adaptateur dans un processus OCR (pickle, sans __init__).
+        
+        Le chemin de l'exécutable est un réglage global de pytesseract :
+        il faut le réappliquer dans le processus qui reçoit l'adaptateur.
+        """
+        self.__dict__.update(state)
+        if self._tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = self._tesseract_cmd
+    
     @property
     def name(self) -> str:
         """Nom de l'adaptateur."""
@@ -68,13 +87,41 @@ class TesseractOCR:
     @property
     def supported_languages(self) -> List[str]:
         """Langues supportées (basé sur les packages installés)."""
-        try:
-            # Tesseract retourne les langues disponibles
-            langs = pytesseract.get_languages(config='')
-            return langs
-        except Exception:
-            # Fallback sur les plus communes
-            return ["eng", "fra", "deu", "spa", "ita", "por", "rus", "chi_sim", "chi_tra"]
+        if self._languages is None:
+            try:
+                # Tesseract retourne les langues disponibles
+                self._languages = pytesseract.get_languages(config='')
+            except Exception:
+                # Fallback sur les plus communes (non mis en cache)
+                return ["eng", "fra", "deu", "spa", "ita", "por", "rus", "chi_sim", "chi_tra"]
+        return self._languages
+    
+    def warmup(self, language: str = "fra+eng") -> List[str]:
+        """Pré-charge les packs de langue avant le premier document.
+        
+        Lance un OCR factice sur une image blanche : les fichiers traineddata
+        (plusieurs Mo pour chi_tra) passent dans le cache disque de l'OS et
+        le premier vrai document ne paie plus ce coût. Met aussi en cache la
+        version et la liste des langues installées.
+        
+        Args:
+            language: Langue(s) Tesseract à pré-charger (ex: "fra+eng+chi_tra")
+        
+        Returns:
+            Liste des langues demandées mais non installées (vide si tout est OK)
+        """
+        self.get_version()
+        installed = set(self.supported_languages)
+        missing = [lang for lang in language.split("+") if lang not in installed]
+        
+        available = "+".join(lang for lang in language.split("+") if lang in installed)
+        if available:
+            try:
+                pytesseract.image_to_string(Image.new("L", (32, 32), 255), lang=available)
+            except Exception:
+                pass  # Le warmup est une optimisation, jamais bloquant
+        
+        return missing
     
     def process_image(
         self,
@@ -110,9 +157,8 @@ class TesseractOCR:
         
         # PDF: Convertir en images puis OCR
         if suffix == ".pdf":
-            text, confidence, pages = self._extract_from_pdf(
-                image_path, language, kwargs.get("dpi", 300), **kwargs
-            )
+            # dpi (défaut 300) passe par kwargs : le retry OCR le fournit
+            text, confidence, pages = self._extract_from_pdf(image_path, language, **kwargs)
         
         # Image: OCR direct
         elif suffix in [".png", ".jpg", ".jpeg", ".tiff", ".bmp"]:
@@ -246,12 +292,13 @@ class TesseractOCR:
             return False
     
     def get_version(self) -> str:
-        """Retourne la version de Tesseract."""
-        try:
-            version = pytesseract.get_tesseract_version()
-            return str(version)
-        except Exception:
-            return "unknown"
+        """Retourne la version de Tesseract (mise en cache après le premier appel)."""
+        if self._version is None:
+            try:
+                self._version = str(pytesseract.get_tesseract_version())
+            except Exception:
+                return "unknown"
+        return self._version
 
     
     def _build_tesseract_config(self, **kwargs) -> str:
@@ -2,6 +2,9 @@
 
 from indexao.adapters.search.base import SearchAdapter, SearchResult, IndexedDocument
 from indexao.adapters.search.mock import MockSearchAdapter
-from indexao.adapters.search.meilisearch import MeilisearchAdapter
+from indexao.adapters.search.meilisearch import MeilisearchAdapter, get_shared_client
 
-__all__ = ['SearchAdapter', 'SearchResult', 'IndexedDocument', 'MockSearchAdapter', 'MeilisearchAdapter']
+__all__ = [
+    'SearchAdapter', 'SearchResult', 'IndexedDocument', 'MockSearchAdapter', 'MeilisearchAdapter',
+    'get_shared_client',
+]
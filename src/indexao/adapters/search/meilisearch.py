@@ -4,6 +4,7 @@ Implémentation réelle de l'indexation et recherche avec Meilisearch.
 Moteur de recherche ultra-rapide avec typo-tolerance et recherche sémantique.
 """
 
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
@@ -18,6 +19,28 @@ except ImportError:
     meilisearch = None  # type: ignore
 
 
+@lru_cache(maxsize=None)
+def get_shared_client(host: str, api_key: Optional[str] = None) -> "meilisearch.Client":
+    """Client Meilisearch unique par serveur (host, clé API).
+    
+    Les adapters construits pour un même serveur (pipeline, API de
+    recherche) le passent en `client=` et partagent ainsi une seule
+    session HTTP.
+    
+    Args:
+        host: URL du serveur Meilisearch
+        api_key: Clé API (None pour serveur local sans auth)
+        
+    Returns:
+        Client Meilisearch partagé
+    """
+    if not DEPENDENCIES_AVAILABLE:
+        raise ImportError(
+            "Dépendances manquantes. Installez: pip install meilisearch"
+        )
+    return meilisearch.Client(host, api_key)
+
+
 class MeilisearchAdapter:
     """Adaptateur de recherche basé sur Meilisearch.
     
@@ -47,7 +70,8 @@ class MeilisearchAdapter:
         self,
         host: str = "http://127.0.0.1:7700",
         api_key: Optional[str] = None,
-        index_name: str = "documents"
+        index_name: str = "documents",
+        client: Optional["meilisearch.Client"] = None
     ):
         """Initialise l'adaptateur Meilisearch.
         
@@ -55,6 +79,8 @@ class MeilisearchAdapter:
             host: URL du serveur Meilisearch
             api_key: Clé API (None pour serveur local sans auth)
             index_name: Nom de l'index à utiliser
+            client: Client Meilisearch existant à réutiliser (None = en créer un),
+                    en général get_shared_client(host, api_key)
         """
         if not DEPENDENCIES_AVAILABLE:
             raise ImportError(
@@ -64,8 +90,8 @@ class MeilisearchAdapter:
         self.host = host
         self.index_name = index_name
         
-        # Connexion au client
-        self.client = meilisearch.Client(host, api_key)
+        # Connexion au client (réutilisé s'il est fourni)
+        self.client = client if client is not None else meilisearch.Client(host, api_key)
         
         # Créer/récupérer l'index
         self.index = self._get_or_create_index()
@@ -73,7 +99,7 @@ class MeilisearchAdapter:
         # Configurer les paramètres de recherche
         self._configure_index()
     
-    def _get_or_create_index(self) -> meilisearch.index.Index:
+    def _get_or_create_index(self) -> "meilisearch.index.Index":
         """Récupère ou crée l'index Meilisearch."""
         try:
             # Essayer de récupérer l'index existant
@@ -126,6 +126,32 @@ class TranslatorAdapter(Protocol):
         """
         ...
     
+    def translate_multi(
+        self,
+        text: str,
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, TranslationResult]:
+        """
+        Translate one text to several target languages in a single call.
+        
+        Args:
+            text: Text to translate
+            target_languages: Target language codes
+            source_language: Source language (None = auto-detect)
+            **kwargs: Engine-specific options
+        
+        Returns:
+            Dictionary of TranslationResult objects (lang_code -> result),
+            in the order of target_languages
+        
+        Note:
+            Backends whose API accepts several target languages should send
+            a single request instead of one per language.
+        """
+        ...
+    
     def detect_language(self, text: str) -> str:
         """
         Detect language of text.
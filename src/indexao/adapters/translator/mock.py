@@ -1,6 +1,6 @@
 """Mock translator adapter for testing."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 import time
 
 from indexao.adapters.translator.base import TranslatorAdapter, TranslationResult
@@ -91,6 +91,19 @@ class MockTranslatorAdapter:
         """Translate multiple texts."""
         return [self.translate(text, target_language, source_language, **kwargs) for text in texts]
     
+    def translate_multi(
+        self,
+        text: str,
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, TranslationResult]:
+        """Translate one text to several languages."""
+        return {
+            lang: self.translate(text, lang, source_language, **kwargs)
+            for lang in target_languages
+        }
+    
     def detect_language(self, text: str) -> str:
         """Detect language (always returns 'en')."""
         logger.trace(f"Mock detecting language for: '{text[:50]}...'")
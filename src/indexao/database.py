@@ -7,34 +7,77 @@ Follows Sprint 0 standards: Logger + Path Manager.
 
 import json
 import sqlite3
+import zlib
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
+from indexao.adapters.ocr.base import OCRResult
 from indexao.logger import get_logger
 from indexao.models.document import Document, DocumentMetadata, ProcessingStage, ProcessingStatus
 from indexao.paths import get_path_adapter
 
+try:
+    import zstandard  # type: ignore[import]
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore
+
 logger = get_logger(__name__)
 
+# Document text (content, translations) at least this large is stored
+# compressed as a BLOB: zstd when available, zlib otherwise
+COMPRESS_MIN_BYTES = 4096
+ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
 class DatabaseError(Exception):
     """Database operation error."""
     pass
 
 
+def _pack_text(text: str) -> Union[str, bytes]:
+    """Compress a large text column (small texts are stored as-is)."""
+    data = text.encode("utf-8")
+    if len(data) < COMPRESS_MIN_BYTES:
+        return text
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data)
+
+
+def _unpack_text(value: Union[str, bytes, None]) -> Optional[str]:
+    """Decompress a text column written by _pack_text (plain text is returned as-is)."""
+    if not isinstance(value, bytes):
+        return value
+    if value.startswith(_ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise DatabaseError("zstd-compressed document, install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(value).decode("utf-8")
+    return zlib.decompress(value).decode("utf-8")
+
+
 class DocumentDatabase:
     """
     SQLite database manager for IndexAO documents.
     
-    Manages two tables:
+    Manages three tables:
     - documents: Persistent storage of document metadata
     - processing_queue: Temporary queue for documents being processed
+    - ocr_cache: OCR results by file content hash and OCR engine
     """
     
-    # Schema version for migrations
-    SCHEMA_VERSION = 1
+    # Schema version for migrations. Each step is applied by _init_schema:
+    # - v1: documents, processing_queue
+    # - v2: documents.content_hash column (ALTER TABLE on older databases)
+    #       and idx_documents_content_hash
+    # - v3: ocr_cache table
+    # - v4: documents.content / translations may hold compressed BLOBs
+    #       (_pack_text); v1-v3 rows are plain text and read unchanged
+    SCHEMA_VERSION = 4
     
     def __init__(self, db_path: str = "data/indexao.db"):
         """
@@ -92,6 +135,9 @@ class DocumentDatabase:
                     -- Metadata (JSON)
                     metadata TEXT,
                     
+                    -- Content fingerprint (duplicate detection)
+                    content_hash TEXT,
+                    
                     -- Translations (JSON: {lang: text})
                     translations TEXT DEFAULT '{}',
                     
@@ -133,6 +179,30 @@ class DocumentDatabase:
                 )
             """)
             
+            # v3: OCR results cache (reprocessed files skip OCR)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ocr_cache (
+                    content_hash TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    language TEXT,
+                    confidence REAL NOT NULL,
+                    processing_time_ms REAL DEFAULT 0,
+                    
+                    -- Engine metadata (JSON)
+                    metadata TEXT DEFAULT '{}',
+                    
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    
+                    PRIMARY KEY (content_hash, engine)
+                )
+            """)
+            
+            # v2: content_hash column on databases created before it
+            columns = {row["name"] for row in cursor.execute("PRAGMA table_info(documents)")}
+            if "content_hash" not in columns:
+                cursor.execute("ALTER TABLE documents ADD COLUMN content_hash TEXT")
+            
             # Indices for performance
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_documents_status 
@@ -144,6 +214,11 @@ class DocumentDatabase:
                 ON documents(created_at DESC)
             """)
             
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_documents_content_hash 
+                ON documents(content_hash)
+            """)
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_queue_priority 
                 ON processing_queue(priority DESC, queued_at ASC)
@@ -152,7 +227,11 @@ class DocumentDatabase:
             logger.info("✓ Database schema initialized")
     
     def _check_schema_version(self):
-        """Check and update schema version if needed."""
+        """Check and update schema version if needed.
+        
+        The migration steps themselves run in _init_schema (idempotent, see
+        SCHEMA_VERSION); this only records the version reached.
+        """
         with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
@@ -173,6 +252,15 @@ class DocumentDatabase:
     # DOCUMENT CRUD OPERATIONS
     # ========================================================================
     
+    _INSERT_DOCUMENT_SQL = """
+        INSERT INTO documents (
+            doc_id, content, title, metadata, content_hash, translations,
+            status, current_stage, error_message,
+            indexed, search_engine,
+            created_at, updated_at, processed_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
     def create_document(self, document: Document) -> bool:
         """
         Create a new document in the database.
@@ -186,32 +274,7 @@ class DocumentDatabase:
         try:
             with self._connection() as conn:
                 cursor = conn.cursor()
-                
-                metadata_json = json.dumps(document.metadata.to_dict()) if document.metadata else None
-                translations_json = json.dumps(document.translations)
-                
-                cursor.execute("""
-                    INSERT INTO documents (
-                        doc_id, content, title, metadata, translations,
-                        status, current_stage, error_message,
-                        indexed, search_engine,
-                        created_at, updated_at, processed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    document.doc_id,
-                    document.content,
-                    document.title,
-                    metadata_json,
-                    translations_json,
-                    document.status.value,
-                    document.current_stage.value,
-                    document.error_message,
-                    1 if document.indexed else 0,
-                    document.search_engine,
-                    document.created_at.isoformat(),
-                    document.updated_at.isoformat(),
-                    document.processed_at.isoformat() if document.processed_at else None,
-                ))
+                cursor.execute(self._INSERT_DOCUMENT_SQL, self._document_row(document))
                 
                 logger.info(f"✓ Document created: {document.doc_id}")
                 return True
@@ -220,6 +283,36 @@ class DocumentDatabase:
             logger.error(f"Failed to create document {document.doc_id}: {e}")
             return False
     
+    def bulk_create_documents(self, documents: List[Document]) -> int:
+        """
+        Create several documents in a single transaction (one commit).
+        
+        If the batch fails (e.g. a duplicate doc_id), documents are inserted
+        one by one so that valid rows are still saved.
+        
+        Args:
+            documents: Document objects to create
+            
+        Returns:
+            Number of documents created
+        """
+        if not documents:
+            return 0
+        
+        try:
+            with self._connection() as conn:
+                conn.executemany(
+                    self._INSERT_DOCUMENT_SQL,
+                    [self._document_row(document) for document in documents]
+                )
+            
+            logger.info(f"✓ {len(documents)} documents created")
+            return len(documents)
+        
+        except Exception as e:
+            logger.warning(f"Bulk insert failed, inserting documents one by one: {e}")
+            return sum(1 for document in documents if self.create_document(document))
+    
     def get_document(self, doc_id: str) -> Optional[Document]:
         """
         Get a document by ID.
@@ -240,6 +333,35 @@ class DocumentDatabase:
             
             return self._row_to_document(row)
     
+    def find_by_content_hash(self, content_hash: str) -> Optional[Document]:
+        """
+        Get a completed document with the given content hash.
+        
+        Used to skip processing of files whose content was already processed.
+        
+        Args:
+            content_hash: Hex digest of the file content
+            
+        Returns:
+            Most recent matching Document or None if not found
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT * FROM documents
+                WHERE content_hash = ? AND status = ?
+                ORDER BY created_at DESC LIMIT 1
+                """,
+                (content_hash, ProcessingStatus.COMPLETED.value)
+            )
+            row = cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            return self._row_to_document(row)
+    
     def update_document(self, document: Document) -> bool:
         """
         Update an existing document.
@@ -255,13 +377,14 @@ class DocumentDatabase:
                 cursor = conn.cursor()
                 
                 metadata_json = json.dumps(document.metadata.to_dict()) if document.metadata else None
-                translations_json = json.dumps(document.translations)
+                translations_json = _pack_text(json.dumps(document.translations))
                 
                 cursor.execute("""
                     UPDATE documents SET
                         content = ?,
                         title = ?,
                         metadata = ?,
+                        content_hash = ?,
                         translations = ?,
                         status = ?,
                         current_stage = ?,
@@ -272,9 +395,10 @@ class DocumentDatabase:
                         processed_at = ?
                     WHERE doc_id = ?
                 """, (
-                    document.content,
+                    _pack_text(document.content),
                     document.title,
                     metadata_json,
+                    document.metadata.content_hash if document.metadata else None,
                     translations_json,
                     document.status.value,
                     document.current_stage.value,
@@ -476,21 +600,113 @@ class DocumentDatabase:
                 "retries": retries,
             }
     
+    # ========================================================================
+    # OCR CACHE OPERATIONS
+    # ========================================================================
+    
+    def get_ocr_cached(self, content_hash: str, engine: str) -> Optional[OCRResult]:
+        """
+        Get a cached OCR result.
+        
+        Args:
+            content_hash: Hex digest of the file content
+            engine: OCR engine name
+            
+        Returns:
+            OCRResult or None if not cached
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM ocr_cache WHERE content_hash = ? AND engine = ?",
+                (content_hash, engine)
+            )
+            row = cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            return OCRResult(
+                text=row["text"],
+                language=row["language"],
+                confidence=row["confidence"],
+                processing_time_ms=row["processing_time_ms"],
+                metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            )
+    
+    def put_ocr_cache(self, content_hash: str, engine: str, result: OCRResult) -> bool:
+        """
+        Store an OCR result (replaces any previous result for this content and engine).
+        
+        Args:
+            content_hash: Hex digest of the file content
+            engine: OCR engine name
+            result: OCR result to cache
+            
+        Returns:
+            True if successful
+        """
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO ocr_cache (
+                        content_hash, engine, text, language, confidence,
+                        processing_time_ms, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        content_hash,
+                        engine,
+                        result.text,
+                        result.language,
+                        result.confidence,
+                        result.processing_time_ms,
+                        json.dumps(result.metadata, default=str),
+                    )
+                )
+                
+                logger.debug(f"OCR result cached: {content_hash[:12]} ({engine})")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to cache OCR result {content_hash[:12]}: {e}")
+            return False
+    
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
     
+    def _document_row(self, document: Document) -> tuple:
+        """Convert Document object to the parameters of _INSERT_DOCUMENT_SQL."""
+        return (
+            document.doc_id,
+            _pack_text(document.content),
+            document.title,
+            json.dumps(document.metadata.to_dict()) if document.metadata else None,
+            document.metadata.content_hash if document.metadata else None,
+            _pack_text(json.dumps(document.translations)),
+            document.status.value,
+            document.current_stage.value,
+            document.error_message,
+            1 if document.indexed else 0,
+            document.search_engine,
+            document.created_at.isoformat(),
+            document.updated_at.isoformat(),
+            document.processed_at.isoformat() if document.processed_at else None,
+        )
+    
     def _row_to_document(self, row: sqlite3.Row) -> Document:
         """Convert database row to Document object."""
         metadata = None
         if row["metadata"]:
             metadata = DocumentMetadata.from_dict(json.loads(row["metadata"]))
         
-        translations = json.loads(row["translations"]) if row["translations"] else {}
+        translations = json.loads(_unpack_text(row["translations"])) if row["translations"] else {}
         
         return Document(
             doc_id=row["doc_id"],
-            content=row["content"],
+            content=_unpack_text(row["content"]),
             title=row["title"],
             metadata=metadata,
             translations=translations,
@@ -508,7 +724,7 @@ class DocumentDatabase:
         """
         Clear all data from database (for testing).
         
-        WARNING: This deletes all documents and queue entries!
+        WARNING: This deletes all documents, queue entries and cached OCR results!
         
         Returns:
             True if successful
@@ -518,6 +734,7 @@ class DocumentDatabase:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM processing_queue")
                 cursor.execute("DELETE FROM documents")
+                cursor.execute("DELETE FROM ocr_cache")
                 
                 logger.warning("⚠ Database cleared (all documents deleted)")
                 return True
@@ -75,11 +75,13 @@ class DocumentMetadata:
     
     # Content information
     text_length: int = 0
+    content_hash: Optional[str] = None
     language: Optional[str] = None
     
     # OCR information (if applicable)
     ocr_confidence: Optional[float] = None
     ocr_engine: Optional[str] = None
+    needs_review: bool = False
     
     # Processing information
     processing_duration: float = 0.0
@@ -96,9 +98,11 @@ class DocumentMetadata:
             "file_size": self.file_size,
             "mime_type": self.mime_type,
             "text_length": self.text_length,
+            "content_hash": self.content_hash,
             "language": self.language,
             "ocr_confidence": self.ocr_confidence,
             "ocr_engine": self.ocr_engine,
+            "needs_review": self.needs_review,
             "processing_duration": self.processing_duration,
             "stages_completed": self.stages_completed,
             "extra": self.extra,
@@ -113,9 +117,11 @@ class DocumentMetadata:
             file_size=data["file_size"],
             mime_type=data["mime_type"],
             text_length=data.get("text_length", 0),
+            content_hash=data.get("content_hash"),
             language=data.get("language"),
             ocr_confidence=data.get("ocr_confidence"),
             ocr_engine=data.get("ocr_engine"),
+            needs_review=data.get("needs_review", False),
             processing_duration=data.get("processing_duration", 0.0),
             stages_completed=data.get("stages_completed", []),
             extra=data.get("extra", {}),
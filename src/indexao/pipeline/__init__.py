@@ -1,5 +1,6 @@
 """Pipeline module - Document processing orchestration"""
 
 from indexao.pipeline.document_processor import DocumentProcessor
+from indexao.pipeline.jobs import JobStore, JobStatus
 
-__all__ = ["DocumentProcessor"]
+__all__ = ["DocumentProcessor", "JobStore", "JobStatus"]
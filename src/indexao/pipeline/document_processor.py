@@ -11,12 +11,37 @@ Flow:
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Pattern, Tuple
 from datetime import datetime
+import fnmatch
 import hashlib
+import re
 
 from indexao.adapters.ocr.base import OCRAdapter
 from indexao.adapters.search.base import SearchAdapter, IndexedDocument
+from indexao.upload_handler import file_checksum
+
+
+def compile_filter_pattern(filter_pattern: str) -> Pattern[str]:
+    """Compile un pattern glob (ex: "*.pdf") en regex sur le nom de fichier.
+    
+    À appeler une seule fois par requête : la regex est ensuite réutilisée
+    pour chaque fichier parcouru.
+    
+    Args:
+        filter_pattern: Pattern glob appliqué au nom de fichier
+        
+    Returns:
+        Regex compilée
+        
+    Raises:
+        ValueError: Si le pattern est vide ou contient un séparateur de chemin
+    """
+    if not filter_pattern or "/" in filter_pattern:
+        raise ValueError(
+            f"Pattern invalide: {filter_pattern!r} (doit porter sur le nom de fichier, ex: '*.pdf')"
+        )
+    return re.compile(fnmatch.translate(filter_pattern))
 
 
 class DocumentProcessor:
@@ -68,7 +93,8 @@ class DocumentProcessor:
         language: str = "fra+eng+chi_tra",
         recursive: bool = True,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
-        filter_pattern: Optional[str] = None
+        filter_pattern: Optional[str] = None,
+        pattern_re: Optional[Pattern[str]] = None
     ) -> Dict[str, Any]:
         """Traite tous les documents d'un répertoire.
         
@@ -77,7 +103,8 @@ class DocumentProcessor:
             language: Langue(s) pour OCR (ex: "fra+eng+chi_tra")
             recursive: Parcourir les sous-répertoires
             progress_callback: Fonction appelée avec progress updates
-            filter_pattern: Pattern glob (ex: "*.pdf")
+            filter_pattern: Pattern glob sur le nom de fichier (ex: "*.pdf")
+            pattern_re: Pattern déjà compilé (prioritaire sur filter_pattern)
             
         Returns:
             {
@@ -92,8 +119,36 @@ class DocumentProcessor:
         """
         start_time = datetime.now()
         
+        if pattern_re is None and filter_pattern:
+            pattern_re = compile_filter_pattern(filter_pattern)
+        
         # Collecter les fichiers
-        files = self._collect_files(directory, recursive, filter_pattern)
+        files = self._collect_files(directory, recursive, pattern_re)
+        
+        results = self.process_files(files, language=language, progress_callback=progress_callback)
+        
+        # Temps total (collecte incluse)
+        results["processing_time"] = (datetime.now() - start_time).total_seconds()
+        
+        return results
+    
+    def process_files(
+        self,
+        files: List[Path],
+        language: str = "fra+eng+chi_tra",
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """Traite une liste explicite de fichiers.
+        
+        Args:
+            files: Fichiers à traiter (dans l'ordre donné)
+            language: Langue(s) pour OCR (ex: "fra+eng+chi_tra")
+            progress_callback: Fonction appelée avec progress updates
+            
+        Returns:
+            Même structure que process_directory()
+        """
+        start_time = datetime.now()
         
         results = {
             "total": len(files),
@@ -106,17 +161,18 @@ class DocumentProcessor:
         }
         
         # Traiter chaque fichier
-        for i, file_path in enumerate(files, start=1):
+        for file_path in files:
             try:
-                # Vérifier si déjà indexé (skip si oui)
-                doc_id = self._generate_doc_id(file_path)
-                existing = self.search.get_document(doc_id)
+                # Déjà indexé avec le même contenu : ni OCR ni indexation
+                unchanged, content_hash = self.check_unchanged(file_path)
                 
-                if existing:
+                if unchanged:
                     results["skipped"] += 1
                 else:
                     # OCR + Indexation
-                    success = self.process_file(file_path, language=language)
+                    success = self.process_file(
+                        file_path, language=language, content_hash=content_hash
+                    )
                     
                     if success:
                         results["succeeded"] += 1
@@ -157,7 +213,8 @@ class DocumentProcessor:
         self,
         file_path: Path,
         language: str = "fra+eng+chi_tra",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None
     ) -> bool:
         """Traite un fichier unique.
         
@@ -165,6 +222,7 @@ class DocumentProcessor:
             file_path: Chemin du fichier
             language: Langue(s) pour OCR
             metadata: Métadonnées additionnelles
+            content_hash: Empreinte du contenu si déjà calculée (sinon calculée ici)
             
         Returns:
             True si succès, False sinon
@@ -185,8 +243,12 @@ class DocumentProcessor:
             # Déterminer la langue dominante (simple heuristique)
             detected_lang = self._detect_language(ocr_result.text, language)
             
+            if content_hash is None:
+                content_hash = self._compute_content_hash(file_path)
+            
             # Métadonnées enrichies
             doc_metadata = {
+                "content_hash": content_hash,
                 "file_size": file_path.stat().st_size,
                 "file_extension": file_path.suffix,
                 "ocr_confidence": ocr_result.confidence,
@@ -222,14 +284,14 @@ class DocumentProcessor:
         self,
         directory: Path,
         recursive: bool = True,
-        filter_pattern: Optional[str] = None
+        pattern_re: Optional[Pattern[str]] = None
     ) -> List[Path]:
         """Collecte les fichiers à traiter.
         
         Args:
             directory: Répertoire de base
             recursive: Parcourir sous-répertoires
-            filter_pattern: Pattern glob (ex: "*.pdf")
+            pattern_re: Regex compilée appliquée au nom de fichier (None = tous)
             
         Returns:
             Liste de chemins de fichiers
@@ -237,33 +299,38 @@ class DocumentProcessor:
         if not directory.exists() or not directory.is_dir():
             return []
         
-        files = []
+        all_files = directory.rglob("*") if recursive else directory.glob("*")
         
-        if filter_pattern:
-            # Utiliser le pattern glob
-            if recursive:
-                pattern_files = directory.rglob(filter_pattern)
-            else:
-                pattern_files = directory.glob(filter_pattern)
-            
-            files = [
-                f for f in pattern_files
-                if f.is_file() and f.suffix.lower() in self.supported_formats
-            ]
-        else:
-            # Tous les fichiers supportés
-            if recursive:
-                all_files = directory.rglob("*")
-            else:
-                all_files = directory.glob("*")
-            
-            files = [
-                f for f in all_files
-                if f.is_file() and f.suffix.lower() in self.supported_formats
-            ]
+        # Tests les moins coûteux d'abord : suffixe, puis regex, puis stat()
+        files = [
+            f for f in all_files
+            if f.suffix.lower() in self.supported_formats
+            and (pattern_re is None or pattern_re.match(f.name))
+            and f.is_file()
+        ]
         
         return sorted(files)
     
+    def check_unchanged(self, file_path: Path) -> Tuple[bool, str]:
+        """Vérifie si le fichier est déjà indexé avec le même contenu.
+        
+        Args:
+            file_path: Chemin du fichier
+            
+        Returns:
+            (inchangé, empreinte du contenu) - l'empreinte est à repasser à
+            process_file() pour ne pas relire le fichier
+        """
+        content_hash = self._compute_content_hash(file_path)
+        existing = self.search.get_document(self._generate_doc_id(file_path))
+        
+        unchanged = existing is not None and existing.metadata.get("content_hash") == content_hash
+        return unchanged, content_hash
+    
+    def _compute_content_hash(self, file_path: Path) -> str:
+        """Calcule l'empreinte SHA256 du contenu (même valeur que le checksum d'upload)."""
+        return file_checksum(file_path)
+    
     def _generate_doc_id(self, file_path: Path) -> str:
         """Génère un ID unique pour un fichier.
         
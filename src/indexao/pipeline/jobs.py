@@ -0,0 +1,140 @@
+"""Job Store - Suivi des traitements en arrière-plan
+
+Registre en mémoire des jobs lancés par l'API pipeline (ex: traitement
+d'un répertoire). Permet aux clients de suivre la progression via
+GET /api/pipeline/jobs/{job_id} au lieu de perdre le résultat.
+
+Le registre est borné : au-delà de `max_jobs`, les jobs terminés les plus
+anciens sont évincés en premier. Chaque changement d'état incrémente
+`revision`, ce qui permet de répondre 304 aux pollers dont l'état est à jour.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class JobStatus:
+    """Statuts possibles d'un job."""
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobStore:
+    """Registre thread-safe et borné des jobs du pipeline.
+
+    Les mises à jour arrivent depuis le threadpool (tâches de fond), la
+    lecture depuis la boucle d'événements : toutes les opérations passent
+    par un verrou et `get()` retourne une copie.
+
+    Exemple:
+        >>> store = JobStore(max_jobs=10)
+        >>> job_id = store.create(kind="directory", target="/data/docs")
+        >>> store.update(job_id, {"processed": 3, "total": 10})
+        >>> store.finish(job_id, {"succeeded": 10})
+        >>> store.get(job_id)["status"]
+        'completed'
+    """
+
+    def __init__(self, max_jobs: int = 100):
+        """Initialise le registre.
+
+        Args:
+            max_jobs: Nombre maximum de jobs conservés
+        """
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str, target: str) -> str:
+        """Enregistre un nouveau job.
+
+        Args:
+            kind: Type de job (ex: "directory")
+            target: Cible du job (ex: chemin du répertoire)
+
+        Returns:
+            Identifiant unique du job
+        """
+        job_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+
+        with self._lock:
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "kind": kind,
+                "target": target,
+                "status": JobStatus.RUNNING,
+                "created_at": now,
+                "updated_at": now,
+                "revision": 0,
+                "progress": {},
+                "results": None,
+                "error": None
+            }
+            self._evict()
+
+        return job_id
+
+    def update(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """Met à jour la progression d'un job (ignoré si le job a été évincé)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job["progress"] = dict(progress)
+            self._touch(job)
+
+    def finish(self, job_id: str, results: Dict[str, Any]) -> None:
+        """Marque un job comme terminé avec ses résultats."""
+        self._close(job_id, JobStatus.COMPLETED, results=results)
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Marque un job comme échoué."""
+        self._close(job_id, JobStatus.FAILED, error=error)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retourne une copie de l'état du job, ou None si inconnu."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return deepcopy(job) if job is not None else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def _close(
+        self,
+        job_id: str,
+        status: str,
+        results: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job["status"] = status
+            job["results"] = results
+            job["error"] = error
+            self._touch(job)
+
+    @staticmethod
+    def _touch(job: Dict[str, Any]) -> None:
+        """Incrémente la révision (sert d'ETag aux clients qui interrogent)."""
+        job["revision"] += 1
+        job["updated_at"] = datetime.now().isoformat()
+
+    def _evict(self) -> None:
+        """Évince les jobs en excès (appelé sous verrou)."""
+        while len(self._jobs) > self.max_jobs:
+            # Priorité aux jobs terminés, puis au plus ancien
+            victim = next(
+                (jid for jid, job in self._jobs.items() if job["status"] != JobStatus.RUNNING),
+                next(iter(self._jobs))
+            )
+            del self._jobs[victim]
@@ -3,124 +3,445 @@
 Endpoints pour traiter des documents via le pipeline OCR → Search.
 """
 
+import asyncio
+import os
+import stat
+import threading
+import time
 from pathlib import Path
-from typing import Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict, StringConstraints
 
 from indexao.adapters.ocr import TesseractOCR, MockOCRAdapter
-from indexao.adapters.search import MeilisearchAdapter, MockSearchAdapter
-from indexao.pipeline import DocumentProcessor
+from indexao.adapters.search import MeilisearchAdapter, MockSearchAdapter, get_shared_client
+from indexao.config import get_config
+from indexao.pipeline import DocumentProcessor, JobStore
+from indexao.pipeline.document_processor import compile_filter_pattern
+from indexao.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Réponses des endpoints interrogés en boucle (stats, jobs) : orjson si dispo
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 
 
 router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
 
 
-# Global processor instance (initialized on startup)
-_processor: Optional[DocumentProcessor] = None
+DEFAULT_LANGUAGE = "fra+eng+chi_tra"
+
+# Nombre max de jobs (répertoire ou batch) simultanés (OCR = CPU + mémoire)
+MAX_BACKGROUND_JOBS = 2
+JOB_RETRY_AFTER_SECONDS = 30
+
+# Nombre max de fichiers acceptés par /process/batch
+MAX_BATCH_FILES = 10000
+
+# Durée de validité des statistiques (les dashboards interrogent en boucle)
+STATS_TTL_SECONDS = 2.0
+
+# Processeurs déjà construits (un par mode réel/mock), protégés par un verrou
+_processors: Dict[bool, DocumentProcessor] = {}
+_init_lock = threading.Lock()
+
+# Registre des jobs en arrière-plan (progression consultable via /jobs/{id})
+_job_store = JobStore(max_jobs=100)
+
+# Slots des jobs : réservés sans attendre par le handler (429 sinon), puis
+# rendus par la tâche de fond à la fin du job
+_job_slots = threading.BoundedSemaphore(MAX_BACKGROUND_JOBS)
+
+# Cache des statistiques : (processeur, timestamp monotonic, stats)
+_stats_cache: Optional[Tuple[DocumentProcessor, float, Dict[str, Any]]] = None
+_stats_lock = asyncio.Lock()
+
 
+# Chemin non vide et de longueur raisonnable (rejeté avant toute allocation de Path)
+PathStr = Annotated[str, StringConstraints(min_length=1, max_length=4096)]
 
-class ProcessDirectoryRequest(BaseModel):
+
+class PipelineRequest(BaseModel):
+    """Base des requêtes pipeline : immuables, champs inconnus refusés"""
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
+
+class ProcessDirectoryRequest(PipelineRequest):
     """Requête pour traiter un répertoire"""
-    directory: str
-    language: str = "fra+eng+chi_tra"
+    directory: PathStr
+    language: str = DEFAULT_LANGUAGE
     recursive: bool = True
     filter_pattern: Optional[str] = None
 
 
-class ProcessFileRequest(BaseModel):
+class ProcessFileRequest(PipelineRequest):
     """Requête pour traiter un fichier unique"""
-    file_path: str
-    language: str = "fra+eng+chi_tra"
+    file_path: PathStr
+    language: str = DEFAULT_LANGUAGE
 
 
-def initialize_processor(use_real_adapters: bool = True):
-    """Initialise le processeur global.
+class ProcessBatchRequest(PipelineRequest):
+    """Requête pour traiter une liste explicite de fichiers"""
+    files: List[PathStr]
+    language: str = DEFAULT_LANGUAGE
+
+
+def initialize_processor(use_real_adapters: bool = True) -> DocumentProcessor:
+    """Retourne le processeur du pipeline, construit au premier appel.
+    
+    Appelé au démarrage de l'application (lifespan), qui le range dans
+    `app.state.pipeline_processor` pour les handlers via get_processor().
+    Idempotent et thread-safe : les appels suivants (autre app, fixture de
+    test) réutilisent la même instance au lieu de recharger Tesseract et
+    de reconfigurer l'index Meilisearch.
     
     Args:
         use_real_adapters: True = Tesseract + Meilisearch, False = Mocks
+    
+    Returns:
+        DocumentProcessor prêt à l'emploi
     """
-    global _processor
+    processor = _processors.get(use_real_adapters)
+    if processor is not None:
+        return processor
+    
+    with _init_lock:
+        # Double vérification : un autre thread a pu construire entre-temps
+        processor = _processors.get(use_real_adapters)
+        if processor is None:
+            processor = _build_processor(use_real_adapters)
+            _processors[use_real_adapters] = processor
     
+    return processor
+
+
+def _build_processor(use_real_adapters: bool) -> DocumentProcessor:
+    """Construit un processeur (appelé sous _init_lock)."""
     if use_real_adapters:
         ocr = TesseractOCR()
-        search = MeilisearchAdapter(index_name="indexao_documents")
+        # Charger les packs de langue une fois au démarrage plutôt qu'au
+        # premier document traité
+        missing = ocr.warmup(DEFAULT_LANGUAGE)
+        if missing:
+            logger.warning(f"Packs de langue Tesseract manquants: {', '.join(missing)}")
+        # Même serveur et même client que l'API de recherche (search_routes)
+        search_config = get_config().plugins.search
+        host = f"http://{search_config.host}:{search_config.port}"
+        search = MeilisearchAdapter(
+            host=host,
+            index_name="indexao_documents",
+            client=get_shared_client(host, search_config.api_key)
+        )
     else:
         ocr = MockOCRAdapter()
         search = MockSearchAdapter()
     
-    _processor = DocumentProcessor(ocr_adapter=ocr, search_adapter=search)
+    return DocumentProcessor(ocr_adapter=ocr, search_adapter=search)
 
 
-@router.get("/status")
-async def get_pipeline_status():
-    """Vérifie le statut du pipeline."""
-    if _processor is None:
+def get_processor(request: Request) -> DocumentProcessor:
+    """Dépendance FastAPI : processeur du pipeline de l'application.
+    
+    Raises:
+        HTTPException: 503 si le pipeline n'a pas pu être initialisé au démarrage
+    """
+    processor = getattr(request.app.state, "pipeline_processor", None)
+    if processor is None:
         raise HTTPException(status_code=503, detail="Pipeline non initialisé")
+    return processor
+
+
+async def _get_cached_statistics(processor: DocumentProcessor) -> Dict[str, Any]:
+    """Retourne les statistiques, recalculées au plus une fois par STATS_TTL_SECONDS.
+    
+    Les requêtes concurrentes sur un cache expiré attendent le même calcul
+    (un seul aller-retour Meilisearch) au lieu de le relancer chacune.
+    """
+    global _stats_cache
     
-    stats = _processor.get_statistics()
+    cached = _stats_cache
+    if _is_fresh(cached, processor):
+        return cached[2]
+    
+    async with _stats_lock:
+        # Un autre appel a pu rafraîchir le cache pendant l'attente du verrou
+        cached = _stats_cache
+        if _is_fresh(cached, processor):
+            return cached[2]
+        
+        # get_statistics() fait des appels HTTP Meilisearch bloquants
+        stats = await run_in_threadpool(processor.get_statistics)
+        _stats_cache = (processor, time.monotonic(), stats)
+        return stats
+
+
+def _is_fresh(
+    cached: Optional[Tuple[DocumentProcessor, float, Dict[str, Any]]],
+    processor: DocumentProcessor
+) -> bool:
+    """Vrai si le cache concerne ce processeur et n'a pas expiré."""
+    return (
+        cached is not None
+        and cached[0] is processor
+        and time.monotonic() - cached[1] < STATS_TTL_SECONDS
+    )
+
+
+@router.get("/status", response_class=FastJSONResponse)
+async def get_pipeline_status(processor: DocumentProcessor = Depends(get_processor)):
+    """Vérifie le statut du pipeline."""
+    stats = await _get_cached_statistics(processor)
     
     return {
         "status": "ready",
-        "ocr_engine": _processor.ocr.name,
-        "search_backend": _processor.search.name,
+        "ocr_engine": processor.ocr.name,
+        "search_backend": processor.search.name,
         "statistics": stats
     }
 
 
-@router.post("/process/directory")
+@router.post("/process/directory", status_code=202)
 async def process_directory(
     request: ProcessDirectoryRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    response: Response,
+    processor: DocumentProcessor = Depends(get_processor)
 ):
     """Traite tous les documents d'un répertoire.
     
-    Process en background avec callback de progression.
+    Process en background avec callback de progression. Répond 202 avec
+    un en-tête Location vers /jobs/{job_id} pour suivre l'avancement.
     """
-    if _processor is None:
-        raise HTTPException(status_code=503, detail="Pipeline non initialisé")
-    
+    _stat_or_404(request.directory, stat.S_ISDIR, "Répertoire introuvable")
     directory = Path(request.directory)
     
-    if not directory.exists() or not directory.is_dir():
-        raise HTTPException(status_code=404, detail=f"Répertoire introuvable: {request.directory}")
+    # Valider et compiler le pattern une seule fois, avant de lancer le job
+    pattern_re = None
+    if request.filter_pattern:
+        try:
+            pattern_re = compile_filter_pattern(request.filter_pattern)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
     
-    # Fonction de traitement en background
-    def process_in_background():
-        results = _processor.process_directory(
+    job_id = _schedule_job(
+        background_tasks,
+        kind="directory",
+        target=str(directory),
+        run=lambda progress_callback: processor.process_directory(
             directory=directory,
             language=request.language,
             recursive=request.recursive,
-            filter_pattern=request.filter_pattern
+            progress_callback=progress_callback,
+            pattern_re=pattern_re
         )
-        # TODO: Sauvegarder les résultats ou notifier via WebSocket
-        print(f"Traitement terminé: {results}")
+    )
     
-    # Lancer en background
-    background_tasks.add_task(process_in_background)
+    response.headers["Location"] = _job_location(job_id)
     
     return {
         "status": "processing",
         "message": f"Traitement de {request.directory} lancé en arrière-plan",
-        "directory": str(directory)
+        "directory": str(directory),
+        "job_id": job_id
     }
 
 
+@router.post("/process/batch", status_code=202)
+async def process_batch(
+    request: ProcessBatchRequest,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    processor: DocumentProcessor = Depends(get_processor)
+):
+    """Traite une liste de fichiers en un seul job.
+    
+    Évite N appels à /process/file quand le client connaît déjà les fichiers.
+    Répond 202 avec un en-tête Location vers /jobs/{job_id}.
+    """
+    if not request.files:
+        raise HTTPException(status_code=422, detail="Liste de fichiers vide")
+    
+    if len(request.files) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Trop de fichiers ({len(request.files)}), max {MAX_BATCH_FILES} par batch"
+        )
+    
+    # Valider tous les chemins avant de lancer quoi que ce soit
+    # (jusqu'à MAX_BATCH_FILES stat() : hors de la boucle d'événements)
+    files = [Path(f) for f in request.files]
+    missing = await run_in_threadpool(lambda: [str(f) for f in files if not f.is_file()])
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail={"message": "Fichiers introuvables", "files": missing[:50]}
+        )
+    
+    job_id = _schedule_job(
+        background_tasks,
+        kind="batch",
+        target=f"{len(files)} fichiers",
+        run=lambda progress_callback: processor.process_files(
+            files,
+            language=request.language,
+            progress_callback=progress_callback
+        )
+    )
+    
+    response.headers["Location"] = _job_location(job_id)
+    
+    return {
+        "status": "processing",
+        "message": f"Traitement de {len(files)} fichiers lancé en arrière-plan",
+        "count": len(files),
+        "job_id": job_id
+    }
+
+
+def _stat_or_404(
+    path: str,
+    is_kind: Callable[[int], bool],
+    not_found_detail: str
+) -> os.stat_result:
+    """Valide un chemin avec un seul stat() (au lieu de exists() + is_dir()/is_file()).
+    
+    Args:
+        path: Chemin à valider
+        is_kind: stat.S_ISDIR ou stat.S_ISREG
+        not_found_detail: Message d'erreur 404
+        
+    Returns:
+        Résultat de os.stat (réutilisable par l'appelant)
+        
+    Raises:
+        HTTPException: 404 si absent, inaccessible ou du mauvais type
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        raise HTTPException(status_code=404, detail=f"{not_found_detail}: {path}")
+    
+    if not is_kind(st.st_mode):
+        raise HTTPException(status_code=404, detail=f"{not_found_detail}: {path}")
+    
+    return st
+
+
+def _schedule_job(
+    background_tasks: BackgroundTasks,
+    kind: str,
+    target: str,
+    run: Callable[[Callable[[Dict[str, Any]], None]], Dict[str, Any]]
+) -> str:
+    """Enregistre le job et le lance en arrière-plan si un slot est libre.
+    
+    Args:
+        background_tasks: Tâches de fond FastAPI de la requête
+        kind: Type de job ("directory", "batch")
+        target: Description de la cible (affichée dans /jobs/{id})
+        run: Traitement à exécuter, reçoit le callback de progression
+        
+    Returns:
+        Identifiant du job
+        
+    Raises:
+        HTTPException: 429 si tous les slots sont occupés
+    """
+    # Refuser plutôt que d'empiler : chaque job garde OCR et résultats en mémoire.
+    # Réservation atomique et non bloquante : aucun thread n'attend un slot
+    if not _job_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=429,
+            detail=f"Trop de traitements en cours (max {MAX_BACKGROUND_JOBS}), réessayez plus tard",
+            headers={"Retry-After": str(JOB_RETRY_AFTER_SECONDS)}
+        )
+    
+    # Fonction de traitement en background (propriétaire du slot réservé)
+    def process_in_background():
+        try:
+            results = run(lambda progress: _job_store.update(job_id, progress))
+            _job_store.finish(job_id, results)
+        except Exception as e:
+            _job_store.fail(job_id, str(e))
+        finally:
+            _job_slots.release()
+    
+    try:
+        job_id = _job_store.create(kind=kind, target=target)
+        
+        # Lancer en background (fonction sync : Starlette l'exécute dans le threadpool)
+        background_tasks.add_task(process_in_background)
+    except BaseException:
+        # La tâche ne sera jamais lancée : rendre le slot ici
+        _job_slots.release()
+        raise
+    
+    return job_id
+
+
+@router.get("/jobs/{job_id}", response_class=FastJSONResponse)
+async def get_job(job_id: str, request: Request):
+    """Récupère l'état et la progression d'un job en arrière-plan.
+    
+    Renvoie un ETag basé sur la révision du job : un client qui repasse
+    If-None-Match reçoit 304 tant que rien n'a changé.
+    """
+    job = _job_store.get(job_id)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job introuvable: {job_id}")
+    
+    etag = f'W/"{job_id}-{job["revision"]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return FastJSONResponse(content=job, headers={"ETag": etag})
+
+
+def _job_location(job_id: str) -> str:
+    """URL de suivi d'un job (en-tête Location des réponses 202)."""
+    return f"{router.prefix}/jobs/{job_id}"
+
+
 @router.post("/process/file")
-async def process_file(request: ProcessFileRequest):
+async def process_file(
+    request: ProcessFileRequest,
+    processor: DocumentProcessor = Depends(get_processor)
+):
     """Traite un fichier unique."""
-    if _processor is None:
-        raise HTTPException(status_code=503, detail="Pipeline non initialisé")
-    
+    _stat_or_404(request.file_path, stat.S_ISREG, "Fichier introuvable")
     file_path = Path(request.file_path)
     
-    if not file_path.exists() or not file_path.is_file():
-        raise HTTPException(status_code=404, detail=f"Fichier introuvable: {request.file_path}")
+    def process_if_changed() -> Optional[bool]:
+        # Contenu identique à la version indexée : ni OCR ni indexation
+        unchanged, content_hash = processor.check_unchanged(file_path)
+        if unchanged:
+            return None
+        return processor.process_file(
+            file_path, language=request.language, content_hash=content_hash
+        )
     
-    # Traiter le fichier
-    success = _processor.process_file(file_path, language=request.language)
+    # Traiter le fichier hors de la boucle d'événements (OCR + indexation
+    # bloquants) pour que /status et /statistics restent réactifs
+    success = await run_in_threadpool(process_if_changed)
     
-    if success:
+    if success is None:
+        return {
+            "status": "skipped",
+            "reason": "unchanged",
+            "message": f"Fichier {file_path.name} déjà indexé (contenu inchangé)",
+            "file": str(file_path)
+        }
+    elif success:
         return {
             "status": "success",
             "message": f"Fichier {file_path.name} traité et indexé",
@@ -130,10 +451,7 @@ async def process_file(request: ProcessFileRequest):
         raise HTTPException(status_code=500, detail="Échec du traitement")
 
 
-@router.get("/statistics")
-async def get_statistics():
+@router.get("/statistics", response_class=FastJSONResponse)
+async def get_statistics(processor: DocumentProcessor = Depends(get_processor)):
     """Récupère les statistiques de l'index."""
-    if _processor is None:
-        raise HTTPException(status_code=503, detail="Pipeline non initialisé")
-    
-    return _processor.get_statistics()
+    return await _get_cached_statistics(processor)
@@ -28,31 +28,125 @@ Usage:
 import logging
 import inspect
 import importlib
+import importlib.util
 import os
 import pkgutil
 import ast
+import re
+import time
+import tomllib
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional, Type, Protocol, get_type_hints, get_args, List
+from types import MappingProxyType
+from typing import Deque, Dict, Any, FrozenSet, KeysView, Mapping, Optional, Tuple, Type, Protocol, get_type_hints, get_args, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
-# Import protocols for validation
-try:
-    from indexao.adapters.ocr.base import OCRAdapter
-    from indexao.adapters.translator.base import TranslatorAdapter
-    from indexao.adapters.search.base import SearchAdapter
-    PROTOCOLS_AVAILABLE = True
-except ImportError:
-    logger.warning("Adapter protocols not available, validation disabled")
-    PROTOCOLS_AVAILABLE = False
-    OCRAdapter = None
-    TranslatorAdapter = None
-    SearchAdapter = None
+# Types d'adapters gérés (ordre d'affichage)
+ADAPTER_TYPES: Tuple[str, ...] = ('ocr', 'translator', 'search')
 
+# Nombre maximum d'entrées conservées dans l'historique des switches
+MAX_SWITCH_HISTORY = 1000
 
-@dataclass
+# Durée (secondes) pendant laquelle un échec de chargement est mémorisé,
+# pour ne pas retenter un import voué à l'échec à chaque requête
+LOAD_FAILURE_TTL = 30.0
+
+# Découverte parallèle (lecture + AST) à partir de ce nombre de fichiers ;
+# en dessous, le coût des threads dépasse le gain
+PARALLEL_DISCOVERY_MIN_FILES = 8
+DISCOVERY_MAX_WORKERS = 4
+
+# Registre vide partagé (types inconnus), jamais modifié
+_EMPTY_REGISTRY: Mapping[str, Type] = MappingProxyType({})
+
+# Protocols de validation, importés à la demande (voir _load_protocol)
+_PROTOCOL_PATHS: Dict[str, str] = {
+    'ocr': 'indexao.adapters.ocr.base:OCRAdapter',
+    'translator': 'indexao.adapters.translator.base:TranslatorAdapter',
+    'search': 'indexao.adapters.search.base:SearchAdapter'
+}
+
+
+# Protocols déjà résolus (None = indisponible) : {type: Protocol}
+_PROTOCOL_MAP: Dict[str, Optional[Type]] = {}
+
+
+def _load_protocol(adapter_type: str) -> Optional[Type]:
+    """
+    Import the Protocol class for an adapter type on first use
+    
+    Returns:
+        Protocol class or None if unknown type / not importable
+    """
+    try:
+        return _PROTOCOL_MAP[adapter_type]
+    except KeyError:
+        pass
+    
+    protocol = None
+    path = _PROTOCOL_PATHS.get(adapter_type)
+    if path is not None:
+        module_name, class_name = path.split(':')
+        try:
+            protocol = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            logger.warning(f"Adapter protocol for {adapter_type} not available, validation disabled")
+    
+    _PROTOCOL_MAP[adapter_type] = protocol
+    return protocol
+
+
+@lru_cache(maxsize=256)
+def _signature_param_count(init: Any) -> Optional[int]:
+    """
+    Count __init__ parameters with inspect.signature (C-implemented __init__)
+    
+    Cached per callable: classes without their own __init__ share
+    object.__init__, so the signature is built once.
+    
+    Returns:
+        Number of parameters, or None if no signature is available
+    """
+    try:
+        return len(inspect.signature(init).parameters)
+    except (TypeError, ValueError):
+        return None
+
+
+# Méthodes/propriétés requises par type d'adapter (constantes, vérifiées
+# en une seule différence d'ensembles contre dir(adapter_class))
+_REQUIRED_METHODS: Dict[str, FrozenSet[str]] = {
+    'ocr': frozenset({'name', 'supported_languages', 'process_image'}),
+    'translator': frozenset({'name', 'supported_languages', 'translate', 'translate_batch'}),
+    'search': frozenset({'name', 'index_document', 'index_batch', 'search', 'delete_document'})
+}
+
+# Suffixes des classes candidates lors du chargement dynamique
+_ADAPTER_CLASS_SUFFIXES = ('Adapter', 'OCR', 'Translator')
+
+# Nom de plugin dérivé du nom de classe : suffixes retirés (dans l'ordre où
+# ils peuvent s'empiler, ex: FooEngineAdapter), puis CamelCase -> kebab-case
+_PLUGIN_SUFFIX_RE = re.compile(r'(?:Engine)?(?:Backend)?(?:Search)?(?:Translator)?(?:OCR)?(?:Adapter)?$')
+_CAMEL_BOUNDARY_RE = re.compile(r'(?<=[a-z])(?=[A-Z])')
+
+# Préfiltre de découverte : un fichier sans classe "...Adapter" n'est pas parsé
+_ADAPTER_CLASS_RE = re.compile(rb'^class\s+\w+Adapter\b', re.MULTILINE)
+
+# Classes déjà validées par type : une ré-enregistrement (fixtures de tests,
+# hot-swap) ne revalide pas. Références faibles pour ne pas retenir les classes.
+_VALIDATED_CLASSES: Dict[str, "weakref.WeakSet[type]"] = {
+    adapter_type: weakref.WeakSet() for adapter_type in _REQUIRED_METHODS
+}
+
+
+@dataclass(slots=True)
 class PluginMetadata:
     """Métadonnées d'un plugin"""
     name: str
@@ -64,6 +158,16 @@ class PluginMetadata:
     priority: int = 0
 
 
+@dataclass(slots=True)
+class _TypeState:
+    """État du gestionnaire pour un type d'adapter ('ocr', 'translator', 'search')"""
+    registry: Dict[str, Type] = field(default_factory=dict)       # nom -> classe
+    # nom -> instance (singleton) ; références faibles : seul `active` garde
+    # l'adapter courant en vie, les adapters quittés sont libérés par le GC
+    instances: "weakref.WeakValueDictionary[str, Any]" = field(default_factory=weakref.WeakValueDictionary)
+    active: Optional[Any] = None                                  # instance active (référence forte)
+
+
 class PluginManagerError(Exception):
     """Erreur de gestion de plugin"""
     pass
@@ -90,6 +194,18 @@ class PluginManager:
     - (Future) Auto-découvrir et charger dynamiquement les plugins
     """
     
+    __slots__ = (
+        '_config',
+        '_state',
+        '_switch_history',
+        '_discovery_cache',
+        '_config_cache',
+        '_active_names',
+        '_active_view',
+        '_load_failures',
+        '__weakref__'
+    )
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialiser le gestionnaire de plugins
@@ -98,25 +214,49 @@ class PluginManager:
             config: Configuration complète (from config.toml)
         """
         self._config = config or {}
-        self._registry: Dict[str, Dict[str, Any]] = {
-            'ocr': {},
-            'translator': {},
-            'search': {}
-        }
-        self._active: Dict[str, Optional[Any]] = {
-            'ocr': None,
-            'translator': None,
-            'search': None
-        }
-        self._instances: Dict[str, Dict[str, Any]] = {
-            'ocr': {},
-            'translator': {},
-            'search': {}
+        # Registre, instances (références faibles) et adapter actif, regroupés par type
+        self._state: Dict[str, _TypeState] = {
+            adapter_type: _TypeState() for adapter_type in ADAPTER_TYPES
         }
+        # Noms des adapters actifs, mis à jour au switch ; list_active() en
+        # expose une vue en lecture seule (aucune reconstruction par requête)
+        self._active_names: Dict[str, Optional[str]] = dict.fromkeys(ADAPTER_TYPES)
+        self._active_view: Mapping[str, Optional[str]] = MappingProxyType(self._active_names)
+        # Échecs de chargement récents: {(type, nom): instant de l'échec (monotonic)}
+        self._load_failures: Dict[Tuple[str, str], float] = {}
+        # Historique des switches, borné (serveurs longue durée)
+        self._switch_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self._config.get('max_switch_history', MAX_SWITCH_HISTORY)
+        )
+        # Découverte: {chemin: (mtime_ns, metadata)} - évite de re-parser les fichiers inchangés
+        self._discovery_cache: Dict[str, Tuple[int, Optional[PluginMetadata]]] = {}
+        # Config par adapter: {(type, nom): config en lecture seule}
+        self._config_cache: Dict[Tuple[str, str], Mapping[str, Any]] = {}
         
         if not os.getenv('INDEXAO_SUPPRESS_LOGS', '').lower() == '1':
             logger.info("Plugin Manager initialized")
     
+    @classmethod
+    def from_toml_path(cls, path: Path) -> "PluginManager":
+        """
+        Créer un gestionnaire depuis un fichier TOML (parser stdlib tomllib)
+        
+        Le fichier est lu tel quel : ni expansion des variables de chemin ni
+        surcharges d'environnement (voir indexao.config.load_config pour la
+        configuration complète de l'application).
+        
+        Args:
+            path: Chemin du fichier TOML
+        
+        Returns:
+            PluginManager initialisé avec le contenu du fichier
+        
+        Example:
+            >>> manager = PluginManager.from_toml_path(Path("config.toml"))
+        """
+        with open(path, 'rb') as f:
+            return cls(config=tomllib.load(f))
+    
     def _get_protocol_for_type(self, adapter_type: str) -> Optional[Type]:
         """
         Get Protocol class for adapter type
@@ -127,15 +267,7 @@ class PluginManager:
         Returns:
             Protocol class or None if not available
         """
-        if not PROTOCOLS_AVAILABLE:
-            return None
-        
-        protocols = {
-            'ocr': OCRAdapter,
-            'translator': TranslatorAdapter,
-            'search': SearchAdapter
-        }
-        return protocols.get(adapter_type)
+        return _load_protocol(adapter_type)
     
     def _validate_protocol(self, adapter_class: Type, adapter_type: str) -> bool:
         """
@@ -155,51 +287,51 @@ class PluginManager:
             >>> self._validate_protocol(TesseractOCR, 'ocr')
             True
         """
-        protocol = self._get_protocol_for_type(adapter_type)
+        validated = _VALIDATED_CLASSES.get(adapter_type)
+        if validated is not None and adapter_class in validated:
+            return True
         
-        if protocol is None:
-            logger.warning(f"Protocol validation skipped for {adapter_type} (not available)")
+        if _load_protocol(adapter_type) is None:
+            logger.warning("Protocol validation skipped for %s (not available)", adapter_type)
             return True
         
-        # Get protocol required methods
-        protocol_methods = {
-            'ocr': ['name', 'supported_languages', 'process_image'],
-            'translator': ['name', 'supported_languages', 'translate', 'translate_batch'],
-            'search': ['name', 'index_document', 'index_batch', 'search', 'delete_document']
-        }
+        # Pas d'issubclass(adapter_class, protocol) : les protocols sont
+        # @runtime_checkable mais déclarent des propriétés (name,
+        # supported_languages), ce que issubclass() refuse (TypeError).
+        required_methods = _REQUIRED_METHODS.get(adapter_type, frozenset())
+        missing_methods = required_methods - set(dir(adapter_class))
         
-        required_methods = protocol_methods.get(adapter_type, [])
+        if missing_methods:
+            raise PluginValidationError(
+                f"{adapter_class.__name__} missing required methods: {', '.join(sorted(missing_methods))}\n"
+                f"Required for {adapter_type}: {', '.join(sorted(required_methods))}"
+            )
         
-        # Check each required method/property
-        missing_methods = []
-        for method_name in required_methods:
-            if not hasattr(adapter_class, method_name):
-                missing_methods.append(method_name)
+        # Validate method signatures (basic check): __init__ must at least take 'self'.
+        # Lecture directe de __code__ ; inspect.signature seulement pour les
+        # __init__ implémentés en C (pas de __code__)
+        init = adapter_class.__init__
+        code = getattr(init, '__code__', None)
+        if code is not None:
+            nparams = code.co_argcount + code.co_kwonlyargcount + bool(code.co_flags & inspect.CO_VARARGS)
+        else:
+            nparams = _signature_param_count(init)
+            if nparams is None:
+                logger.warning("Could not validate %s signature", adapter_class.__name__)
+                nparams = 1
         
-        if missing_methods:
+        if nparams < 1:
             raise PluginValidationError(
-                f"{adapter_class.__name__} missing required methods: {', '.join(missing_methods)}\n"
-                f"Required for {adapter_type}: {', '.join(required_methods)}"
+                f"{adapter_class.__name__}.__init__ must accept parameters"
             )
         
-        # Validate method signatures (basic check)
-        try:
-            # Check if class has __init__ that accepts config
-            init_sig = inspect.signature(adapter_class.__init__)
-            params = list(init_sig.parameters.keys())
-            
-            # Must have 'self' and optionally 'config' or **kwargs
-            if len(params) < 1:
-                raise PluginValidationError(
-                    f"{adapter_class.__name__}.__init__ must accept parameters"
-                )
-        except Exception as e:
-            logger.warning(f"Could not validate {adapter_class.__name__} signature: {e}")
+        if validated is not None:
+            validated.add(adapter_class)
         
-        logger.debug(f"Protocol validation passed for {adapter_class.__name__}")
+        logger.debug("Protocol validation passed for %s", adapter_class.__name__)
         return True
     
-    def get_adapter_config(self, adapter_type: str, adapter_name: str) -> Dict[str, Any]:
+    def get_adapter_config(self, adapter_type: str, adapter_name: str) -> Mapping[str, Any]:
         """
         Récupérer la configuration d'un adapter spécifique
         
@@ -208,7 +340,8 @@ class PluginManager:
             adapter_name: Nom de l'adapter ('mock', 'tesseract', 'argos', etc.)
         
         Returns:
-            Configuration de l'adapter (merged: global + specific)
+            Configuration de l'adapter (merged: global + specific), en lecture
+            seule et mise en cache (voir invalidate_config_cache)
         
         Raises:
             PluginManagerError: Si configuration invalide
@@ -218,7 +351,12 @@ class PluginManager:
             >>> ocr_config = manager.get_adapter_config('ocr', 'tesseract')
             >>> print(ocr_config['languages'])  # ['en', 'fr']
         """
-        if adapter_type not in ['ocr', 'translator', 'search']:
+        # Le cache ne contient que des types valides : vérification sur miss uniquement
+        cached = self._config_cache.get((adapter_type, adapter_name))
+        if cached is not None:
+            return cached
+        
+        if adapter_type not in ADAPTER_TYPES:
             raise PluginManagerError(f"Invalid adapter type: {adapter_type}")
         
         # Structure attendue dans config.toml:
@@ -232,11 +370,33 @@ class PluginManager:
         adapter_config = type_config.get(adapter_name, {})
         
         if not adapter_config:
-            logger.warning(f"No config found for {adapter_type}.{adapter_name}, using defaults")
-            return {}
+            logger.warning("No config found for %s.%s, using defaults", adapter_type, adapter_name)
+        else:
+            logger.debug("Loaded config for %s.%s: %d keys", adapter_type, adapter_name, len(adapter_config))
+        
+        # Copie en lecture seule : les appelants ne peuvent pas altérer le cache
+        config = MappingProxyType(dict(adapter_config))
+        self._config_cache[(adapter_type, adapter_name)] = config
+        return config
+    
+    def invalidate_config_cache(self) -> None:
+        """
+        Vider le cache de get_adapter_config (après modification de la config)
+        """
+        self._config_cache.clear()
+    
+    def update_config(self, config: Dict[str, Any]) -> None:
+        """
+        Remplacer la configuration (ex: config.toml rechargé)
+        
+        Les instances déjà créées sont conservées ; seules les prochaines
+        instanciations voient la nouvelle configuration.
         
-        logger.debug(f"Loaded config for {adapter_type}.{adapter_name}: {len(adapter_config)} keys")
-        return dict(adapter_config)  # Return copy
+        Args:
+            config: Configuration complète (from config.toml)
+        """
+        self._config = config or {}
+        self.invalidate_config_cache()
     
     def register(self, adapter_type: str, adapter_name: str, adapter_class: Type, validate: bool = True) -> None:
         """
@@ -256,17 +416,24 @@ class PluginManager:
             >>> from indexao.adapters.mock_ocr import MockOCR
             >>> manager.register('ocr', 'mock', MockOCR)
         """
-        if adapter_type not in self._registry:
+        state = self._state.get(adapter_type)
+        if state is None:
             raise PluginManagerError(f"Invalid adapter type: {adapter_type}")
         
         # Validate protocol before registration
         if validate:
             self._validate_protocol(adapter_class, adapter_type)
         
-        self._registry[adapter_type][adapter_name] = adapter_class
-        logger.info(f"Registered {adapter_type}.{adapter_name} -> {adapter_class.__name__}")
+        # Une instance construite depuis une autre classe n'est plus valide
+        previous_class = state.registry.get(adapter_name)
+        if previous_class is not None and previous_class is not adapter_class:
+            state.instances.pop(adapter_name, None)
+        
+        state.registry[adapter_name] = adapter_class
+        self._load_failures.pop((adapter_type, adapter_name), None)
+        logger.info("Registered %s.%s -> %s", adapter_type, adapter_name, adapter_class.__name__)
     
-    def get_registered(self, adapter_type: str) -> Dict[str, Type]:
+    def get_registered(self, adapter_type: str) -> Mapping[str, Type]:
         """
         Lister les adapters enregistrés d'un type
         
@@ -274,13 +441,14 @@ class PluginManager:
             adapter_type: Type d'adapter
         
         Returns:
-            Dictionnaire {name: class}
+            Vue en lecture seule {name: class} (reflète les enregistrements futurs)
         
         Example:
             >>> ocr_adapters = manager.get_registered('ocr')
             >>> print(ocr_adapters.keys())  # dict_keys(['mock', 'tesseract'])
         """
-        return dict(self._registry.get(adapter_type, {}))
+        state = self._state.get(adapter_type)
+        return MappingProxyType(state.registry if state is not None else _EMPTY_REGISTRY)
     
     def switch(self, adapter_type: str, adapter_name: str) -> None:
         """
@@ -300,79 +468,95 @@ class PluginManager:
             >>> manager.switch('ocr', 'tesseract')  # mock → tesseract
             >>> manager.switch('ocr', 'mock')       # tesseract → mock (calls tesseract.close())
         """
-        if adapter_type not in self._registry:
+        state = self._state.get(adapter_type)
+        if state is None:
             raise PluginManagerError(f"Invalid adapter type: {adapter_type}")
         
-        if adapter_name not in self._registry[adapter_type]:
-            available = list(self._registry[adapter_type].keys())
+        try:
+            adapter_class = state.registry[adapter_name]
+        except KeyError:
             raise PluginLoadError(
                 f"Adapter {adapter_type}.{adapter_name} not registered. "
-                f"Available: {available}"
-            )
+                f"Available: {list(state.registry)}"
+            ) from None
         
         # Cleanup previous adapter with hooks
-        previous_adapter = self._active[adapter_type]
+        previous_adapter = state.active
         if previous_adapter:
-            previous_name = self._find_instance_name(adapter_type, previous_adapter)
-            logger.debug(f"Unloading previous {adapter_type} adapter: {previous_name}")
+            previous_name = self._active_names[adapter_type]
+            logger.debug("Unloading previous %s adapter: %s", adapter_type, previous_name)
             
             # Call cleanup hook if exists
             if hasattr(previous_adapter, 'close'):
                 try:
                     previous_adapter.close()
-                    logger.debug(f"Called {previous_name}.close()")
+                    logger.debug("Called %s.close()", previous_name)
                 except Exception as e:
-                    logger.warning(f"Cleanup failed for {previous_name}: {e}")
+                    logger.warning("Cleanup failed for %s: %s", previous_name, e)
             
             # Track switch history
-            if not hasattr(self, '_switch_history'):
-                self._switch_history = []
             self._switch_history.append({
                 'type': adapter_type,
                 'from': previous_name,
                 'to': adapter_name,
-                'timestamp': __import__('datetime').datetime.now().isoformat()
+                'ts_ns': time.time_ns()
             })
         
-        # Load new adapter
-        adapter_class = self._registry[adapter_type][adapter_name]
-        
-        # Check if already instantiated (singleton pattern)
-        if adapter_name in self._instances[adapter_type]:
-            instance = self._instances[adapter_type][adapter_name]
-            logger.debug(f"Reusing cached instance of {adapter_type}.{adapter_name}")
+        # Load new adapter: cached instance first, config + construction only on a miss
+        instance = state.instances.get(adapter_name)
+        if instance is None:
+            instance = self._instantiate(adapter_type, adapter_name, adapter_class)
         else:
-            # Get config for this adapter
-            config = self.get_adapter_config(adapter_type, adapter_name)
-            
-            # Instantiate
-            try:
-                instance = adapter_class(config=config)
-                self._instances[adapter_type][adapter_name] = instance
-                logger.info(f"Instantiated {adapter_type}.{adapter_name}")
-            except Exception as e:
-                raise PluginLoadError(
-                    f"Failed to instantiate {adapter_type}.{adapter_name}: {e}"
-                ) from e
+            logger.debug("Reusing cached instance of %s.%s", adapter_type, adapter_name)
         
-        self._active[adapter_type] = instance
-        logger.info(f"Switched {adapter_type} to {adapter_name}")
+        state.active = instance
+        self._active_names[adapter_type] = adapter_name
+        logger.info("Switched %s to %s", adapter_type, adapter_name)
     
-    def _find_instance_name(self, adapter_type: str, instance: Any) -> Optional[str]:
+    def _instantiate(self, adapter_type: str, adapter_name: str, adapter_class: Type, cache: bool = True) -> Any:
         """
-        Find the name of an adapter instance
+        Instancier un adapter avec sa configuration TOML (chemin unique de construction)
+        
+        Les options de [plugins.<type>.<nom>] sont passées en arguments nommés.
+        L'instance est mise en cache (singleton par nom) sauf si cache=False.
+        Le cache ne garde qu'une référence faible : une instance qui n'est
+        plus active ni référencée ailleurs est reconstruite au prochain switch.
         
         Args:
-            adapter_type: Type of adapter
-            instance: Adapter instance
+            adapter_type: Type d'adapter
+            adapter_name: Nom de l'adapter
+            adapter_class: Classe de l'adapter
+            cache: Réutiliser / mémoriser l'instance
         
         Returns:
-            Name of adapter or None
+            Instance de l'adapter
+        
+        Raises:
+            PluginLoadError: Si l'instanciation échoue
         """
-        for name, inst in self._instances[adapter_type].items():
-            if inst is instance:
-                return name
-        return None
+        state = self._state[adapter_type]
+        if cache:
+            instance = state.instances.get(adapter_name)
+            if instance is not None:
+                logger.debug("Reusing cached instance of %s.%s", adapter_type, adapter_name)
+                return instance
+        
+        config = self.get_adapter_config(adapter_type, adapter_name)
+        try:
+            instance = adapter_class(**config)
+        except Exception as e:
+            raise PluginLoadError(
+                f"Failed to instantiate {adapter_type}.{adapter_name}: {e}"
+            ) from e
+        
+        if cache:
+            try:
+                state.instances[adapter_name] = instance
+            except TypeError:
+                # Classe à __slots__ sans __weakref__ : pas de mise en cache
+                pass
+        logger.info("Instantiated %s.%s", adapter_type, adapter_name)
+        return instance
     
     def get_switch_history(self, adapter_type: Optional[str] = None) -> list:
         """
@@ -389,14 +573,17 @@ class PluginManager:
             >>> print(history[-1])  # Last switch
             {'type': 'ocr', 'from': 'mock', 'to': 'tesseract', 'timestamp': '...'}
         """
-        if not hasattr(self, '_switch_history'):
-            return []
-        
-        history = self._switch_history
-        if adapter_type:
-            history = [h for h in history if h['type'] == adapter_type]
-        
-        return history
+        # Horodatage stocké en entier, formaté seulement ici
+        return [
+            {
+                'type': h['type'],
+                'from': h['from'],
+                'to': h['to'],
+                'timestamp': datetime.fromtimestamp(h['ts_ns'] / 1e9).isoformat()
+            }
+            for h in self._switch_history
+            if not adapter_type or h['type'] == adapter_type
+        ]
     
     def get_active(self, adapter_type: str) -> Optional[Any]:
         """
@@ -412,9 +599,68 @@ class PluginManager:
             >>> ocr = manager.get_active('ocr')
             >>> result = ocr.extract('/path/to/image.jpg')
         """
-        return self._active.get(adapter_type)
+        state = self._state.get(adapter_type)
+        return state.active if state is not None else None
     
-    def list_available(self, adapter_type: str) -> List[str]:
+    def get_active_name(self, adapter_type: str) -> Optional[str]:
+        """
+        Récupérer le nom de l'adapter actif d'un type
+        
+        Args:
+            adapter_type: Type d'adapter
+        
+        Returns:
+            Nom de l'adapter actif ou None
+        """
+        return self._active_names.get(adapter_type)
+    
+    def is_registered(self, adapter_type: str, adapter_name: str) -> bool:
+        """
+        Vérifier qu'un adapter est enregistré (une seule recherche dans le registre)
+        
+        Args:
+            adapter_type: Type d'adapter
+            adapter_name: Nom de l'adapter
+        
+        Returns:
+            True si l'adapter est enregistré
+        """
+        state = self._state.get(adapter_type)
+        return state is not None and adapter_name in state.registry
+    
+    def record_load_failure(self, adapter_type: str, adapter_name: str) -> None:
+        """
+        Mémoriser l'échec de chargement d'un adapter (cache négatif)
+        
+        Args:
+            adapter_type: Type d'adapter
+            adapter_name: Nom de l'adapter
+        """
+        self._load_failures[(adapter_type, adapter_name)] = time.monotonic()
+    
+    def load_recently_failed(self, adapter_type: str, adapter_name: str) -> bool:
+        """
+        Indiquer si le chargement d'un adapter a échoué il y a moins de LOAD_FAILURE_TTL
+        
+        Les entrées expirées sont supprimées au passage.
+        
+        Args:
+            adapter_type: Type d'adapter
+            adapter_name: Nom de l'adapter
+        
+        Returns:
+            True si un nouvel essai de chargement est inutile pour l'instant
+        """
+        key = (adapter_type, adapter_name)
+        failed_at = self._load_failures.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < LOAD_FAILURE_TTL:
+            return True
+        del self._load_failures[key]
+        return False
+    
+    def list_available(self, adapter_type: str) -> KeysView[str]:
         """
         List available (registered) adapters for a type
         
@@ -422,40 +668,29 @@ class PluginManager:
             adapter_type: Type of adapter ('ocr', 'translator', 'search')
         
         Returns:
-            List of adapter names
+            Live view of adapter names (use list(...) for a snapshot)
         
         Example:
-            >>> manager.list_available('ocr')
+            >>> 'tesseract' in manager.list_available('ocr')
+            True
+            >>> list(manager.list_available('ocr'))
             ['mock', 'tesseract', 'chandra']
         """
-        if adapter_type not in self._registry:
-            return []
-        return list(self._registry[adapter_type].keys())
+        state = self._state.get(adapter_type)
+        return (state.registry if state is not None else _EMPTY_REGISTRY).keys()
     
-    def list_active(self) -> Dict[str, Optional[str]]:
+    def list_active(self) -> Mapping[str, Optional[str]]:
         """
         Lister les adapters actifs
         
         Returns:
-            Dictionnaire {type: name} des adapters actifs
+            Vue {type: name} des adapters actifs (lecture seule, toujours à jour)
         
         Example:
             >>> print(manager.list_active())
             {'ocr': 'tesseract', 'translator': 'mock', 'search': None}
         """
-        active = {}
-        for adapter_type, instance in self._active.items():
-            if instance:
-                # Find adapter name from instance
-                name = None
-                for n, inst in self._instances[adapter_type].items():
-                    if inst is instance:
-                        name = n
-                        break
-                active[adapter_type] = name
-            else:
-                active[adapter_type] = None
-        return active
+        return self._active_view
     
     def discover_plugins(
         self, 
@@ -482,33 +717,55 @@ class PluginManager:
             base_path = Path(__file__).parent / "adapters"
         
         if adapter_types is None:
-            adapter_types = ['ocr', 'translator', 'search']
-        
-        discovered = []
+            adapter_types = list(ADAPTER_TYPES)
         
+        # 1. Lister les fichiers candidats (scandir, peu coûteux)
+        candidates: List[Tuple[Path, str, int]] = []
         for adapter_type in adapter_types:
             type_path = base_path / adapter_type
-            if not type_path.exists():
+            try:
+                with os.scandir(type_path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except (FileNotFoundError, NotADirectoryError):
                 logger.warning(f"Adapter type path not found: {type_path}")
                 continue
             
             # Scan all .py files in this adapter type directory
-            for py_file in type_path.glob("*.py"):
-                if py_file.name.startswith("_") or py_file.name == "base.py":
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".py") or name.startswith("_") or name == "base.py":
                     continue
-                
-                try:
-                    metadata = self._extract_plugin_metadata(py_file, adapter_type)
-                    if metadata:
-                        discovered.append(metadata)
-                        logger.debug(f"Discovered plugin: {adapter_type}/{metadata.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse {py_file}: {e}")
+                # stat() du DirEntry : mis en cache par scandir, sert de clé au cache de découverte
+                candidates.append((Path(entry.path), adapter_type, entry.stat().st_mtime_ns))
+        
+        # 2. Extraire les métadonnées (lecture + AST), en parallèle si beaucoup de fichiers
+        def extract(candidate: Tuple[Path, str, int]) -> Optional[PluginMetadata]:
+            py_file, adapter_type, mtime_ns = candidate
+            try:
+                return self._extract_plugin_metadata(py_file, adapter_type, mtime_ns=mtime_ns)
+            except Exception as e:
+                logger.warning(f"Failed to parse {py_file}: {e}")
+                return None
+        
+        if len(candidates) >= PARALLEL_DISCOVERY_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(len(candidates), DISCOVERY_MAX_WORKERS)) as executor:
+                results = list(executor.map(extract, candidates))
+        else:
+            results = [extract(candidate) for candidate in candidates]
+        
+        discovered = [metadata for metadata in results if metadata]
+        for metadata in discovered:
+            logger.debug(f"Discovered plugin: {metadata.type}/{metadata.name}")
         
         logger.info(f"Discovered {len(discovered)} plugins")
         return discovered
     
-    def _extract_plugin_metadata(self, file_path: Path, adapter_type: str) -> Optional[PluginMetadata]:
+    def _extract_plugin_metadata(
+        self,
+        file_path: Path,
+        adapter_type: str,
+        mtime_ns: Optional[int] = None
+    ) -> Optional[PluginMetadata]:
         """
         Extract plugin metadata from a Python file
         
@@ -520,77 +777,119 @@ class PluginManager:
         Args:
             file_path: Path to .py file
             adapter_type: Type of adapter
+            mtime_ns: File mtime if already known (default: stat the file)
         
         Returns:
             PluginMetadata if found, None otherwise
         """
+        cache_key = str(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            if mtime_ns is None:
+                mtime_ns = file_path.stat().st_mtime_ns
+            cached = self._discovery_cache.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            
+            # Octets bruts : ast.parse gère lui-même le décodage (PEP 263)
+            source = file_path.read_bytes()
+            
+            # Pas de classe adapter dans le source : inutile de construire l'AST
+            if not _ADAPTER_CLASS_RE.search(source):
+                self._discovery_cache[cache_key] = (mtime_ns, None)
+                return None
+            
+            tree = ast.parse(source, filename=str(file_path))
         except Exception as e:
             logger.error(f"Failed to parse {file_path}: {e}")
             return None
         
-        # Find classes that look like adapters
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check if class name ends with "Adapter"
-                if not node.name.endswith("Adapter"):
-                    continue
-                
-                # Extract metadata
-                plugin_dict = None
-                description = ast.get_docstring(node) or ""
-                
-                # Look for __plugin__ class variable
-                for item in node.body:
-                    if isinstance(item, ast.Assign):
-                        for target in item.targets:
-                            if isinstance(target, ast.Name) and target.id == "__plugin__":
-                                # Found __plugin__ dict
-                                try:
-                                    plugin_dict = ast.literal_eval(item.value)
-                                except:
-                                    pass
-                
-                # Build metadata
-                if plugin_dict:
-                    # Use explicit metadata
-                    name = plugin_dict.get('name', self._class_name_to_plugin_name(node.name))
-                    version = plugin_dict.get('version', '0.1.0')
-                    deps = plugin_dict.get('dependencies', [])
-                    enabled = plugin_dict.get('enabled', True)
-                    priority = plugin_dict.get('priority', 0)
-                    desc = plugin_dict.get('description', description.split('\n')[0] if description else "")
-                else:
-                    # Infer from class name and docstring
-                    name = self._class_name_to_plugin_name(node.name)
-                    version = '0.1.0'
-                    deps = []
-                    enabled = True
-                    priority = 0
-                    desc = description.split('\n')[0] if description else ""
-                
-                return PluginMetadata(
-                    name=name,
-                    type=adapter_type,
-                    version=version,
-                    description=desc,
-                    dependencies=deps,
-                    enabled=enabled,
-                    priority=priority
-                )
+        metadata = self._metadata_from_tree(tree, adapter_type)
+        self._discovery_cache[cache_key] = (mtime_ns, metadata)
+        return metadata
+    
+    def _metadata_from_tree(self, tree: ast.Module, adapter_type: str) -> Optional[PluginMetadata]:
+        """
+        Build PluginMetadata from the first adapter class of a parsed module
+        
+        Args:
+            tree: Parsed module
+            adapter_type: Type of adapter
         
+        Returns:
+            PluginMetadata if an adapter class is found, None otherwise
+        """
+        # Adapter classes are defined at module level: only top-level statements
+        for node in tree.body:
+            # Check if class name ends with "Adapter"
+            if not isinstance(node, ast.ClassDef) or not node.name.endswith("Adapter"):
+                continue
+            
+            # Extract metadata
+            description = ast.get_docstring(node) or ""
+            plugin_dict = self._find_plugin_dict(node)
+            
+            # Build metadata
+            if plugin_dict:
+                # Use explicit metadata
+                name = plugin_dict.get('name', self._class_name_to_plugin_name(node.name))
+                version = plugin_dict.get('version', '0.1.0')
+                deps = plugin_dict.get('dependencies', [])
+                enabled = plugin_dict.get('enabled', True)
+                priority = plugin_dict.get('priority', 0)
+                desc = plugin_dict.get('description', description.split('\n')[0] if description else "")
+            else:
+                # Infer from class name and docstring
+                name = self._class_name_to_plugin_name(node.name)
+                version = '0.1.0'
+                deps = []
+                enabled = True
+                priority = 0
+                desc = description.split('\n')[0] if description else ""
+            
+            return PluginMetadata(
+                name=name,
+                type=adapter_type,
+                version=version,
+                description=desc,
+                dependencies=deps,
+                enabled=enabled,
+                priority=priority
+            )
+        
+        return None
+    
+    @staticmethod
+    def _find_plugin_dict(class_node: ast.ClassDef) -> Optional[Dict[str, Any]]:
+        """
+        Return the literal value of the class-level __plugin__ dict, if any
+        
+        Args:
+            class_node: Adapter class definition
+        
+        Returns:
+            __plugin__ dict or None
+        """
+        for item in class_node.body:
+            if not isinstance(item, ast.Assign):
+                continue
+            if any(isinstance(target, ast.Name) and target.id == "__plugin__" for target in item.targets):
+                try:
+                    return ast.literal_eval(item.value)
+                except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                    return None
         return None
     
-    def _class_name_to_plugin_name(self, class_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _class_name_to_plugin_name(class_name: str) -> str:
         """
         Convert class name to plugin name
         
         Examples:
-            MockOCRAdapter -> mock-ocr
+            MockOCRAdapter -> mock
             TesseractAdapter -> tesseract
             ChandraOCR -> chandra
+            GoogleCloudAdapter -> google-cloud
         
         Args:
             class_name: Python class name
@@ -598,19 +897,9 @@ class PluginManager:
         Returns:
             Plugin name (lowercase, hyphenated)
         """
-        # Remove common suffixes
-        for suffix in ['Adapter', 'OCR', 'Translator', 'Search', 'Backend', 'Engine']:
-            if class_name.endswith(suffix):
-                class_name = class_name[:-len(suffix)]
-        
-        # Convert CamelCase to kebab-case
-        result = []
-        for i, char in enumerate(class_name):
-            if char.isupper() and i > 0 and class_name[i-1].islower():
-                result.append('-')
-            result.append(char.lower())
-        
-        return ''.join(result)
+        # Remove common suffixes, then convert CamelCase to kebab-case
+        stripped = _PLUGIN_SUFFIX_RE.sub('', class_name)
+        return _CAMEL_BOUNDARY_RE.sub('-', stripped).lower()
     
     def load_adapter(
         self,
@@ -646,12 +935,28 @@ class PluginManager:
             >>> manager.load_adapter('ocr', 'tesseract')
             >>> adapter = manager.get_active('ocr')
         """
-        if adapter_type not in ['ocr', 'translator', 'search']:
+        if adapter_type not in ADAPTER_TYPES:
             raise ValueError(f"Invalid adapter_type: {adapter_type}")
         
         # Build module path: indexao.adapters.ocr.tesseract
         module_name = f"indexao.adapters.{adapter_type}.{adapter_name}"
         
+        # Plugin non installé : détecté sans lever (ni construire) d'ImportError
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        
+        if spec is None:
+            error_msg = f"Adapter module not found: {module_name}"
+            logger.error(error_msg)
+            
+            if fallback_to_mock and adapter_name != 'mock':
+                logger.warning(f"Falling back to mock adapter for {adapter_type}")
+                return self.load_adapter(adapter_type, 'mock', auto_register=auto_register, fallback_to_mock=False)
+            
+            raise PluginLoadError(error_msg)
+        
         try:
             # Import module dynamically
             logger.debug(f"Importing module: {module_name}")
@@ -664,25 +969,17 @@ class PluginManager:
             
             logger.debug(f"Found adapter class: {adapter_class.__name__}")
             
-            # Get config for this adapter
-            config = self.get_adapter_config(adapter_type, adapter_name)
-            
-            # Instantiate adapter with config
-            try:
-                if config:
-                    adapter_instance = adapter_class(**config)
-                else:
-                    adapter_instance = adapter_class()
-            except Exception as e:
-                raise PluginLoadError(f"Failed to instantiate {adapter_class.__name__}: {e}")
+            # Auto-register if requested, then instantiate once with config
+            if auto_register:
+                self.register(adapter_type, adapter_name, adapter_class, validate=True)
+            adapter_instance = self._instantiate(adapter_type, adapter_name, adapter_class, cache=auto_register)
             
             logger.info(f"Loaded adapter: {adapter_type}/{adapter_name}")
             
-            # Auto-register if requested
             if auto_register:
-                self.register(adapter_type, adapter_name, adapter_class, validate=True)
-                self._instances[adapter_type][adapter_name] = adapter_instance
-                self._active[adapter_type] = adapter_instance
+                state = self._state[adapter_type]
+                state.active = adapter_instance
+                self._active_names[adapter_type] = adapter_name
                 logger.info(f"Registered and activated: {adapter_type}/{adapter_name}")
             
             return adapter_instance
@@ -726,22 +1023,25 @@ class PluginManager:
         """
         candidates = []
         
-        # Get all classes from module
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        # Classes defined in this module, in definition order
+        module_name = module.__name__
+        for name, obj in vars(module).items():
+            if not isinstance(obj, type):
+                continue
+            
             # Skip imported classes (must be defined in this module)
-            if obj.__module__ != module.__name__:
+            if obj.__module__ != module_name:
                 continue
             
             # Must end with "Adapter" or be exact type match
-            if name.endswith('Adapter') or name.endswith('OCR') or name.endswith('Translator'):
+            if name.endswith(_ADAPTER_CLASS_SUFFIXES):
                 candidates.append(obj)
         
         if not candidates:
             return None
         
         # Prefer class with protocol methods
-        protocol = self._get_protocol_for_type(adapter_type)
-        if protocol and PROTOCOLS_AVAILABLE:
+        if _load_protocol(adapter_type) is not None:
             for candidate in candidates:
                 # Check if has required methods (basic check)
                 if adapter_type == 'ocr' and hasattr(candidate, 'process_image'):
@@ -1,43 +1,60 @@
 """Plugin API Routes - REST endpoints for plugin management"""
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import List, Dict, Any, Literal, Optional
 
 from indexao.logger import get_logger
 from indexao.plugin_manager import PluginManager, PluginMetadata
 
 logger = get_logger(__name__)
 
-# Create router with redirect_slashes disabled to avoid 307 redirects
-router = APIRouter(prefix="/api/plugins", tags=["plugins"], redirect_slashes=False)
-
-# Global plugin manager instance (will be set by main.py)
-_plugin_manager: Optional[PluginManager] = None
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# Endpoints polled by the dashboard: orjson when available, and content
+# returned as-is (no response_model re-validation)
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 
-def set_plugin_manager(manager: PluginManager):
-    """Set global plugin manager instance"""
-    global _plugin_manager
-    _plugin_manager = manager
+# Accepted adapter types, validated by FastAPI before the handler runs
+# (422 on unknown values). Keep in sync with plugin_manager.ADAPTER_TYPES
+AdapterType = Literal['ocr', 'translator', 'search']
 
+# Create router with redirect_slashes disabled to avoid 307 redirects
+router = APIRouter(prefix="/api/plugins", tags=["plugins"], redirect_slashes=False)
 
-def get_plugin_manager() -> PluginManager:
-    """Get plugin manager instance"""
-    if _plugin_manager is None:
-        raise RuntimeError("Plugin manager not initialized")
-    return _plugin_manager
+def get_plugin_manager(request: Request) -> PluginManager:
+    """FastAPI dependency: the application's plugin manager.
+    
+    The manager is created once by the webui lifespan and stored on
+    app.state, so handlers receive it through Depends(get_plugin_manager).
+    
+    Raises:
+        HTTPException: 503 if the plugin manager was not initialized
+    """
+    manager = getattr(request.app.state, "plugin_manager", None)
+    if manager is None:
+        raise HTTPException(status_code=503, detail="Plugin manager not initialized")
+    return manager
 
 
 # Request/Response Models
 class SwitchRequest(BaseModel):
     """Request to switch adapter"""
-    adapter_type: str
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+    
+    adapter_type: AdapterType
     adapter_name: str
 
 
 class PluginInfo(BaseModel):
     """Plugin information"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     type: str
     version: str
@@ -48,15 +65,20 @@ class PluginInfo(BaseModel):
 
 class ActiveAdapter(BaseModel):
     """Active adapter info"""
+    model_config = ConfigDict(frozen=True)
+    
     type: str
     name: Optional[str]
 
 
 # API Endpoints
 
-@router.get("/", response_model=List[PluginInfo])
-@router.get("", response_model=List[PluginInfo])
-async def list_plugins(adapter_type: Optional[str] = None):
+@router.get("/", response_model=List[PluginInfo], response_class=FastJSONResponse)
+@router.get("", response_model=List[PluginInfo], response_class=FastJSONResponse)
+async def list_plugins(
+    adapter_type: Optional[AdapterType] = None,
+    manager: PluginManager = Depends(get_plugin_manager)
+):
     """
     List all available plugins
     
@@ -71,32 +93,31 @@ async def list_plugins(adapter_type: Optional[str] = None):
         GET /api/plugins?adapter_type=ocr
     """
     try:
-        manager = get_plugin_manager()
-        
         # Discover plugins
         types_filter = [adapter_type] if adapter_type else None
         plugins = manager.discover_plugins(adapter_types=types_filter)
         
-        # Convert to response model
-        return [
-            PluginInfo(
-                name=p.name,
-                type=p.type,
-                version=p.version,
-                description=p.description,
-                enabled=p.enabled,
-                priority=p.priority
-            )
+        # Metadata comes from our own discovery: serialize it directly
+        # (PluginInfo only documents the schema)
+        return FastJSONResponse([
+            {
+                "name": p.name,
+                "type": p.type,
+                "version": p.version,
+                "description": p.description,
+                "enabled": p.enabled,
+                "priority": p.priority
+            }
             for p in plugins
-        ]
+        ])
     
     except Exception as e:
         logger.error(f"Failed to list plugins: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/active", response_model=List[ActiveAdapter])
-async def get_active_adapters():
+@router.get("/active", response_model=List[ActiveAdapter], response_class=FastJSONResponse)
+async def get_active_adapters(manager: PluginManager = Depends(get_plugin_manager)):
     """
     Get currently active adapters
     
@@ -112,21 +133,23 @@ async def get_active_adapters():
         ]
     """
     try:
-        manager = get_plugin_manager()
         active = manager.list_active()
         
-        return [
-            ActiveAdapter(type=adapter_type, name=name)
+        return FastJSONResponse([
+            {"type": adapter_type, "name": name}
             for adapter_type, name in active.items()
-        ]
+        ])
     
     except Exception as e:
         logger.error(f"Failed to get active adapters: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{adapter_type}/active", response_model=ActiveAdapter)
-async def get_active_adapter(adapter_type: str):
+@router.get("/{adapter_type}/active", response_model=ActiveAdapter, response_class=FastJSONResponse)
+async def get_active_adapter(
+    adapter_type: AdapterType,
+    manager: PluginManager = Depends(get_plugin_manager)
+):
     """
     Get active adapter for specific type
     
@@ -140,17 +163,11 @@ async def get_active_adapter(adapter_type: str):
         GET /api/plugins/ocr/active
         Response: {"type": "ocr", "name": "tesseract"}
     """
-    if adapter_type not in ['ocr', 'translator', 'search']:
-        raise HTTPException(status_code=400, detail=f"Invalid adapter_type: {adapter_type}")
-    
     try:
-        manager = get_plugin_manager()
-        active = manager.list_active()
-        
-        return ActiveAdapter(
-            type=adapter_type,
-            name=active.get(adapter_type)
-        )
+        return FastJSONResponse({
+            "type": adapter_type,
+            "name": manager.get_active_name(adapter_type)
+        })
     
     except Exception as e:
         logger.error(f"Failed to get active adapter: {e}")
@@ -158,7 +175,10 @@ async def get_active_adapter(adapter_type: str):
 
 
 @router.post("/switch")
-async def switch_adapter(request: SwitchRequest):
+async def switch_adapter(
+    request: SwitchRequest,
+    manager: PluginManager = Depends(get_plugin_manager)
+):
     """
     Switch to different adapter (hot-swap)
     
@@ -173,18 +193,17 @@ async def switch_adapter(request: SwitchRequest):
         Body: {"adapter_type": "ocr", "adapter_name": "tesseract"}
         Response: {"status": "success", "message": "Switched to ocr/tesseract"}
     """
-    if request.adapter_type not in ['ocr', 'translator', 'search']:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid adapter_type: {request.adapter_type}"
-        )
-    
     try:
-        manager = get_plugin_manager()
-        
         # Check if adapter exists in registry
-        available = manager.list_available(request.adapter_type)
-        if request.adapter_name not in available:
+        if not manager.is_registered(request.adapter_type, request.adapter_name):
+            not_found = HTTPException(
+                status_code=404,
+                detail=f"Adapter not found and failed to load: {request.adapter_name}"
+            )
+            # A load that just failed is not retried until the negative cache expires
+            if manager.load_recently_failed(request.adapter_type, request.adapter_name):
+                raise not_found
+            
             # Try to load it dynamically
             logger.info(f"Adapter not registered, attempting dynamic load: {request.adapter_type}/{request.adapter_name}")
             try:
@@ -192,13 +211,11 @@ async def switch_adapter(request: SwitchRequest):
                     request.adapter_type,
                     request.adapter_name,
                     auto_register=True,
-                    fallback_to_mock=True
-                )
-            except Exception as load_error:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Adapter not found and failed to load: {request.adapter_name}"
+                    fallback_to_mock=False
                 )
+            except Exception:
+                manager.record_load_failure(request.adapter_type, request.adapter_name)
+                raise not_found
         else:
             # Switch to existing adapter
             manager.switch(request.adapter_type, request.adapter_name)
@@ -218,7 +235,7 @@ async def switch_adapter(request: SwitchRequest):
 
 
 @router.get("/registered")
-async def get_registered_adapters():
+async def get_registered_adapters(manager: PluginManager = Depends(get_plugin_manager)):
     """
     Get all registered adapters (in memory)
     
@@ -234,12 +251,10 @@ async def get_registered_adapters():
         }
     """
     try:
-        manager = get_plugin_manager()
-        
         registered = {
-            'ocr': manager.list_available('ocr'),
-            'translator': manager.list_available('translator'),
-            'search': manager.list_available('search')
+            'ocr': list(manager.list_available('ocr')),
+            'translator': list(manager.list_available('translator')),
+            'search': list(manager.list_available('search'))
         }
         
         return registered
@@ -250,7 +265,10 @@ async def get_registered_adapters():
 
 
 @router.get("/history")
-async def get_switch_history(adapter_type: Optional[str] = None):
+async def get_switch_history(
+    adapter_type: Optional[AdapterType] = None,
+    manager: PluginManager = Depends(get_plugin_manager)
+):
     """
     Get adapter switch history
     
@@ -265,7 +283,6 @@ async def get_switch_history(adapter_type: Optional[str] = None):
         GET /api/plugins/history?adapter_type=ocr
     """
     try:
-        manager = get_plugin_manager()
         history = manager.get_switch_history(adapter_type=adapter_type)
         
         return {"history": history}
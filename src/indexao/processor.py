@@ -11,26 +11,126 @@ License: MIT
 """
 
 import asyncio
-from datetime import datetime
+import codecs
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Tuple, BinaryIO
 from dataclasses import dataclass, field
 
 from .config import Config
 from .logger import get_logger
-from .scanner import FileMetadata
-from .upload_handler import UploadHandler
-from .paths import get_path_adapter
-from .adapters.ocr import MockOCRAdapter, OCRResult
+from .scanner import FileMetadata, FileScanner
+from .upload_handler import UploadHandler, file_checksum
+from .paths import PathAdapter, get_path_adapter
+from .adapters.ocr import MockOCRAdapter, OCRResult, TesseractOCR
 from .adapters.translator import MockTranslatorAdapter, TranslationResult
 from .adapters.search import MockSearchAdapter, IndexedDocument
 from .database import DocumentDatabase
 from .models.document import Document, DocumentMetadata, ProcessingStatus as DocStatus, ProcessingStage
 
+try:
+    from pypdf import PdfReader  # type: ignore[import]
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+    PdfReader = None  # type: ignore
+
 logger = get_logger(__name__)
 
 
+def _env_workers(name: str) -> int:
+    """
+    Worker count read from an environment variable, at least 1.
+    
+    Unset or malformed values fall back to the CPU count and values below 1
+    are raised to 1, with a warning, so a bad setting cannot break imports.
+    
+    Args:
+        name: Environment variable name
+        
+    Returns:
+        Number of workers
+    """
+    default = os.cpu_count() or 1
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %d", name, value, default)
+        return default
+    if workers < 1:
+        logger.warning("%s=%d is below 1, using 1", name, workers)
+    return max(1, workers)
+
+
+# Number of queued documents processed in parallel (documents are independent)
+MAX_WORKERS = _env_workers("INDEXAO_CONCURRENCY")
+
+# Worker processes for CPU-bound OCR engines (GIL-free extraction)
+OCR_PROCESSES = _env_workers("INDEXAO_OCR_PROCESSES")
+
+# Translations kept in memory (LRU), keyed by (text digest, source, target)
+TRANSLATION_CACHE_SIZE = 1024
+
+# Documents sent per search backend call when a queue run is indexed in bulk
+INDEX_BATCH_SIZE = 100
+
+# Chunk size used when streaming text files
+TEXT_READ_CHUNK_SIZE = 64 * 1024
+
+# Minimum characters per page for a PDF text layer to be used instead of OCR
+PDF_TEXT_MIN_CHARS = 50
+
+# Options of the second OCR attempt when confidence is below the threshold
+OCR_RETRY_OPTIONS = {"dpi": 600, "psm": 6}
+
+
+@lru_cache(maxsize=256)
+def _cached_path_adapter(directory: str) -> PathAdapter:
+    """
+    Path adapter for a directory, built once per directory.
+    
+    Args:
+        directory: Absolute directory path (resolved here, once)
+    """
+    return get_path_adapter(f"file://{Path(directory).resolve()}")
+
+
+def _ocr_worker(adapter: Any, file_path: Path, options: Dict[str, Any]) -> OCRResult:
+    """Run OCR in a worker process (module-level so it can be pickled)."""
+    return adapter.process_image(file_path, **options)
+
+
+def _decode_stream(stream: BinaryIO, encoding: str) -> str:
+    """
+    Decode a binary stream chunk by chunk.
+    
+    Multi-byte characters split across chunks are handled by the
+    incremental decoder; only the decoded text is kept in memory.
+    
+    Raises:
+        UnicodeDecodeError: If the stream is not valid for the encoding
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = [
+        decoder.decode(chunk)
+        for chunk in iter(partial(stream.read, TEXT_READ_CHUNK_SIZE), b"")
+    ]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
 class ProcessingStatus(str, Enum):
     """Processing status enumeration."""
     PENDING = "pending"
@@ -51,6 +151,27 @@ class FileType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# File type detection tables (built once at import)
+_TEXT_EXTENSIONS = frozenset({'.txt', '.md', '.csv', '.json', '.xml'})
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.gif', '.bmp'})
+_DOCUMENT_EXTENSIONS = frozenset({'.doc', '.docx', '.odt', '.rtf'})
+
+_EXTENSION_TYPES: Dict[str, FileType] = {
+    **{ext: FileType.TEXT for ext in _TEXT_EXTENSIONS},
+    **{ext: FileType.IMAGE for ext in _IMAGE_EXTENSIONS},
+    '.pdf': FileType.PDF,
+    **{ext: FileType.DOCUMENT for ext in _DOCUMENT_EXTENSIONS},
+}
+_MIME_MAJOR_TYPES: Dict[str, FileType] = {'text': FileType.TEXT, 'image': FileType.IMAGE}
+_MIME_TYPES: Dict[str, FileType] = {'application/pdf': FileType.PDF}
+
+# When MIME type and extension disagree, the first type in this order wins
+_TYPE_PRIORITY: Dict[FileType, int] = {
+    file_type: rank
+    for rank, file_type in enumerate((FileType.TEXT, FileType.IMAGE, FileType.PDF, FileType.DOCUMENT))
+}
+
+
 @dataclass
 class ProcessingResult:
     """
@@ -64,6 +185,8 @@ class ProcessingResult:
         translations: Dictionary of translations (lang_code -> text)
         search_indexed: Whether document was indexed for search
         error_message: Error message if processing failed
+        ocr_confidence: OCR confidence (0.0-1.0), None if OCR was not used
+        needs_review: OCR confidence stayed below the configured threshold
         processing_time_seconds: Total processing time
         stages_completed: List of completed processing stages
     """
@@ -71,9 +194,12 @@ class ProcessingResult:
     status: ProcessingStatus
     file_metadata: Optional[FileMetadata] = None
     extracted_text: Optional[str] = None
+    content_hash: Optional[str] = None
     translations: Dict[str, str] = field(default_factory=dict)
     search_indexed: bool = False
     error_message: Optional[str] = None
+    ocr_confidence: Optional[float] = None
+    needs_review: bool = False
     processing_time_seconds: float = 0.0
     stages_completed: List[str] = field(default_factory=list)
     
@@ -84,19 +210,58 @@ class ProcessingResult:
             'status': self.status.value,
             'file_metadata': self.file_metadata.to_dict() if self.file_metadata else None,
             'extracted_text': self.extracted_text,
+            'content_hash': self.content_hash,
             'translations': self.translations,
             'search_indexed': self.search_indexed,
             'error_message': self.error_message,
+            'ocr_confidence': self.ocr_confidence,
+            'needs_review': self.needs_review,
             'processing_time_seconds': round(self.processing_time_seconds, 2),
             'stages_completed': self.stages_completed,
         }
 
 
+def summarize_results(results: List[ProcessingResult]) -> Dict[str, Any]:
+    """
+    Aggregate processing results in a single pass.
+    
+    Args:
+        results: Processing results of a run
+        
+    Returns:
+        Counts by outcome and total processing time
+    """
+    completed = failed = needs_review = 0
+    total_time = 0.0
+    for r in results:
+        if r.status == ProcessingStatus.COMPLETED:
+            completed += 1
+        elif r.status == ProcessingStatus.FAILED:
+            failed += 1
+        needs_review += r.needs_review
+        total_time += r.processing_time_seconds
+    
+    return {
+        'processed': len(results),
+        'completed': completed,
+        'failed': failed,
+        'needs_review': needs_review,
+        'total_time_seconds': total_time,
+    }
+
+
 class ProcessingError(Exception):
     """Base exception for processing errors."""
     pass
 
 
+@dataclass
+class _QueueBatch:
+    """Writes collected by process_queue workers and flushed in bulk at the end."""
+    to_index: List[IndexedDocument] = field(default_factory=list)
+    to_save: List[Tuple[ProcessingResult, Path]] = field(default_factory=list)
+
+
 class DocumentProcessor:
     """
     Main document processing pipeline.
@@ -126,8 +291,24 @@ class DocumentProcessor:
         self.config = config
         self.upload_handler = upload_handler
         
+        # Settings read for every document, snapshotted once
+        self._target_languages: Tuple[str, ...] = tuple(config.plugins.translator.target_languages)
+        self._ocr_confidence_threshold: float = config.plugins.ocr.confidence_threshold
+        
         # Initialize database
         self.db = DocumentDatabase("data/indexao.db")
+        # Serializes database writes when the queue is processed in parallel
+        self._db_lock = threading.Lock()
+        
+        # Worker threads running whole documents for the async API
+        self._document_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="indexao-doc")
+        # Worker processes for CPU-bound OCR engines, started on first use
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._cpu_pool_lock = threading.Lock()
+        
+        # Translation cache: retries and repeated boilerplate skip the adapter
+        self._translation_cache: "OrderedDict[Tuple[bytes, str, str], str]" = OrderedDict()
+        self._translation_cache_lock = threading.Lock()
         logger.info(f"✓ Database initialized")
         
         # Initialize adapters based on configuration
@@ -145,6 +326,16 @@ class DocumentProcessor:
                 confidence=0.95
             )
             logger.info(f"✓ OCR adapter initialized: {ocr_engine}")
+        elif ocr_engine == "tesseract":
+            # CPU-bound: _run_ocr sends it to the OCR worker processes
+            try:
+                self._ocr_adapter = TesseractOCR(
+                    tesseract_cmd=self.config.plugins.ocr.options.get("tesseract_cmd")
+                )
+                logger.info(f"✓ OCR adapter initialized: {ocr_engine}")
+            except (ImportError, RuntimeError) as e:
+                logger.warning(f"Tesseract unavailable ({e}), falling back to mock")
+                self._ocr_adapter = MockOCRAdapter()
         else:
             logger.warning(f"Unsupported OCR engine: {ocr_engine}, falling back to mock")
             self._ocr_adapter = MockOCRAdapter()
@@ -180,25 +371,39 @@ class DocumentProcessor:
         mime_type = metadata.mime_type.lower()
         extension = metadata.extension.lower()
         
-        # Text files
-        if mime_type.startswith('text/') or extension in {'.txt', '.md', '.csv', '.json', '.xml'}:
-            return FileType.TEXT
-        
-        # Images
-        if mime_type.startswith('image/') or extension in {'.jpg', '.jpeg', '.png', '.tiff', '.gif', '.bmp'}:
-            return FileType.IMAGE
+        file_type = _EXTENSION_TYPES.get(extension)
+        major, slash, _ = mime_type.partition('/')
+        mime_file_type = _MIME_TYPES.get(mime_type) or (_MIME_MAJOR_TYPES.get(major) if slash else None)
         
-        # PDFs
-        if mime_type == 'application/pdf' or extension == '.pdf':
-            return FileType.PDF
+        if mime_file_type is not None and (
+            file_type is None or _TYPE_PRIORITY[mime_file_type] < _TYPE_PRIORITY[file_type]
+        ):
+            file_type = mime_file_type
         
-        # Office documents
-        if extension in {'.doc', '.docx', '.odt', '.rtf'}:
-            return FileType.DOCUMENT
+        if file_type is None:
+            logger.warning("Unknown file type: %s (%s)", mime_type, extension)
+            return FileType.UNKNOWN
         
-        logger.warning(f"Unknown file type: {mime_type} ({extension})")
-        return FileType.UNKNOWN
-    
+        return file_type
+
+    def _content_hash(self, file_path: Path) -> str:
+        """
+        Compute the SHA256 digest of the file content (same as the upload checksum).
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Hex digest
+
+        Raises:
+            ProcessingError: If file cannot be read
+        """
+        try:
+            return file_checksum(file_path)
+        except OSError as e:
+            raise ProcessingError(f"Failed to hash file: {e}") from e
+
     def _read_text_file(self, file_path: Path) -> str:
         """
         Read text directly from file using Path Manager.
@@ -213,146 +418,272 @@ class DocumentProcessor:
             ProcessingError: If file cannot be read
         """
         try:
-            # Use path adapter for file reading with absolute path
-            path_adapter = get_path_adapter(f"file://{file_path.parent.resolve()}")
+            # Use path adapter for file reading with absolute path (cached per directory)
+            path_adapter = _cached_path_adapter(str(file_path.parent.absolute()))
             
-            # Read file as bytes using relative path
-            content_bytes = path_adapter.read_file(file_path.name)
+            # Stream the file using relative path (no full bytes copy in memory)
+            with path_adapter.open_stream(file_path.name) as stream:
+                # Try UTF-8 first
+                try:
+                    content = _decode_stream(stream, 'utf-8')
+                except UnicodeDecodeError:
+                    # Fallback to latin-1 (never fails)
+                    logger.debug("UTF-8 decode failed, trying latin-1: %s", file_path.name)
+                    stream.seek(0)
+                    content = _decode_stream(stream, 'latin-1')
             
-            # Try UTF-8 first
-            try:
-                content = content_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                # Fallback to latin-1 (never fails)
-                logger.debug(f"UTF-8 decode failed, trying latin-1: {file_path.name}")
-                content = content_bytes.decode('latin-1')
-            
-            logger.info(f"✓ Read {len(content)} chars from {file_path.name} via Path Manager")
+            logger.info("✓ Read %d chars from %s via Path Manager", len(content), file_path.name)
             return content.strip()
         
         except Exception as e:
             raise ProcessingError(f"Failed to read text file: {e}") from e
     
-    def _extract_text_from_image(self, file_path: Path) -> str:
+    def _run_ocr(self, file_path: Path, **options) -> OCRResult:
+        """
+        Run the OCR adapter on a file.
+        
+        CPU-bound engines (adapter attribute cpu_bound = True) run in the
+        process pool so OCR of several documents is not serialized by the
+        GIL; other adapters are called in the current thread.
+        
+        Args:
+            file_path: Path to image or PDF file
+            **options: Engine-specific options
+            
+        Returns:
+            OCR result
+        """
+        if not getattr(self._ocr_adapter, "cpu_bound", False):
+            return self._ocr_adapter.process_image(file_path, **options)
+        
+        with self._cpu_pool_lock:
+            if self._cpu_pool is None:
+                # spawn: forking a process that runs worker threads is unsafe
+                self._cpu_pool = ProcessPoolExecutor(
+                    max_workers=OCR_PROCESSES,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+        
+        return self._cpu_pool.submit(_ocr_worker, self._ocr_adapter, file_path, options).result()
+    
+    def close(self) -> None:
+        """Shut down the worker threads and OCR worker processes."""
+        self._document_pool.shutdown(wait=False, cancel_futures=True)
+        with self._cpu_pool_lock:
+            if self._cpu_pool is not None:
+                self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+                self._cpu_pool = None
+    
+    def _extract_text_from_image(
+        self,
+        file_path: Path,
+        content_hash: Optional[str] = None
+    ) -> OCRResult:
         """
         Extract text from image using OCR adapter.
         
+        Below the configured confidence threshold, OCR is retried once with
+        OCR_RETRY_OPTIONS and the best of both results is kept. Results are
+        cached in the database by content hash and OCR engine.
+        
         Args:
             file_path: Path to image file
+            content_hash: Digest of the file content (None = no cache)
             
         Returns:
-            Extracted text
+            OCR result (text and confidence)
             
         Raises:
             ProcessingError: If OCR fails
         """
         try:
-            logger.debug(f"  → Applying OCR adapter to: {file_path.name}")
+            engine = self._ocr_adapter.name
+            if content_hash is not None:
+                cached = self.db.get_ocr_cached(content_hash, engine)
+                if cached is not None:
+                    logger.debug("  → OCR cache hit (%s): %s", engine, file_path.name)
+                    return cached
+            
+            logger.debug("  → Applying OCR adapter to: %s", file_path.name)
             
             # Use OCR adapter
-            ocr_result: OCRResult = self._ocr_adapter.process_image(file_path)
+            ocr_result: OCRResult = self._run_ocr(file_path)
             
             logger.debug(
-                f"  → OCR completed: {len(ocr_result.text)} chars, "
-                f"confidence={ocr_result.confidence:.2f}, "
-                f"language={ocr_result.language}"
+                "  → OCR completed: %d chars, confidence=%.2f, language=%s",
+                len(ocr_result.text),
+                ocr_result.confidence,
+                ocr_result.language
             )
             
-            return ocr_result.text
+            threshold = self._ocr_confidence_threshold
+            if ocr_result.confidence < threshold:
+                logger.info(
+                    "  → Low OCR confidence (%.2f < %s), retrying with %s: %s",
+                    ocr_result.confidence, threshold, OCR_RETRY_OPTIONS, file_path.name
+                )
+                retry_result = self._run_ocr(file_path, **OCR_RETRY_OPTIONS)
+                if retry_result.confidence > ocr_result.confidence:
+                    ocr_result = retry_result
+            
+            if content_hash is not None:
+                self.db.put_ocr_cache(content_hash, engine, ocr_result)
+            
+            return ocr_result
         
         except Exception as e:
             raise ProcessingError(f"OCR extraction failed: {e}") from e
     
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
+    def _extract_text_from_pdf(
+        self,
+        file_path: Path,
+        content_hash: Optional[str] = None
+    ) -> Tuple[str, Optional[float]]:
         """
         Extract text from PDF.
         
+        The embedded text layer is used when every page has one (pypdf),
+        so OCR only runs on scanned PDFs.
+        
         Args:
             file_path: Path to PDF file
+            content_hash: Digest of the file content (OCR cache key)
             
         Returns:
-            Extracted text
+            Extracted text and OCR confidence (None when the text layer is used)
             
         Raises:
             ProcessingError: If extraction fails
         """
-        try:
-            # For now, return mock text (will be implemented with PyPDF2 or similar)
-            logger.debug(f"Mock PDF extraction from {file_path.name}")
-            return f"[Mock PDF text extracted from {file_path.name}]"
+        if PYPDF_AVAILABLE:
+            try:
+                pages = [page.extract_text() or "" for page in PdfReader(str(file_path)).pages]
+            except Exception as e:
+                logger.debug("  → No readable text layer in %s: %s", file_path.name, e)
+                pages = []
+            
+            if pages and all(len(text.strip()) >= PDF_TEXT_MIN_CHARS for text in pages):
+                logger.debug("  → Using PDF text layer (%d pages), OCR skipped", len(pages))
+                return "\n".join(text.strip() for text in pages), None
         
-        except Exception as e:
-            raise ProcessingError(f"PDF extraction failed: {e}") from e
+        # Scanned pages (or no pypdf): OCR adapters process the whole PDF
+        logger.debug("  → Applying OCR to PDF: %s", file_path.name)
+        ocr_result = self._extract_text_from_image(file_path, content_hash)
+        return ocr_result.text, ocr_result.confidence
     
-    def _extract_text(self, file_path: Path, file_type: FileType) -> str:
+    def _extract_text(
+        self,
+        file_path: Path,
+        file_type: FileType,
+        content_hash: Optional[str] = None
+    ) -> Tuple[str, Optional[float]]:
         """
         Extract text from file based on type.
         
         Args:
             file_path: Path to file
             file_type: Detected file type
+            content_hash: Digest of the file content (OCR cache key)
             
         Returns:
-            Extracted text content
+            Extracted text content and OCR confidence (None if OCR was not used)
             
         Raises:
             ProcessingError: If extraction fails
         """
-        extraction_start = datetime.now()
+        extraction_start = time.perf_counter_ns()
+        confidence = None
         
         if file_type == FileType.TEXT:
-            logger.debug(f"  → Reading text file directly: {file_path.name}")
+            logger.debug("  → Reading text file directly: %s", file_path.name)
             result = self._read_text_file(file_path)
         
         elif file_type == FileType.IMAGE:
-            logger.debug(f"  → Applying OCR to image: {file_path.name}")
-            result = self._extract_text_from_image(file_path)
+            logger.debug("  → Applying OCR to image: %s", file_path.name)
+            ocr_result = self._extract_text_from_image(file_path, content_hash)
+            result, confidence = ocr_result.text, ocr_result.confidence
         
         elif file_type == FileType.PDF:
-            logger.debug(f"  → Extracting from PDF: {file_path.name}")
-            result = self._extract_text_from_pdf(file_path)
+            logger.debug("  → Extracting from PDF: %s", file_path.name)
+            result, confidence = self._extract_text_from_pdf(file_path, content_hash)
         
         elif file_type == FileType.DOCUMENT:
             # Office documents - would use python-docx or similar
-            logger.warning(f"  → Document type not yet supported: {file_type}")
+            logger.warning("  → Document type not yet supported: %s", file_type)
             result = f"[Document extraction not yet implemented for {file_path.name}]"
         
         else:
-            logger.error(f"  → Unsupported file type: {file_type}")
+            logger.error("  → Unsupported file type: %s", file_type)
             raise ProcessingError(f"Unsupported file type: {file_type}")
         
-        duration = (datetime.now() - extraction_start).total_seconds()
-        logger.debug(f"  → Extraction took {duration:.3f}s, got {len(result)} chars")
+        duration = (time.perf_counter_ns() - extraction_start) / 1e9
+        logger.debug("  → Extraction took %.3fs, got %d chars", duration, len(result))
         
-        return result
+        return result, confidence
     
-    def _translate_text(self, text: str, target_languages: List[str]) -> Dict[str, str]:
+    def _translate_text(self, text: str, target_languages: Sequence[str]) -> Dict[str, str]:
         """
         Translate text to target languages using translator adapter.
         
         Args:
             text: Text to translate
-            target_languages: List of target language codes (e.g., ['fr', 'zh'])
+            target_languages: Target language codes (e.g., ('fr', 'zh'))
             
         Returns:
             Dictionary of translations (lang_code -> translated_text)
         """
-        translations = {}
+        source_language = "auto"  # Auto-detect
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
         
-        for lang in target_languages:
-            logger.debug(f"  → Translating to {lang} via adapter")
+        # Keys in the requested language order, values filled from cache or adapter
+        translations: Dict[str, Optional[str]] = dict.fromkeys(target_languages)
+        missing = []
+        with self._translation_cache_lock:
+            for lang in target_languages:
+                key = (digest, source_language, lang)
+                cached = self._translation_cache.get(key)
+                if cached is None:
+                    missing.append(lang)
+                else:
+                    self._translation_cache.move_to_end(key)
+                    translations[lang] = cached
+        
+        if missing:
+            logger.debug("  → Translating to %s via adapter", missing)
             
-            # Use translator adapter
-            translation_result: TranslationResult = self._translator_adapter.translate(
+            # One adapter call for all target languages not in cache
+            batch: Dict[str, TranslationResult] = self._translator_adapter.translate_multi(
                 text=text,
-                target_language=lang,
-                source_language="auto"  # Auto-detect
+                target_languages=missing,
+                source_language=source_language
             )
             
-            translations[lang] = translation_result.translated_text
+            with self._translation_cache_lock:
+                for lang, result in batch.items():
+                    translations[lang] = result.translated_text
+                    self._translation_cache[(digest, source_language, lang)] = result.translated_text
+                while len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+                    self._translation_cache.popitem(last=False)
         
         return translations
     
+    def _build_indexed_document(
+        self,
+        document_id: str,
+        metadata: FileMetadata,
+        text: str,
+        translations: Dict[str, str]
+    ) -> IndexedDocument:
+        """Build the search index entry of a document."""
+        return IndexedDocument(
+            doc_id=document_id,
+            title=metadata.filename,
+            content=text,
+            language="auto",  # Will be detected
+            file_path=metadata.path,
+            metadata=self._index_metadata(metadata, translations)
+        )
+    
     def _index_document(
         self,
         document_id: str,
@@ -373,34 +704,32 @@ class DocumentProcessor:
             True if indexing succeeded
         """
         try:
-            logger.debug(f"  → Indexing via search adapter: {document_id}")
+            logger.debug("  → Indexing via search adapter: %s", document_id)
             
             # Prepare document for indexing using IndexedDocument
-            indexed_doc = IndexedDocument(
-                doc_id=document_id,
-                title=metadata.filename,
-                content=text,
-                language="auto",  # Will be detected
-                file_path=metadata.path,
-                metadata={
-                    "translations": translations,
-                    "mime_type": metadata.mime_type,
-                    "size_bytes": metadata.size_bytes,
-                    "modified_at": metadata.modified_at.isoformat(),
-                    "extension": metadata.extension,
-                }
-            )
+            indexed_doc = self._build_indexed_document(document_id, metadata, text, translations)
             
             # Use search adapter
             result = self._search_adapter.index_document(indexed_doc)
             
-            logger.debug(f"  → Indexing result: success={result}")
+            logger.debug("  → Indexing result: success=%s", result)
             return result
         
         except Exception as e:
-            logger.error(f"  ✗ Indexing failed for {document_id}: {e}")
+            logger.error("  ✗ Indexing failed for %s: %s", document_id, e)
             return False
     
+    @staticmethod
+    def _index_metadata(metadata: FileMetadata, translations: Dict[str, str]) -> Dict[str, Any]:
+        """Build the search index metadata of a document."""
+        return {
+            "translations": translations,
+            "mime_type": metadata.mime_type,
+            "size_bytes": metadata.size_bytes,
+            "modified_at": metadata.modified_at.isoformat(),
+            "extension": metadata.extension,
+        }
+    
     def process_file(self, file_path: Path, metadata: FileMetadata) -> ProcessingResult:
         """
         Process a single file through the complete pipeline.
@@ -412,7 +741,27 @@ class DocumentProcessor:
         Returns:
             ProcessingResult with complete processing information
         """
-        start_time = datetime.now()
+        return self._process_file(file_path, metadata)
+    
+    def _process_file(
+        self,
+        file_path: Path,
+        metadata: FileMetadata,
+        batch: Optional["_QueueBatch"] = None
+    ) -> ProcessingResult:
+        """
+        Run the pipeline for one file.
+        
+        Args:
+            file_path: Path to file to process
+            metadata: File metadata from scanner
+            batch: Queue run collecting the index and database writes
+                (None = index and save this document immediately)
+            
+        Returns:
+            ProcessingResult with complete processing information
+        """
+        start_time = time.perf_counter_ns()
         document_id = f"DOC_{file_path.stem[:8].upper()}"
         
         result = ProcessingResult(
@@ -423,115 +772,121 @@ class DocumentProcessor:
         
         try:
             logger.info(
-                f"[PIPELINE START] Document: {document_id} | "
-                f"File: {metadata.filename} | "
-                f"Size: {metadata.size_bytes} bytes | "
-                f"MIME: {metadata.mime_type}"
+                "[PIPELINE START] Document: %s | File: %s | Size: %d bytes | MIME: %s",
+                document_id, metadata.filename, metadata.size_bytes, metadata.mime_type
             )
             
             # Stage 1: File type detection
             result.status = ProcessingStatus.SCANNING
-            logger.info(f"[STAGE 1/4] File type detection - {document_id}")
+            logger.info("[STAGE 1/4] File type detection - %s", document_id)
             file_type = self._detect_file_type(metadata)
             result.stages_completed.append("file_type_detection")
-            logger.info(f"✓ File type detected: {file_type.value} | MIME: {metadata.mime_type} | Ext: {metadata.extension}")
+            logger.info(
+                "✓ File type detected: %s | MIME: %s | Ext: %s",
+                file_type.value, metadata.mime_type, metadata.extension
+            )
             
             # Stage 2: Text extraction
             result.status = ProcessingStatus.OCR
-            logger.info(f"[STAGE 2/4] Text extraction ({file_type.value}) - {document_id}")
-            stage2_start = datetime.now()
-            extracted_text = self._extract_text(file_path, file_type)
-            stage2_duration = (datetime.now() - stage2_start).total_seconds()
+            logger.info("[STAGE 2/4] Text extraction (%s) - %s", file_type.value, document_id)
+            stage2_start = time.perf_counter_ns()
+            result.content_hash = self._content_hash(file_path)
+            duplicate = self.db.find_by_content_hash(result.content_hash)
+            if duplicate is None:
+                extracted_text, result.ocr_confidence = self._extract_text(
+                    file_path, file_type, result.content_hash
+                )
+            else:
+                # Same bytes already processed: reuse its text and translations
+                logger.info("✓ Same content as %s, skipping extraction and translation", duplicate.doc_id)
+                extracted_text = duplicate.content
+                if duplicate.metadata:
+                    result.ocr_confidence = duplicate.metadata.ocr_confidence
+            stage2_duration = (time.perf_counter_ns() - stage2_start) / 1e9
             result.extracted_text = extracted_text
+            if (
+                result.ocr_confidence is not None
+                and result.ocr_confidence < self._ocr_confidence_threshold
+            ):
+                result.needs_review = True
+                logger.warning(
+                    "⚠ Low OCR confidence (%.2f), document flagged for review - %s",
+                    result.ocr_confidence, document_id
+                )
             result.stages_completed.append("text_extraction")
-            logger.info(
-                f"✓ Text extracted: {len(extracted_text)} chars | "
-                f"Duration: {stage2_duration:.2f}s | "
-                f"Preview: {extracted_text[:100]}..."
-            )
+            # Slicing the preview copies text: only when the line is emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "✓ Text extracted: %d chars | Duration: %.2fs | Preview: %s...",
+                    len(extracted_text), stage2_duration, extracted_text[:100]
+                )
+            
+            # Stage 4 waits for the translations: each document is written to
+            # the index once, with them. In a queue run, indexing is left to
+            # process_queue (bulk).
             
             # Stage 3: Translation
             result.status = ProcessingStatus.TRANSLATING
-            target_languages = self.config.plugins.translator.target_languages
-            logger.info(f"[STAGE 3/4] Translation to {len(target_languages)} languages - {document_id}")
-            stage3_start = datetime.now()
-            translations = self._translate_text(extracted_text, target_languages)
-            stage3_duration = (datetime.now() - stage3_start).total_seconds()
+            target_languages = self._target_languages
+            logger.info("[STAGE 3/4] Translation to %d languages - %s", len(target_languages), document_id)
+            stage3_start = time.perf_counter_ns()
+            if duplicate is not None:
+                translations = dict(duplicate.translations)
+            else:
+                translations = self._translate_text(extracted_text, target_languages)
+            
+            stage3_duration = (time.perf_counter_ns() - stage3_start) / 1e9
             result.translations = translations
             result.stages_completed.append("translation")
             logger.info(
-                f"✓ Translations completed: {list(translations.keys())} | "
-                f"Duration: {stage3_duration:.2f}s"
-            )
-            
-            # Stage 4: Search indexing
-            result.status = ProcessingStatus.INDEXING
-            logger.info(f"[STAGE 4/4] Search indexing - {document_id}")
-            stage4_start = datetime.now()
-            indexed = self._index_document(
-                document_id,
-                metadata,
-                extracted_text,
-                translations
+                "✓ Translations completed: %s | Duration: %.2fs",
+                list(translations), stage3_duration
             )
-            stage4_duration = (datetime.now() - stage4_start).total_seconds()
-            result.search_indexed = indexed
-            result.stages_completed.append("indexing")
             
-            if indexed:
-                logger.info(f"✓ Document indexed successfully | Duration: {stage4_duration:.2f}s")
+            if batch is None:
+                # Stage 4: Search indexing
+                result.status = ProcessingStatus.INDEXING
+                logger.info("[STAGE 4/4] Search indexing - %s", document_id)
+                stage4_start = time.perf_counter_ns()
+                indexed = self._index_document(document_id, metadata, extracted_text, translations)
+                stage4_duration = (time.perf_counter_ns() - stage4_start) / 1e9
+                result.search_indexed = indexed
+                
+                if indexed:
+                    logger.info("✓ Document indexed successfully | Duration: %.2fs", stage4_duration)
+                else:
+                    logger.warning("⚠ Indexing failed but pipeline continued | Duration: %.2fs", stage4_duration)
             else:
-                logger.warning(f"⚠ Indexing failed but pipeline continued | Duration: {stage4_duration:.2f}s")
+                # Stage 4: Search indexing, flushed in bulk by process_queue
+                result.status = ProcessingStatus.INDEXING
+                logger.info("[STAGE 4/4] Search indexing (batched) - %s", document_id)
+                batch.to_index.append(
+                    self._build_indexed_document(document_id, metadata, extracted_text, translations)
+                )
+            result.stages_completed.append("indexing")
             
             # Success
             result.status = ProcessingStatus.COMPLETED
             
             # Calculate processing time
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_time) / 1e9
             result.processing_time_seconds = duration
             
             # Save to database
-            try:
-                doc_metadata = DocumentMetadata(
-                    filename=metadata.filename,
-                    file_path=str(file_path),
-                    file_size=metadata.size_bytes,
-                    mime_type=metadata.mime_type,
-                    text_length=len(extracted_text),
-                    language="auto",
-                    processing_duration=duration,
-                    stages_completed=result.stages_completed,
-                )
-                
-                document = Document(
-                    doc_id=document_id,
-                    content=extracted_text,
-                    title=metadata.filename,
-                    metadata=doc_metadata,
-                    translations=translations,
-                    status=DocStatus.COMPLETED,
-                    current_stage=ProcessingStage.COMPLETED,
-                    indexed=indexed,
-                    search_engine="mock",
-                )
-                
-                document.mark_completed()
-                
-                if self.db.create_document(document):
-                    logger.info(f"✓ Document saved to database: {document_id}")
-                else:
-                    logger.warning(f"⚠ Failed to save document to database: {document_id}")
-            
-            except Exception as db_error:
-                logger.error(f"Database save error for {document_id}: {db_error}")
+            if batch is None:
+                self._save_document(result, file_path)
+            else:
+                batch.to_save.append((result, file_path))
             
             logger.info(
-                f"[PIPELINE SUCCESS] {document_id} | "
-                f"Total: {duration:.2f}s | "
-                f"Stages: {len(result.stages_completed)}/4 | "
-                f"Text: {len(extracted_text)} chars | "
-                f"Translations: {len(translations)} | "
-                f"Indexed: {indexed}"
+                "[PIPELINE SUCCESS] %s | Total: %.2fs | Stages: %d/4 | "
+                "Text: %d chars | Translations: %d | Indexed: %s",
+                document_id,
+                duration,
+                len(result.stages_completed),
+                len(extracted_text),
+                len(translations),
+                result.search_indexed if batch is None else 'batched'
             )
             
             return result
@@ -539,68 +894,180 @@ class DocumentProcessor:
         except ProcessingError as e:
             result.status = ProcessingStatus.FAILED
             result.error_message = str(e)
-            result.processing_time_seconds = (datetime.now() - start_time).total_seconds()
+            result.processing_time_seconds = (time.perf_counter_ns() - start_time) / 1e9
             
             # Save failed document to database
-            try:
-                doc_metadata = DocumentMetadata(
-                    filename=metadata.filename,
-                    file_path=str(file_path),
-                    file_size=metadata.size_bytes,
-                    mime_type=metadata.mime_type,
-                    text_length=len(result.extracted_text) if result.extracted_text else 0,
-                    processing_duration=result.processing_time_seconds,
-                    stages_completed=result.stages_completed,
-                )
-                
-                document = Document(
-                    doc_id=document_id,
-                    content=result.extracted_text or "",
-                    title=metadata.filename,
-                    metadata=doc_metadata,
-                    translations=result.translations,
-                    status=DocStatus.FAILED,
-                    current_stage=ProcessingStage.FAILED,
-                    error_message=str(e),
-                    indexed=False,
-                )
-                
-                document.mark_failed(str(e))
-                
-                if self.db.create_document(document):
-                    logger.info(f"✓ Failed document saved to database: {document_id}")
-            
-            except Exception as db_error:
-                logger.error(f"Database save error for failed document {document_id}: {db_error}")
+            if batch is None:
+                self._save_document(result, file_path)
+            else:
+                batch.to_save.append((result, file_path))
             
             logger.error(
-                f"[PIPELINE FAILED] {document_id} | "
-                f"Duration: {result.processing_time_seconds:.2f}s | "
-                f"Last stage: {result.status.value} | "
-                f"Completed stages: {result.stages_completed} | "
-                f"Error: {e}"
+                "[PIPELINE FAILED] %s | Duration: %.2fs | Last stage: %s | "
+                "Completed stages: %s | Error: %s",
+                document_id,
+                result.processing_time_seconds,
+                result.status.value,
+                result.stages_completed,
+                e
             )
             return result
         
         except Exception as e:
             result.status = ProcessingStatus.FAILED
             result.error_message = f"Unexpected error: {str(e)}"
-            result.processing_time_seconds = (datetime.now() - start_time).total_seconds()
+            result.processing_time_seconds = (time.perf_counter_ns() - start_time) / 1e9
             
             logger.error(
-                f"[PIPELINE ERROR] {document_id} | "
-                f"Duration: {result.processing_time_seconds:.2f}s | "
-                f"Last stage: {result.status.value} | "
-                f"Completed stages: {result.stages_completed} | "
-                f"Unexpected error: {e}",
+                "[PIPELINE ERROR] %s | Duration: %.2fs | Last stage: %s | "
+                "Completed stages: %s | Unexpected error: %s",
+                document_id,
+                result.processing_time_seconds,
+                result.status.value,
+                result.stages_completed,
+                e,
                 exc_info=True
             )
             return result
     
-    def process_queue(self) -> List[ProcessingResult]:
+    def _build_document(self, result: ProcessingResult, file_path: Path) -> Document:
+        """
+        Build the database record of a processed (completed or failed) document.
+        
+        Args:
+            result: Processing result
+            file_path: Path of the processed file
+            
+        Returns:
+            Document ready to be saved
+        """
+        metadata = result.file_metadata
+        completed = result.status == ProcessingStatus.COMPLETED
+        
+        doc_metadata = DocumentMetadata(
+            filename=metadata.filename,
+            file_path=str(file_path),
+            file_size=metadata.size_bytes,
+            mime_type=metadata.mime_type,
+            text_length=len(result.extracted_text) if result.extracted_text else 0,
+            content_hash=result.content_hash,
+            ocr_confidence=result.ocr_confidence,
+            needs_review=result.needs_review,
+            language="auto" if completed else None,
+            processing_duration=result.processing_time_seconds,
+            stages_completed=result.stages_completed,
+        )
+        
+        if completed:
+            document = Document(
+                doc_id=result.document_id,
+                content=result.extracted_text,
+                title=metadata.filename,
+                metadata=doc_metadata,
+                translations=result.translations,
+                status=DocStatus.COMPLETED,
+                current_stage=ProcessingStage.COMPLETED,
+                indexed=result.search_indexed,
+                search_engine="mock",
+            )
+            document.mark_completed()
+        else:
+            document = Document(
+                doc_id=result.document_id,
+                content=result.extracted_text or "",
+                title=metadata.filename,
+                metadata=doc_metadata,
+                translations=result.translations,
+                status=DocStatus.FAILED,
+                current_stage=ProcessingStage.FAILED,
+                error_message=result.error_message,
+                indexed=False,
+            )
+            document.mark_failed(result.error_message)
+        
+        return document
+    
+    def _save_document(self, result: ProcessingResult, file_path: Path) -> None:
+        """
+        Save a processed document to the database (errors are logged, not raised).
+        
+        Args:
+            result: Processing result
+            file_path: Path of the processed file
+        """
+        document_id = result.document_id
+        try:
+            document = self._build_document(result, file_path)
+            
+            with self._db_lock:
+                saved = self.db.create_document(document)
+            
+            if saved:
+                logger.info("✓ Document saved to database: %s", document_id)
+            else:
+                logger.warning("⚠ Failed to save document to database: %s", document_id)
+        
+        except Exception as db_error:
+            logger.error("Database save error for %s: %s", document_id, db_error)
+    
+    def _save_documents(self, pending: List[Tuple[ProcessingResult, Path]]) -> None:
+        """
+        Save the documents of a queue run in a single database transaction.
+        
+        Args:
+            pending: (result, file path) pairs collected during the run
+        """
+        documents = []
+        for result, file_path in pending:
+            try:
+                documents.append(self._build_document(result, file_path))
+            except Exception as e:
+                logger.error("Database save error for %s: %s", result.document_id, e)
+        
+        if not documents:
+            return
+        
+        with self._db_lock:
+            saved = self.db.bulk_create_documents(documents)
+        
+        if saved == len(documents):
+            logger.info("✓ %d documents saved to database", saved)
+        else:
+            logger.warning("⚠ Saved %d/%d documents to database", saved, len(documents))
+    
+    def _flush_index(self, documents: List[IndexedDocument], results: Dict[str, ProcessingResult]) -> None:
+        """
+        Index documents in bulk, INDEX_BATCH_SIZE at a time.
+        
+        Args:
+            documents: Documents collected during a queue run
+            results: Processing results by document ID (search_indexed is set)
+        """
+        for i in range(0, len(documents), INDEX_BATCH_SIZE):
+            chunk = documents[i:i + INDEX_BATCH_SIZE]
+            try:
+                count = self._search_adapter.index_batch(chunk)
+            except Exception as e:
+                logger.error("  ✗ Bulk indexing failed for %d documents: %s", len(chunk), e)
+                continue
+            
+            for doc in chunk:
+                # Partial failure: ask the backend which documents made it
+                indexed = count == len(chunk) or self._search_adapter.get_document(doc.doc_id) is not None
+                results[doc.doc_id].search_indexed = indexed
+            
+            logger.info("✓ Bulk indexed %d/%d documents", count, len(chunk))
+    
+    def process_queue(self, max_workers: int = MAX_WORKERS) -> List[ProcessingResult]:
         """
         Process all files in the upload queue.
         
+        Documents are independent, so they are dispatched to a thread pool;
+        results are returned in queue order.
+        
+        Args:
+            max_workers: Number of documents processed in parallel
+        
         Returns:
             List of ProcessingResult objects
         """
@@ -615,46 +1082,63 @@ class DocumentProcessor:
             logger.info("=" * 80)
             return []
         
-        results = []
+        jobs = []
+        # Metadata by directory: each directory is scanned once per run
+        metadata_by_dir: Dict[Path, Dict[str, FileMetadata]] = {}
         
         for idx, queue_file in enumerate(queue_files, 1):
             try:
-                logger.info(f"\n>>> Processing file {idx}/{len(queue_files)}: {queue_file.name}")
+                logger.info("\n>>> Queued file %d/%d: %s", idx, len(queue_files), queue_file.name)
                 
                 # Extract metadata
-                from .scanner import FileScanner
-                scanner = FileScanner(queue_file.parent, recursive=False)
+                directory_metadata = metadata_by_dir.get(queue_file.parent)
+                if directory_metadata is None:
+                    scanner = FileScanner(queue_file.parent, recursive=False)
+                    directory_metadata = {m.filename: m for m in scanner.scan()}
+                    metadata_by_dir[queue_file.parent] = directory_metadata
                 
-                # Scan and find matching file by name
-                all_metadata = scanner.scan()
-                metadata = None
-                
-                for m in all_metadata:
-                    if m.filename == queue_file.name:
-                        metadata = m
-                        break
+                # Find matching file by name
+                metadata = directory_metadata.get(queue_file.name)
                 
                 if not metadata:
-                    logger.error(f"✗ Failed to get metadata for {queue_file.name}")
+                    logger.error("✗ Failed to get metadata for %s", queue_file.name)
                     continue
                 
-                # Process file
-                result = self.process_file(queue_file, metadata)
-                results.append(result)
+                jobs.append((queue_file, metadata))
                 
             except Exception as e:
-                logger.error(f"✗ Exception while processing {queue_file.name}: {e}", exc_info=True)
+                logger.error("✗ Exception while processing %s: %s", queue_file.name, e, exc_info=True)
+        
+        results = []
+        batch = _QueueBatch()
+        
+        # Process files in parallel
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                (queue_file, executor.submit(self._process_file, queue_file, metadata, batch))
+                for queue_file, metadata in jobs
+            ]
+            
+            for queue_file, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error("✗ Exception while processing %s: %s", queue_file.name, e, exc_info=True)
+        
+        # Bulk indexing, then database records (they store the indexing outcome)
+        self._flush_index(batch.to_index, {r.document_id: r for r in results})
+        self._save_documents(batch.to_save)
         
         # Summary
-        completed = sum(1 for r in results if r.status == ProcessingStatus.COMPLETED)
-        failed = sum(1 for r in results if r.status == ProcessingStatus.FAILED)
-        total_time = sum(r.processing_time_seconds for r in results)
+        summary = summarize_results(results)
+        total_time = summary['total_time_seconds']
         
         logger.info("\n" + "=" * 80)
         logger.info("[QUEUE PROCESSING COMPLETE]")
-        logger.info(f"Total processed: {len(results)}")
-        logger.info(f"  ✓ Completed: {completed}")
-        logger.info(f"  ✗ Failed: {failed}")
+        logger.info(f"Total processed: {summary['processed']}")
+        logger.info(f"  ✓ Completed: {summary['completed']}")
+        logger.info(f"  ✗ Failed: {summary['failed']}")
+        logger.info(f"  ⚠ Needs review: {summary['needs_review']}")
         logger.info(f"Total time: {total_time:.2f}s")
         logger.info(f"Average time: {total_time/len(results):.2f}s per document" if results else "N/A")
         logger.info("=" * 80)
@@ -689,7 +1173,8 @@ async def process_document_async(
     """
     Async wrapper for document processing.
     
-    Useful for processing multiple documents concurrently.
+    The document runs in the processor's own thread pool (not the loop's
+    default executor, which is shared with every other caller).
     
     Args:
         processor: DocumentProcessor instance
@@ -699,10 +1184,29 @@ async def process_document_async(
     Returns:
         ProcessingResult
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
-        None,
+        processor._document_pool,
         processor.process_file,
         file_path,
         metadata
     )
+
+
+async def process_batch_async(
+    processor: DocumentProcessor,
+    files: List[Tuple[Path, FileMetadata]]
+) -> List[ProcessingResult]:
+    """
+    Process several documents concurrently.
+    
+    Args:
+        processor: DocumentProcessor instance
+        files: (file path, file metadata) pairs
+        
+    Returns:
+        ProcessingResult list, in the order of files
+    """
+    return await asyncio.gather(
+        *(process_document_async(processor, file_path, metadata) for file_path, metadata in files)
+    )
@@ -8,22 +8,69 @@ Author: Indexao Team
 License: MIT
 """
 
+import array
 import mimetypes
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Dict, Any, Iterator
+from stat import S_ISDIR, S_ISREG
+from typing import List, NamedTuple, Optional, Set, Dict, Any, Iterator, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .logger import get_logger
 from .paths import get_path_adapter, FileInfo as PathFileInfo
 
+try:
+    # scandir-rs 2.x API (Scandir + ReturnType)
+    from scandir_rs import ReturnType as RsReturnType, Scandir as RsScandir  # type: ignore[import]
+    SCANDIR_RS_AVAILABLE = True
+except ImportError:
+    SCANDIR_RS_AVAILABLE = False
+    RsScandir = RsReturnType = None  # type: ignore
+
 logger = get_logger(__name__)
 
+# A file kept by the filters, with its stat result
+_ScannedEntry = Tuple[os.DirEntry, os.stat_result]
+
+
+def _extension(name: str) -> str:
+    """Lowercase extension of a file name, with dot (same rules as Path.suffix)."""
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
+
+
+class _RsEntry(NamedTuple):
+    """Name and absolute path of a scandir-rs entry (the DirEntry fields we use)."""
+    name: str
+    path: str
+
+
+class _RsStat(NamedTuple):
+    """Stat fields of a scandir-rs entry (the stat_result fields we use).
+    
+    scandir-rs exposes st_mtime as a datetime; the epoch float is `mtime`.
+    """
+    st_size: int
+    st_mtime: float
+
 
-@dataclass
+@lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> str:
+    """MIME type for a lowercase extension (memoized, a scan sees few distinct ones)."""
+    mime_type, _ = mimetypes.guess_type('x' + ext)
+    return mime_type or 'application/octet-stream'
+
+
+@dataclass(slots=True)
 class FileMetadata:
     """
-    File metadata container.
+    File metadata container (slotted: one instance per scanned file).
     
     Attributes:
         path: Absolute path to file
@@ -84,6 +131,7 @@ class FileScanner:
         excluded_extensions: Set of excluded extensions
         min_size_bytes: Minimum file size (0 = no limit)
         max_size_bytes: Maximum file size (0 = no limit)
+        max_workers: Directories listed in parallel (1 = sequential walk)
     """
     
     def __init__(
@@ -96,6 +144,7 @@ class FileScanner:
         excluded_extensions: Optional[Set[str]] = None,
         min_size_bytes: int = 0,
         max_size_bytes: int = 0,
+        max_workers: int = 1,
     ):
         """
         Initialize file scanner.
@@ -109,6 +158,9 @@ class FileScanner:
             excluded_extensions: Blacklist of extensions
             min_size_bytes: Minimum file size in bytes (0 = no limit)
             max_size_bytes: Maximum file size in bytes (0 = no limit)
+            max_workers: Number of directories listed in parallel. Values
+                above 1 overlap listing round-trips on network mounts
+                (NFS/SMB); file order is then not deterministic.
         """
         self.root_dir = Path(root_dir).resolve()
         self.recursive = recursive
@@ -116,23 +168,26 @@ class FileScanner:
         self.include_hidden = include_hidden
         self.min_size_bytes = min_size_bytes
         self.max_size_bytes = max_size_bytes
+        self.max_workers = max(1, max_workers)
         
         # Initialize path adapter for file operations
         self.path_adapter = get_path_adapter(f"file://{self.root_dir}")
         
         # Normalize extensions (lowercase, with dot)
         self.allowed_extensions = (
-            {ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
-             for ext in allowed_extensions}
+            frozenset(ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
+                      for ext in allowed_extensions)
             if allowed_extensions else None
         )
         
-        self.excluded_extensions = (
-            {ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
-             for ext in excluded_extensions}
-            if excluded_extensions else set()
+        self.excluded_extensions = frozenset(
+            ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
+            for ext in excluded_extensions or ()
         )
         
+        # Without size limits the filters only need the file name
+        self._has_size_filter = self.min_size_bytes > 0 or self.max_size_bytes > 0
+        
         # Validation
         if not self.root_dir.exists():
             raise ScanError(f"Root directory does not exist: {self.root_dir}")
@@ -146,36 +201,39 @@ class FileScanner:
             f"extensions={self.allowed_extensions or 'all'}"
         )
     
-    def _is_hidden(self, path: Path) -> bool:
+    def _is_hidden(self, path: Path | os.DirEntry) -> bool:
         """
         Check if file or directory is hidden.
         
         Args:
-            path: Path to check
+            path: Path or directory entry to check
             
         Returns:
             True if path starts with dot (hidden)
         """
         return path.name.startswith('.')
     
-    def _should_skip_file(self, file_path: Path) -> bool:
+    def _should_skip_name(self, entry: os.DirEntry) -> bool:
         """
-        Check if file should be skipped based on filters.
+        Check the filters that only need the file name (hidden, extensions).
         
         Args:
-            file_path: File path to check
+            entry: Directory entry of the file to check
             
         Returns:
             True if file should be skipped
         """
         # Skip hidden files if not included
-        if not self.include_hidden and self._is_hidden(file_path):
-            logger.debug(f"Skipping hidden file: {file_path.name}")
+        if not self.include_hidden and self._is_hidden(entry):
+            logger.debug(f"Skipping hidden file: {entry.name}")
             return True
         
+        if self.allowed_extensions is None and not self.excluded_extensions:
+            return False
+        
         # Check extension whitelist
-        extension = file_path.suffix.lower()
-        if self.allowed_extensions and extension not in self.allowed_extensions:
+        extension = _extension(entry.name)
+        if self.allowed_extensions is not None and extension not in self.allowed_extensions:
             logger.debug(f"Skipping non-whitelisted extension: {extension}")
             return True
         
@@ -184,30 +242,41 @@ class FileScanner:
             logger.debug(f"Skipping blacklisted extension: {extension}")
             return True
         
-        # Check file size
-        try:
-            size = file_path.stat().st_size
-            
-            if self.min_size_bytes > 0 and size < self.min_size_bytes:
-                logger.debug(f"Skipping small file: {file_path.name} ({size} bytes)")
-                return True
+        return False
+    
+    def _should_skip_size(self, entry: os.DirEntry, st: os.stat_result) -> bool:
+        """
+        Check the size limits.
+        
+        Args:
+            entry: Directory entry of the file to check
+            st: Stat result of the file
             
-            if self.max_size_bytes > 0 and size > self.max_size_bytes:
-                logger.debug(f"Skipping large file: {file_path.name} ({size} bytes)")
-                return True
+        Returns:
+            True if file should be skipped
+        """
+        if not self._has_size_filter:
+            return False
         
-        except Exception as e:
-            logger.warning(f"Failed to check file size: {file_path} - {e}")
+        size = st.st_size
+        
+        if self.min_size_bytes > 0 and size < self.min_size_bytes:
+            logger.debug(f"Skipping small file: {entry.name} ({size} bytes)")
+            return True
+        
+        if self.max_size_bytes > 0 and size > self.max_size_bytes:
+            logger.debug(f"Skipping large file: {entry.name} ({size} bytes)")
             return True
         
         return False
     
-    def _extract_metadata(self, file_path: Path) -> FileMetadata:
+    def _extract_metadata(self, entry: os.DirEntry, st: os.stat_result) -> FileMetadata:
         """
         Extract file metadata.
         
         Args:
-            file_path: Path to file
+            entry: Directory entry of the file
+            st: Stat result of the file
             
         Returns:
             FileMetadata object
@@ -216,12 +285,11 @@ class FileScanner:
             ScanError: If metadata extraction fails
         """
         try:
-            stat = file_path.stat()
+            # Detect MIME type (from the last suffix only)
+            extension = _extension(entry.name)
             
-            # Detect MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type is None:
-                mime_type = 'application/octet-stream'
+            # Path objects are only built for files that are kept
+            file_path = Path(entry.path)
             
             # Calculate relative path
             try:
@@ -231,62 +299,78 @@ class FileScanner:
             
             metadata = FileMetadata(
                 path=file_path,
-                filename=file_path.name,
-                extension=file_path.suffix.lower(),
-                size_bytes=stat.st_size,
-                mime_type=mime_type,
-                modified_at=datetime.fromtimestamp(stat.st_mtime),
-                is_hidden=self._is_hidden(file_path),
+                filename=entry.name,
+                extension=extension,
+                size_bytes=st.st_size,
+                mime_type=_mime_for_ext(extension),
+                modified_at=datetime.fromtimestamp(st.st_mtime),
+                is_hidden=self._is_hidden(entry),
                 relative_path=relative_path,
             )
             
-            logger.debug(f"Extracted metadata: {file_path.name} ({metadata.size_bytes} bytes)")
+            logger.debug(f"Extracted metadata: {entry.name} ({metadata.size_bytes} bytes)")
             return metadata
         
         except Exception as e:
-            raise ScanError(f"Failed to extract metadata from {file_path}: {e}") from e
+            raise ScanError(f"Failed to extract metadata from {entry.path}: {e}") from e
     
-    def _scan_directory(self, directory: Path) -> Iterator[FileMetadata]:
+    def _scan_entries(self, directory: Path | str, subdirs: List[str]) -> Iterator[_ScannedEntry]:
         """
         Scan a single directory (non-recursive).
         
         Args:
             directory: Directory to scan
+            subdirs: Receives the subdirectories to visit next (recursive scans)
             
         Yields:
-            FileMetadata objects for each valid file
+            (entry, stat result) pairs for each valid file
         """
         try:
-            for entry in directory.iterdir():
-                # Skip hidden directories if not included
-                if entry.is_dir() and not self.include_hidden and self._is_hidden(entry):
-                    continue
-                
-                # Handle symlinks
-                if entry.is_symlink():
-                    if not self.follow_symlinks:
-                        logger.debug(f"Skipping symlink: {entry}")
-                        continue
-                    
-                    # Check if symlink target exists
-                    try:
-                        entry.stat()
-                    except Exception as e:
-                        logger.warning(f"Broken symlink: {entry} - {e}")
-                        continue
-                
-                # Process files
-                if entry.is_file():
-                    if not self._should_skip_file(entry):
+            # os.scandir: entry types (and stat on Windows) come from the
+            # directory listing itself, no extra syscall per check
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Classify each entry once: d_type from the listing, or the
+                    # target's stat for a followed symlink
+                    st = None
+                    if entry.is_symlink():
+                        if not self.follow_symlinks:
+                            logger.debug(f"Skipping symlink: {entry.path}")
+                            continue
+                        
+                        # Check if symlink target exists
                         try:
-                            metadata = self._extract_metadata(entry)
-                            yield metadata
-                        except ScanError as e:
-                            logger.error(f"Metadata extraction failed: {e}")
-                
-                # Recurse into subdirectories
-                elif entry.is_dir() and self.recursive:
-                    yield from self._scan_directory(entry)
+                            st = entry.stat()
+                        except OSError as e:
+                            logger.warning(f"Broken symlink: {entry.path} - {e}")
+                            continue
+                        is_dir = S_ISDIR(st.st_mode)
+                        is_file = S_ISREG(st.st_mode)
+                    else:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        is_file = not is_dir and entry.is_file(follow_symlinks=False)
+                    
+                    # Subdirectories are visited by the caller (hidden ones if included)
+                    if is_dir:
+                        if self.recursive and (self.include_hidden or not self._is_hidden(entry)):
+                            subdirs.append(entry.path)
+                    
+                    # Process files
+                    elif is_file:
+                        # Name filters first: rejected files are never stat'ed
+                        if self._should_skip_name(entry):
+                            continue
+                        
+                        # One stat per kept file, shared by the size filter and the metadata
+                        if st is None:
+                            try:
+                                st = entry.stat(follow_symlinks=False)
+                            except OSError as e:
+                                logger.warning(f"Failed to stat file: {entry.path} - {e}")
+                                continue
+                        
+                        if not self._should_skip_size(entry, st):
+                            yield entry, st
         
         except PermissionError as e:
             logger.warning(f"Permission denied: {directory} - {e}")
@@ -294,6 +378,105 @@ class FileScanner:
         except Exception as e:
             logger.error(f"Error scanning directory {directory}: {e}")
     
+    def _scan_directory(self, directory: Path | str) -> Iterator[_ScannedEntry]:
+        """
+        Scan a directory and, if recursive, its subdirectories (depth-first).
+        
+        Uses an explicit stack rather than recursion: no generator chain
+        per level, no recursion limit on deep trees.
+        
+        Args:
+            directory: Directory to scan
+            
+        Yields:
+            (entry, stat result) pairs for each valid file
+        """
+        stack: List[Path | str] = [directory]
+        while stack:
+            subdirs: List[str] = []
+            yield from self._scan_entries(stack.pop(), subdirs)
+            # Reversed so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+    
+    def _list_directory(self, directory: Path | str) -> tuple[List[_ScannedEntry], List[str]]:
+        """Files and subdirectories of one directory (parallel scan worker)."""
+        subdirs: List[str] = []
+        files = list(self._scan_entries(directory, subdirs))
+        return files, subdirs
+    
+    def _scan_parallel(self) -> Iterator[_ScannedEntry]:
+        """
+        Scan the tree with max_workers directories listed concurrently.
+        
+        Each listed directory submits its subdirectories; the caller's thread
+        yields files as directories complete.
+        
+        Yields:
+            (entry, stat result) pairs for each valid file
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="indexao-scan")
+        try:
+            pending = {executor.submit(self._list_directory, self.root_dir)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    pending.update(executor.submit(self._list_directory, d) for d in subdirs)
+                    yield from files
+        finally:
+            # Consumer may stop early: drop directories not listed yet
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _scan_rs(self) -> Iterator[_ScannedEntry]:
+        """
+        Scan the tree with scandir-rs (multi-threaded walker in Rust).
+        
+        With ReturnType.Ext, entries carry their stat fields, so no stat
+        call is made from Python. Entry paths are relative to the root.
+        Symlinks are skipped (only used when they are not followed).
+        
+        Yields:
+            (entry, stat fields) pairs for each valid file
+        """
+        root = str(self.root_dir)
+        walker = RsScandir(
+            root,
+            skip_hidden=not self.include_hidden,
+            return_type=RsReturnType.Ext,
+        )
+        for rs_entry in walker:
+            if rs_entry.is_symlink or not rs_entry.is_file:
+                continue
+            
+            path = os.path.join(root, rs_entry.path)
+            entry = _RsEntry(os.path.basename(path), path)
+            st = _RsStat(rs_entry.st_size, rs_entry.mtime)
+            if self._should_skip_name(entry) or self._should_skip_size(entry, st):
+                continue
+            yield entry, st
+    
+    def _walk_entries(self) -> Iterator[_ScannedEntry]:
+        """
+        Scan from the root with the fastest available backend.
+        
+        scandir-rs when installed (recursive scans without followed
+        symlinks), otherwise os.scandir, in parallel when max_workers > 1.
+        """
+        if self.recursive:
+            if SCANDIR_RS_AVAILABLE and not self.follow_symlinks:
+                return self._scan_rs()
+            if self.max_workers > 1:
+                return self._scan_parallel()
+        return self._scan_directory(self.root_dir)
+    
+    def _walk(self) -> Iterator[FileMetadata]:
+        """Scan from the root and build the metadata of each kept file."""
+        for entry, st in self._walk_entries():
+            try:
+                yield self._extract_metadata(entry, st)
+            except ScanError as e:
+                logger.error(f"Metadata extraction failed: {e}")
+    
     def scan(self) -> List[FileMetadata]:
         """
         Scan root directory and return all matching files.
@@ -304,7 +487,7 @@ class FileScanner:
         logger.info(f"Starting scan: {self.root_dir}")
         start_time = datetime.now()
         
-        files = list(self._scan_directory(self.root_dir))
+        files = list(self._walk())
         
         duration = (datetime.now() - start_time).total_seconds()
         logger.info(
@@ -324,7 +507,7 @@ class FileScanner:
             FileMetadata objects as files are discovered
         """
         logger.info(f"Starting streaming scan: {self.root_dir}")
-        yield from self._scan_directory(self.root_dir)
+        yield from self._walk()
     
     def count(self) -> int:
         """
@@ -334,10 +517,44 @@ class FileScanner:
             Number of files that match filters
         """
         count = 0
-        for _ in self._scan_directory(self.root_dir):
+        for _ in self._walk_entries():
             count += 1
         return count
     
+    def scan_columns(self) -> Dict[str, Any]:
+        """
+        Scan root directory and return the files as columns.
+        
+        No FileMetadata is built: each kept file appends its fields to
+        parallel columns (sizes and mtimes in typed arrays), for consumers
+        that only need a few fields of many files.
+        
+        Returns:
+            Dictionary with 'paths', 'extensions', 'mime_types' (lists of str),
+            'sizes' (array of int64) and 'mtimes' (array of float, epoch seconds)
+        """
+        paths: List[str] = []
+        extensions: List[str] = []
+        mime_types: List[str] = []
+        sizes = array.array('q')
+        mtimes = array.array('d')
+        
+        for entry, st in self._walk_entries():
+            extension = _extension(entry.name)
+            paths.append(entry.path)
+            extensions.append(extension)
+            mime_types.append(_mime_for_ext(extension))
+            sizes.append(st.st_size)
+            mtimes.append(st.st_mtime)
+        
+        return {
+            'paths': paths,
+            'extensions': extensions,
+            'mime_types': mime_types,
+            'sizes': sizes,
+            'mtimes': mtimes,
+        }
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get scan summary with statistics.
@@ -345,28 +562,25 @@ class FileScanner:
         Returns:
             Dictionary with scan statistics
         """
-        files = self.scan()
-        
-        # Calculate statistics
-        total_size = sum(f.size_bytes for f in files)
-        extensions = {}
-        mime_types = {}
-        
-        for file in files:
-            # Count extensions
-            ext = file.extension or '(no extension)'
-            extensions[ext] = extensions.get(ext, 0) + 1
-            
-            # Count MIME types
-            mime_types[file.mime_type] = mime_types.get(file.mime_type, 0) + 1
+        # Single streaming pass: the file list is never materialized
+        total_files = 0
+        total_size = 0
+        extensions: Counter = Counter()
+        mime_types: Counter = Counter()
+        
+        for file in self._walk():
+            total_files += 1
+            total_size += file.size_bytes
+            extensions[file.extension or '(no extension)'] += 1
+            mime_types[file.mime_type] += 1
         
         return {
             'root_dir': str(self.root_dir),
-            'total_files': len(files),
+            'total_files': total_files,
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'extensions': extensions,
-            'mime_types': mime_types,
+            'extensions': dict(extensions),
+            'mime_types': dict(mime_types),
             'filters': {
                 'recursive': self.recursive,
                 'include_hidden': self.include_hidden,
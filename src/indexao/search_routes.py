@@ -7,7 +7,7 @@ from fastapi import APIRouter, Query, HTTPException
 from typing import Optional
 import logging
 
-from .adapters.search import MeilisearchAdapter
+from .adapters.search import MeilisearchAdapter, get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,8 @@ def initialize_search_adapter(host: str = "http://localhost:7700", api_key: Opti
         _search_adapter = MeilisearchAdapter(
             host=host,
             api_key=api_key,
-            index_name=index_name
+            index_name=index_name,
+            client=get_shared_client(host, api_key)
         )
         logger.info(f"✓ Search adapter initialized (Meilisearch at {host})")
     except Exception as e:
@@ -157,21 +158,18 @@ async def clear_index():
     try:
         adapter = get_search_adapter()
         
-        # Delete all documents
-        all_docs = adapter.search(query="", limit=10000)
-        
-        deleted_count = 0
-        for doc in all_docs:
-            doc_id = doc.doc_id if hasattr(doc, 'doc_id') else None
-            if doc_id:
-                adapter.delete_document(doc_id)
-                deleted_count += 1
+        # One delete-all task instead of a request per document
+        deleted_count = adapter.count_documents()
+        if not adapter.clear_index():
+            raise HTTPException(status_code=500, detail="Failed to clear index")
         
         return {
             "status": "success",
             "deleted_documents": deleted_count
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to clear index: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -8,12 +8,16 @@ Author: Indexao Team
 License: MIT
 """
 
+import errno
 import hashlib
 import mimetypes
+import mmap
+import os
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import BinaryIO, Optional, Dict, Any, List
 from uuid import uuid4
 
 from .config import Config
@@ -22,6 +26,54 @@ from .paths import get_path_adapter, FileInfo
 
 logger = get_logger(__name__)
 
+# Files at least this large are hashed through a memory map (no copy
+# into a userspace read buffer)
+MMAP_CHECKSUM_MIN_BYTES = 1024 * 1024
+
+
+def _checksum_open_file(f: BinaryIO, size_bytes: int) -> str:
+    """
+    Calculate SHA256 checksum of an open file (from its start).
+    
+    Args:
+        f: File opened in binary mode
+        size_bytes: File size in bytes (from fstat)
+        
+    Returns:
+        Hexadecimal SHA256 checksum
+    """
+    if size_bytes >= MMAP_CHECKSUM_MIN_BYTES:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mm).hexdigest()
+    # Streamed in C (OpenSSL, SHA-NI when available), no Python read loop
+    return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def file_checksum(file_path: Path) -> str:
+    """
+    Calculate SHA256 checksum of a file.
+    
+    The one content digest of the project: upload checksums and the content
+    hashes of both processing pipelines use it, so their values compare.
+    
+    Args:
+        file_path: Path to file
+        
+    Returns:
+        Hexadecimal SHA256 checksum
+    """
+    with open(file_path, 'rb') as f:
+        return _checksum_open_file(f, os.fstat(f.fileno()).st_size)
+
+
+@lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> str:
+    """MIME type for a lowercase extension (memoized per extension)."""
+    mime_type, _ = mimetypes.guess_type('x' + ext)
+    return mime_type or 'application/octet-stream'
+
 
 class UploadError(Exception):
     """Base exception for upload-related errors."""
@@ -106,11 +158,27 @@ class UploadHandler:
             InvalidFileTypeError: If file extension not allowed
         """
         # Check file exists
-        if not file_path.exists():
-            raise UploadError(f"File not found: {file_path}")
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            raise UploadError(f"File not found: {file_path}") from None
         
+        self._check_size_and_type(file_path, st.st_size)
+    
+    def _check_size_and_type(self, file_path: Path, size_bytes: int) -> None:
+        """
+        Validate size and extension of a file already stat'ed.
+        
+        Args:
+            file_path: Path to uploaded file
+            size_bytes: File size in bytes
+            
+        Raises:
+            FileTooLargeError: If file exceeds size limit
+            InvalidFileTypeError: If file extension not allowed
+        """
         # Check file size
-        size_mb = file_path.stat().st_size / (1024 * 1024)
+        size_mb = size_bytes / (1024 * 1024)
         if size_mb > self.max_size_mb:
             raise FileTooLargeError(
                 f"File too large: {size_mb:.2f}MB "
@@ -147,13 +215,7 @@ class UploadHandler:
         Returns:
             Hexadecimal SHA256 checksum
         """
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        
-        checksum = sha256.hexdigest()
+        checksum = file_checksum(file_path)
         logger.debug(f"Calculated checksum: {checksum[:16]}...")
         return checksum
     
@@ -167,25 +229,34 @@ class UploadHandler:
         Returns:
             MIME type string (e.g., 'text/plain', 'image/jpeg')
         """
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if mime_type is None:
-            mime_type = 'application/octet-stream'
+        mime_type = _mime_for_ext(Path(file_path).suffix.lower())
         
         logger.debug(f"Detected MIME type: {mime_type}")
         return mime_type
     
-    def extract_metadata(self, file_path: Path, doc_id: str) -> Dict[str, Any]:
+    def extract_metadata(
+        self,
+        file_path: Path,
+        doc_id: str,
+        stat: Optional[os.stat_result] = None,
+        checksum: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Extract metadata from uploaded file.
         
         Args:
             file_path: Path to uploaded file
             doc_id: Document ID
+            stat: Stat result of the file, if already known
+            checksum: SHA256 checksum of the file, if already computed
             
         Returns:
             Dictionary with file metadata
         """
-        stat = file_path.stat()
+        if stat is None:
+            stat = file_path.stat()
+        if checksum is None:
+            checksum = self.calculate_checksum(file_path)
         
         metadata = {
             'document_id': doc_id,
@@ -193,7 +264,7 @@ class UploadHandler:
             'extension': file_path.suffix.lower(),
             'size_bytes': stat.st_size,
             'mime_type': self.detect_mime_type(file_path),
-            'checksum': self.calculate_checksum(file_path),
+            'checksum': checksum,
             'uploaded_at': datetime.now().isoformat(),
             'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
             'status': 'pending',
@@ -225,8 +296,14 @@ class UploadHandler:
         queue_filename = f"{doc_id}_{file_path.name}"
         queue_path = self.queue_dir / queue_filename
         
-        # Move file to queue
-        shutil.move(str(file_path), str(queue_path))
+        # Move file to queue: a single rename when on the same filesystem,
+        # copy + delete (shutil.move) across filesystems
+        try:
+            os.replace(file_path, queue_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(file_path), str(queue_path))
         
         logger.info(f"File moved to queue: {queue_path.name}")
         return queue_path
@@ -246,6 +323,9 @@ class UploadHandler:
         4. Move to processing queue
         5. Return upload result
         
+        The file is opened once: validation uses its fstat and the
+        checksum is computed over the same descriptor.
+        
         Args:
             file_path: Path to uploaded file (temporary location)
             original_filename: Original filename (if different from file_path)
@@ -265,14 +345,22 @@ class UploadHandler:
             
             logger.info(f"Processing upload: {display_name}")
             
-            # Step 1: Validate file
-            self.validate_file(file_path)
+            try:
+                f = open(file_path, 'rb')
+            except FileNotFoundError:
+                raise UploadError(f"File not found: {file_path}") from None
+            
+            with f:
+                # Step 1: Validate file
+                st = os.fstat(f.fileno())
+                self._check_size_and_type(file_path, st.st_size)
+                checksum = _checksum_open_file(f, st.st_size)
             
             # Step 2: Generate document ID
             doc_id = self.generate_document_id()
             
             # Step 3: Extract metadata
-            metadata = self.extract_metadata(file_path, doc_id)
+            metadata = self.extract_metadata(file_path, doc_id, stat=st, checksum=checksum)
             metadata['original_filename'] = display_name
             
             # Step 4: Move to queue
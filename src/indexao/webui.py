@@ -10,6 +10,8 @@ Features:
 """
 
 import os
+import importlib.util
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -25,52 +27,30 @@ from indexao.config import load_config, get_config, Config
 from indexao.logger import get_logger
 from indexao.upload_handler import UploadHandler, UploadError
 from indexao.scanner import FileScanner, scan_directory
-from indexao.processor import DocumentProcessor, ProcessingStatus
+from indexao.processor import DocumentProcessor, summarize_results
 from indexao.database import DocumentDatabase
 from indexao.models.document import ProcessingStatus as DocStatus
 from indexao.framework_manager import get_framework_manager
 from indexao.plugin_manager import PluginManager
-from indexao.plugin_routes import router as plugin_router, set_plugin_manager
+from indexao.plugin_routes import router as plugin_router
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Create FastAPI app
-app = FastAPI(
-    title="Indexao Web UI",
-    description="Simple web interface for document indexing",
-    version="0.1.0"
+# Shared Meilisearch HTTP pool: 32 connections is where the backend saturates,
+# beyond that requests wait in the pool instead of overloading Meilisearch
+MEILI_HTTP_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=60
 )
+# HTTP/2 multiplexing needs the optional 'h2' package (httpx[http2])
+MEILI_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
-# Templates directory
-TEMPLATES_DIR = Path(__file__).parent / "templates"
-STATIC_DIR = Path(__file__).parent / "static"
-
-# Create directories if they don't exist
-TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
-STATIC_DIR.mkdir(parents=True, exist_ok=True)
-
-# Setup templates
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
-
-# Mount static files (CSS, JS, images)
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
-
-# Include plugin routes
-app.include_router(plugin_router)
-
-# Include pipeline routes
-from indexao.pipeline.routes import router as pipeline_router
-app.include_router(pipeline_router)
 
-# Include search routes
-from indexao.search_routes import router as search_router
-app.include_router(search_router)
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize configuration on startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize configuration and shared services on startup."""
     try:
         logger.info("Starting Indexao Web UI...")
         config = load_config()
@@ -88,8 +68,8 @@ async def startup_event():
         app.state.processor = DocumentProcessor(config, app.state.upload_handler)
         
         # Initialize plugin manager (empty config for now, will read from TOML later)
+        # Handlers get it through Depends(get_plugin_manager), no module global
         app.state.plugin_manager = PluginManager({})
-        set_plugin_manager(app.state.plugin_manager)
         
         # Auto-load mock adapters for initial state
         try:
@@ -101,9 +81,11 @@ async def startup_event():
             logger.warning(f"Failed to load mock adapters: {e}")
         
         # Initialize pipeline with real adapters (MVP: Tesseract + Meilisearch)
+        # Handlers get it through Depends(get_processor), no module global
+        app.state.pipeline_processor = None
         try:
             from indexao.pipeline.routes import initialize_processor
-            initialize_processor(use_real_adapters=True)
+            app.state.pipeline_processor = initialize_processor(use_real_adapters=True)
             logger.info("✓ Pipeline processor initialized (Tesseract + Meilisearch)")
         except Exception as e:
             logger.warning(f"Failed to initialize pipeline: {e}")
@@ -121,10 +103,58 @@ async def startup_event():
         except Exception as e:
             logger.warning(f"Failed to initialize search API: {e}")
         
+        # Shared client for the Meilisearch proxy routes (keep-alive reuse)
+        app.state.meili_http = httpx.AsyncClient(
+            base_url=f"http://{config.plugins.search.host}:{config.plugins.search.port}",
+            headers={"Authorization": f"Bearer {config.plugins.search.api_key}"},
+            limits=MEILI_HTTP_LIMITS,
+            http2=MEILI_HTTP2_AVAILABLE,
+            timeout=30.0
+        )
+        
         logger.info("✓ Web UI ready")
     except Exception as e:
         logger.error(f"Failed to start Web UI: {e}")
         raise
+    
+    yield
+    
+    app.state.processor.close()
+    await app.state.meili_http.aclose()
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="Indexao Web UI",
+    description="Simple web interface for document indexing",
+    version="0.1.0",
+    lifespan=lifespan
+)
+
+# Templates directory
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Create directories if they don't exist
+TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
+STATIC_DIR.mkdir(parents=True, exist_ok=True)
+
+# Setup templates
+templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+# Mount static files (CSS, JS, images)
+app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+
+# Include plugin routes
+app.include_router(plugin_router)
+
+# Include pipeline routes
+from indexao.pipeline.routes import router as pipeline_router
+app.include_router(pipeline_router)
+
+# Include search routes
+from indexao.search_routes import router as search_router
+app.include_router(search_router)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -463,15 +493,15 @@ async def process_documents() -> Dict[str, Any]:
         results_data = [r.to_dict() for r in results]
         
         # Count successes and failures
-        completed = sum(1 for r in results if r.status == ProcessingStatus.COMPLETED)
-        failed = sum(1 for r in results if r.status == ProcessingStatus.FAILED)
+        summary = summarize_results(results)
         
         return {
             "status": "success",
             "message": f"Processed {len(results)} documents",
-            "processed": len(results),
-            "completed": completed,
-            "failed": failed,
+            "processed": summary["processed"],
+            "completed": summary["completed"],
+            "failed": summary["failed"],
+            "needs_review": summary["needs_review"],
             "results": results_data
         }
     
@@ -704,18 +734,12 @@ async def get_statistics() -> Dict[str, Any]:
 # =============================================================================
 
 @app.get("/api/meilisearch/indexes")
-async def meilisearch_list_indexes():
+async def meilisearch_list_indexes(request: Request):
     """List all Meilisearch indexes."""
-    config = get_config()
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://{config.plugins.search.host}:{config.plugins.search.port}/indexes",
-                headers={"Authorization": f"Bearer {config.plugins.search.api_key}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await request.app.state.meili_http.get("/indexes")
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(f"Error listing Meilisearch indexes: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -724,8 +748,6 @@ async def meilisearch_list_indexes():
 @app.post("/api/meilisearch/indexes")
 async def meilisearch_create_index(request: Request):
     """Create a new Meilisearch index."""
-    config = get_config()
-    
     try:
         body = await request.json()
         uid = body.get("uid")
@@ -738,14 +760,9 @@ async def meilisearch_create_index(request: Request):
         if primaryKey:
             payload["primaryKey"] = primaryKey
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"http://{config.plugins.search.host}:{config.plugins.search.port}/indexes",
-                json=payload,
-                headers={"Authorization": f"Bearer {config.plugins.search.api_key}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await request.app.state.meili_http.post("/indexes", json=payload)
+        response.raise_for_status()
+        return response.json()
     except HTTPException:
         raise
     except Exception as e:
@@ -754,36 +771,24 @@ async def meilisearch_create_index(request: Request):
 
 
 @app.get("/api/meilisearch/indexes/{index_uid}")
-async def meilisearch_get_index(index_uid: str):
+async def meilisearch_get_index(index_uid: str, request: Request):
     """Get Meilisearch index details."""
-    config = get_config()
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://{config.plugins.search.host}:{config.plugins.search.port}/indexes/{index_uid}",
-                headers={"Authorization": f"Bearer {config.plugins.search.api_key}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await request.app.state.meili_http.get(f"/indexes/{index_uid}")
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(f"Error getting Meilisearch index {index_uid}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/meilisearch/indexes/{index_uid}")
-async def meilisearch_delete_index(index_uid: str):
+async def meilisearch_delete_index(index_uid: str, request: Request):
     """Delete a Meilisearch index."""
-    config = get_config()
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"http://{config.plugins.search.host}:{config.plugins.search.port}/indexes/{index_uid}",
-                headers={"Authorization": f"Bearer {config.plugins.search.api_key}"}
-            )
-            response.raise_for_status()
-            return {"status": "success", "message": f"Index {index_uid} deleted"}
+        response = await request.app.state.meili_http.delete(f"/indexes/{index_uid}")
+        response.raise_for_status()
+        return {"status": "success", "message": f"Index {index_uid} deleted"}
     except Exception as e:
         logger.error(f"Error deleting Meilisearch index {index_uid}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -792,31 +797,27 @@ async def meilisearch_delete_index(index_uid: str):
 @app.patch("/api/meilisearch/indexes/{index_uid}")
 async def meilisearch_update_index(index_uid: str, request: Request):
     """Update Meilisearch index settings (searchable/filterable attributes)."""
-    config = get_config()
-    
     try:
         body = await request.json()
+        client: httpx.AsyncClient = request.app.state.meili_http
         
-        async with httpx.AsyncClient() as client:
-            # Update searchable attributes if provided
-            if "searchableAttributes" in body:
-                response = await client.patch(
-                    f"http://{config.plugins.search.host}:{config.plugins.search.port}/indexes/{index_uid}/settings/searchable-attributes",
-                    json=body["searchableAttributes"],
-                    headers={"Authorization": f"Bearer {config.plugins.search.api_key}"}
-                )
-                response.raise_for_status()
-            
-            # Update filterable attributes if provided
-            if "filterableAttributes" in body:
-                response = await client.patch(
-                    f"http://{config.plugins.search.host}:{config.plugins.search.port}/indexes/{index_uid}/settings/filterable-attributes",
-                    json=body["filterableAttributes"],
-                    headers={"Authorization": f"Bearer {config.plugins.search.api_key}"}
-                )
-                response.raise_for_status()
-            
-            return {"status": "success", "message": f"Index {index_uid} updated"}
+        # Update searchable attributes if provided
+        if "searchableAttributes" in body:
+            response = await client.patch(
+                f"/indexes/{index_uid}/settings/searchable-attributes",
+                json=body["searchableAttributes"]
+            )
+            response.raise_for_status()
+        
+        # Update filterable attributes if provided
+        if "filterableAttributes" in body:
+            response = await client.patch(
+                f"/indexes/{index_uid}/settings/filterable-attributes",
+                json=body["filterableAttributes"]
+            )
+            response.raise_for_status()
+        
+        return {"status": "success", "message": f"Index {index_uid} updated"}
     except Exception as e:
         logger.error(f"Error updating Meilisearch index {index_uid}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1014,21 +1015,35 @@ async def check_framework_updates():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    reload: bool = False,
+    workers: int = 1
+):
     """
     Run the web server.
     
+    uvicorn picks uvloop and httptools on its own when they are installed
+    (uvicorn[standard]); they are faster than the stdlib asyncio loop and
+    h11 on accept/response paths.
+    
     Args:
         host: Host to bind to
         port: Port to bind to
-        reload: Enable auto-reload on code changes
+        reload: Enable auto-reload on code changes (forces a single worker)
+        workers: Number of worker processes. Each worker holds its own
+                 pipeline processor, job registry and stats cache, so job
+                 polling must hit the worker that started the job.
     """
-    logger.info(f"Starting web server on http://{host}:{port}")
+    logger.info(f"Starting web server on http://{host}:{port} ({workers} worker(s))")
     uvicorn.run(
         "indexao.webui:app",
         host=host,
         port=port,
         reload=reload,
+        workers=1 if reload else workers,
+        backlog=2048,
         log_level="info"
     )
 
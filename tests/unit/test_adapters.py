@@ -136,6 +136,15 @@ class TestTranslatorAdapter:
         
         assert result.translated_text == "Hello"  # Not reversed
     
+    def test_mock_translator_translate_multi(self):
+        """Test mock translator translates one text to several languages."""
+        mock = MockTranslatorAdapter(reverse_text=True)
+        results = mock.translate_multi("Hello", target_languages=["fr", "zh"])
+        
+        assert list(results) == ["fr", "zh"]
+        assert results["zh"].translated_text == "olleH"
+        assert results["zh"].target_language == "zh"
+    
     def test_mock_translator_unsupported_language(self):
         """Test mock translator rejects unsupported language."""
         mock = MockTranslatorAdapter()
@@ -0,0 +1,125 @@
+"""Unit tests for indexao.pipeline.document_processor module."""
+
+import pytest
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from indexao.adapters.ocr import MockOCRAdapter
+from indexao.adapters.search import MockSearchAdapter
+from indexao.pipeline.document_processor import DocumentProcessor, compile_filter_pattern
+
+
+@pytest.fixture
+def processor():
+    """DocumentProcessor wired to mock adapters."""
+    return DocumentProcessor(ocr_adapter=MockOCRAdapter(), search_adapter=MockSearchAdapter())
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    """Directory with a few supported and unsupported files."""
+    (tmp_path / "a.pdf").write_bytes(b"%PDF-a")
+    (tmp_path / "b.png").write_bytes(b"png-b")
+    (tmp_path / "notes.txt").write_text("ignored")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "c.pdf").write_bytes(b"%PDF-c")
+    return tmp_path
+
+
+class TestCompileFilterPattern:
+    """Test filter pattern validation."""
+
+    def test_matches_file_name(self):
+        """Test glob semantics on file names."""
+        pattern = compile_filter_pattern("*.pdf")
+        assert pattern.match("invoice.pdf")
+        assert not pattern.match("invoice.png")
+
+    @pytest.mark.parametrize("bad", ["", "sub/*.pdf"])
+    def test_rejects_invalid_patterns(self, bad):
+        """Test empty patterns and path separators are rejected."""
+        with pytest.raises(ValueError):
+            compile_filter_pattern(bad)
+
+
+class TestCollectFiles:
+    """Test file collection."""
+
+    def test_collect_recursive(self, processor, docs_dir):
+        """Test supported files are collected recursively."""
+        files = processor._collect_files(docs_dir, recursive=True)
+        assert [f.name for f in files] == ["a.pdf", "b.png", "c.pdf"]
+
+    def test_collect_non_recursive(self, processor, docs_dir):
+        """Test sub-directories are skipped when not recursive."""
+        files = processor._collect_files(docs_dir, recursive=False)
+        assert [f.name for f in files] == ["a.pdf", "b.png"]
+
+    def test_collect_with_pattern(self, processor, docs_dir):
+        """Test compiled pattern filters file names."""
+        files = processor._collect_files(docs_dir, pattern_re=compile_filter_pattern("*.pdf"))
+        assert [f.name for f in files] == ["a.pdf", "c.pdf"]
+
+    def test_process_directory_with_filter(self, processor, docs_dir):
+        """Test process_directory accepts a raw glob pattern."""
+        results = processor.process_directory(docs_dir, filter_pattern="*.png")
+        assert results["total"] == 1
+        assert results["succeeded"] == 1
+
+
+class TestProcessFiles:
+    """Test explicit file list processing."""
+
+    def test_process_files_reports_progress(self, processor, docs_dir):
+        """Test each file is processed and progress is reported."""
+        progress = []
+        files = [docs_dir / "a.pdf", docs_dir / "b.png"]
+
+        results = processor.process_files(files, progress_callback=progress.append)
+
+        assert results["total"] == 2
+        assert results["succeeded"] == 2
+        assert [p["processed"] for p in progress] == [1, 2]
+
+    def test_process_files_skips_indexed(self, processor, docs_dir):
+        """Test already indexed files are skipped."""
+        files = [docs_dir / "a.pdf"]
+        processor.process_files(files)
+
+        results = processor.process_files(files)
+        assert results["skipped"] == 1
+        assert results["succeeded"] == 0
+
+    def test_process_files_reindexes_changed_content(self, processor, docs_dir):
+        """Test a modified file is processed again."""
+        files = [docs_dir / "a.pdf"]
+        processor.process_files(files)
+
+        (docs_dir / "a.pdf").write_bytes(b"%PDF-a-v2")
+        results = processor.process_files(files)
+        assert results["skipped"] == 0
+        assert results["succeeded"] == 1
+
+
+class TestContentHash:
+    """Test content-hash change detection."""
+
+    def test_unindexed_file_is_changed(self, processor, docs_dir):
+        """Test a file never indexed is reported as changed."""
+        unchanged, content_hash = processor.check_unchanged(docs_dir / "a.pdf")
+        assert unchanged is False
+        assert len(content_hash) == 64
+
+    def test_hash_stored_in_metadata(self, processor, docs_dir):
+        """Test process_file stores the content hash in the index."""
+        path = docs_dir / "a.pdf"
+        assert processor.process_file(path)
+
+        unchanged, content_hash = processor.check_unchanged(path)
+        doc = processor.search.get_document(processor._generate_doc_id(path))
+        assert unchanged is True
+        assert doc.metadata["content_hash"] == content_hash
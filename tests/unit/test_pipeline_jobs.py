@@ -0,0 +1,85 @@
+"""Unit tests for indexao.pipeline.jobs module."""
+
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from indexao.pipeline.jobs import JobStore, JobStatus
+
+
+class TestJobStore:
+    """Test JobStore lifecycle and bounds."""
+
+    def test_create_returns_running_job(self):
+        """Test a new job starts in running state."""
+        store = JobStore()
+        job_id = store.create(kind="directory", target="/data/docs")
+
+        job = store.get(job_id)
+        assert job["status"] == JobStatus.RUNNING
+        assert job["target"] == "/data/docs"
+        assert job["results"] is None
+
+    def test_update_and_finish(self):
+        """Test progress updates and completion."""
+        store = JobStore()
+        job_id = store.create(kind="directory", target="/data/docs")
+
+        store.update(job_id, {"processed": 2, "total": 5})
+        assert store.get(job_id)["progress"] == {"processed": 2, "total": 5}
+
+        store.finish(job_id, {"succeeded": 5})
+        job = store.get(job_id)
+        assert job["status"] == JobStatus.COMPLETED
+        assert job["results"] == {"succeeded": 5}
+
+    def test_fail_records_error(self):
+        """Test failed jobs keep their error message."""
+        store = JobStore()
+        job_id = store.create(kind="directory", target="/data/docs")
+
+        store.fail(job_id, "boom")
+        job = store.get(job_id)
+        assert job["status"] == JobStatus.FAILED
+        assert job["error"] == "boom"
+
+    def test_get_returns_copy(self):
+        """Test callers cannot mutate stored state."""
+        store = JobStore()
+        job_id = store.create(kind="directory", target="/data/docs")
+
+        store.get(job_id)["progress"]["processed"] = 99
+        assert store.get(job_id)["progress"] == {}
+
+    def test_unknown_job(self):
+        """Test unknown IDs are ignored / return None."""
+        store = JobStore()
+        store.update("missing", {"processed": 1})
+        store.finish("missing", {})
+        assert store.get("missing") is None
+
+    def test_evicts_finished_jobs_first(self):
+        """Test the store stays bounded and keeps running jobs."""
+        store = JobStore(max_jobs=2)
+        running = store.create(kind="directory", target="a")
+        done = store.create(kind="directory", target="b")
+        store.finish(done, {})
+
+        newest = store.create(kind="directory", target="c")
+
+        assert len(store) == 2
+        assert store.get(done) is None
+        assert store.get(running) is not None
+        assert store.get(newest) is not None
+
+    def test_revision_increments_on_change(self):
+        """Test each state change bumps the revision used for ETags."""
+        store = JobStore()
+        job_id = store.create(kind="directory", target="/data/docs")
+        assert store.get(job_id)["revision"] == 0
+
+        store.update(job_id, {"processed": 1})
+        store.finish(job_id, {})
+        assert store.get(job_id)["revision"] == 2
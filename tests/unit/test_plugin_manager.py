@@ -0,0 +1,335 @@
+"""Unit tests for indexao.plugin_manager module."""
+
+import gc
+import weakref
+
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from indexao.adapters.ocr import MockOCRAdapter
+from indexao.adapters.search import MockSearchAdapter
+from indexao import plugin_manager
+from indexao.plugin_manager import PluginManager, PluginLoadError, PluginValidationError
+
+
+class IncompleteOCRAdapter:
+    """OCR adapter without process_image."""
+
+    @property
+    def name(self) -> str:
+        return "incomplete"
+
+    @property
+    def supported_languages(self):
+        return ["en"]
+
+
+@pytest.fixture
+def manager():
+    """Empty plugin manager."""
+    return PluginManager()
+
+
+class TestValidateProtocol:
+    """Test adapter protocol validation."""
+
+    def test_valid_adapters(self, manager):
+        """Test mock adapters satisfy their protocols."""
+        assert manager._validate_protocol(MockOCRAdapter, 'ocr') is True
+        assert manager._validate_protocol(MockSearchAdapter, 'search') is True
+
+    def test_missing_methods_reported(self, manager):
+        """Test missing methods are listed in the error."""
+        with pytest.raises(PluginValidationError, match="process_image"):
+            manager._validate_protocol(IncompleteOCRAdapter, 'ocr')
+
+    def test_error_lists_required_methods(self, manager):
+        """Test the error message names the missing and required members."""
+        with pytest.raises(PluginValidationError) as exc_info:
+            manager._validate_protocol(IncompleteOCRAdapter, 'ocr')
+
+        message = str(exc_info.value)
+        assert "missing required methods: process_image" in message
+        assert "Required for ocr: name, process_image, supported_languages" in message
+
+    def test_register_validates(self, manager):
+        """Test register() rejects incomplete adapters."""
+        with pytest.raises(PluginValidationError):
+            manager.register('ocr', 'incomplete', IncompleteOCRAdapter)
+        assert 'incomplete' not in manager.list_available('ocr')
+
+    def test_registry_views_are_live_and_read_only(self, manager):
+        """Test list_available/get_registered reflect later registrations."""
+        available = manager.list_available('ocr')
+        registered = manager.get_registered('ocr')
+
+        manager.register('ocr', 'mock', MockOCRAdapter)
+        assert 'mock' in available
+        assert registered['mock'] is MockOCRAdapter
+        with pytest.raises(TypeError):
+            registered['other'] = MockOCRAdapter
+        assert list(manager.list_available('unknown')) == []
+
+    def test_validation_is_memoized(self, manager, monkeypatch):
+        """Test an already validated class is not checked again."""
+        manager._validate_protocol(MockOCRAdapter, 'ocr')
+
+        monkeypatch.setattr(plugin_manager, '_load_protocol', lambda t: pytest.fail("revalidated"))
+        assert manager._validate_protocol(MockOCRAdapter, 'ocr') is True
+
+
+class TestPluginNames:
+    """Test class name to plugin name conversion."""
+
+    @pytest.mark.parametrize("class_name,expected", [
+        ("MockOCRAdapter", "mock"),
+        ("TesseractAdapter", "tesseract"),
+        ("ChandraOCR", "chandra"),
+        ("GoogleCloudAdapter", "google-cloud"),
+        ("FooEngineAdapter", "foo"),
+        ("XMLParserAdapter", "xmlparser"),
+    ])
+    def test_class_name_to_plugin_name(self, class_name, expected):
+        """Test suffixes are stripped and CamelCase becomes kebab-case."""
+        assert PluginManager._class_name_to_plugin_name(class_name) == expected
+
+
+class TestDiscoverPlugins:
+    """Test plugin auto-discovery."""
+
+    @pytest.fixture
+    def adapters_dir(self, tmp_path):
+        """Adapter tree with one OCR plugin and ignored files."""
+        ocr = tmp_path / "ocr"
+        ocr.mkdir()
+        (ocr / "base.py").write_text("class OCRAdapter:\n    pass\n")
+        (ocr / "_private.py").write_text("class HiddenAdapter:\n    pass\n")
+        (ocr / "helpers.py").write_text("def helper():\n    return 1\n")
+        (ocr / "fancy.py").write_text(
+            "class FancyOCRAdapter:\n"
+            "    \"\"\"Fancy OCR engine.\n\n    Details.\n    \"\"\"\n"
+            "    __plugin__ = {'version': '1.2.0', 'priority': 5}\n"
+        )
+        return tmp_path
+
+    def test_discovers_adapter_classes(self, manager, adapters_dir):
+        """Test metadata is extracted and private/base files are skipped."""
+        plugins = manager.discover_plugins(base_path=adapters_dir, adapter_types=['ocr'])
+
+        assert len(plugins) == 1
+        plugin = plugins[0]
+        assert plugin.name == "fancy"
+        assert plugin.type == "ocr"
+        assert plugin.version == "1.2.0"
+        assert plugin.priority == 5
+        assert plugin.description == "Fancy OCR engine."
+
+    def test_unchanged_files_are_not_reparsed(self, manager, adapters_dir, monkeypatch):
+        """Test discovery results are cached by file mtime."""
+        first = manager.discover_plugins(base_path=adapters_dir, adapter_types=['ocr'])
+
+        monkeypatch.setattr(PluginManager, '_metadata_from_tree', lambda *a: pytest.fail("reparsed"))
+        assert manager.discover_plugins(base_path=adapters_dir, adapter_types=['ocr']) == first
+
+    def test_files_without_adapter_class_are_not_parsed(self, manager, adapters_dir, monkeypatch):
+        """Test the regex prefilter skips the AST parse for helper modules."""
+        parsed = []
+        monkeypatch.setattr(PluginManager, '_metadata_from_tree', lambda self, tree, t: parsed.append(tree))
+
+        assert manager._extract_plugin_metadata(adapters_dir / "ocr" / "helpers.py", 'ocr') is None
+        assert parsed == []
+
+
+class TestAdapterConfig:
+    """Test adapter configuration lookup."""
+
+    CONFIG = {'plugins': {'ocr': {'tesseract': {'dpi': 300}}}}
+
+    def test_returns_adapter_section(self):
+        """Test the [plugins.<type>.<name>] section is returned."""
+        manager = PluginManager(config=self.CONFIG)
+        assert dict(manager.get_adapter_config('ocr', 'tesseract')) == {'dpi': 300}
+        assert dict(manager.get_adapter_config('ocr', 'mock')) == {}
+
+    def test_from_toml_path(self, tmp_path):
+        """Test a manager can be built straight from a TOML file."""
+        path = tmp_path / "config.toml"
+        path.write_text("[plugins.ocr.tesseract]\ndpi = 300\n")
+
+        manager = PluginManager.from_toml_path(path)
+        assert dict(manager.get_adapter_config('ocr', 'tesseract')) == {'dpi': 300}
+
+    def test_config_is_cached_and_read_only(self):
+        """Test repeated lookups share one read-only mapping."""
+        manager = PluginManager(config=self.CONFIG)
+        config = manager.get_adapter_config('ocr', 'tesseract')
+
+        assert manager.get_adapter_config('ocr', 'tesseract') is config
+        with pytest.raises(TypeError):
+            config['dpi'] = 600
+
+    def test_update_config_invalidates_cache(self):
+        """Test replacing the config drops cached adapter sections."""
+        manager = PluginManager(config=self.CONFIG)
+        manager.get_adapter_config('ocr', 'tesseract')
+
+        manager.update_config({'plugins': {'ocr': {'tesseract': {'dpi': 150}}}})
+        assert manager.get_adapter_config('ocr', 'tesseract')['dpi'] == 150
+
+    def test_invalidate_config_cache(self):
+        """Test runtime config changes are picked up after invalidation."""
+        manager = PluginManager(config={'plugins': {'ocr': {'tesseract': {'dpi': 300}}}})
+        manager.get_adapter_config('ocr', 'tesseract')
+
+        manager._config['plugins']['ocr']['tesseract']['dpi'] = 600
+        manager.invalidate_config_cache()
+        assert manager.get_adapter_config('ocr', 'tesseract')['dpi'] == 600
+
+
+class TestLoadAndSwitch:
+    """Test adapter loading, instantiation and hot-swap."""
+
+    def test_load_adapter_registers_and_activates(self, manager):
+        """Test load_adapter registers, caches and activates one instance."""
+        instance = manager.load_adapter('ocr', 'mock')
+
+        assert isinstance(instance, MockOCRAdapter)
+        assert manager.get_active('ocr') is instance
+        assert manager.list_active()['ocr'] == 'mock'
+
+    def test_switch_reuses_loaded_instance(self, manager):
+        """Test switch() reuses the instance built by load_adapter()."""
+        loaded = manager.load_adapter('ocr', 'mock')
+        manager.register('ocr', 'other', MockOCRAdapter)
+
+        manager.switch('ocr', 'other')
+        manager.switch('ocr', 'mock')
+        assert manager.get_active('ocr') is loaded
+
+    def test_config_passed_as_keyword_arguments(self):
+        """Test TOML options reach the adapter constructor."""
+        manager = PluginManager(config={'plugins': {'ocr': {'mock': {'mock_text': 'hello'}}}})
+        instance = manager.load_adapter('ocr', 'mock')
+        assert instance.mock_text == 'hello'
+
+    def test_missing_module_falls_back_to_mock(self, manager):
+        """Test an unknown adapter falls back to the mock implementation."""
+        instance = manager.load_adapter('ocr', 'does-not-exist')
+        assert isinstance(instance, MockOCRAdapter)
+
+    def test_list_active_after_switch(self, manager):
+        """Test active adapter names are resolved after hot-swaps."""
+        manager.register('ocr', 'mock', MockOCRAdapter)
+        manager.register('search', 'mock', MockSearchAdapter)
+
+        manager.switch('ocr', 'mock')
+        manager.switch('search', 'mock')
+        assert manager.list_active() == {'ocr': 'mock', 'translator': None, 'search': 'mock'}
+
+    def test_list_active_is_live_read_only_view(self, manager):
+        """Test list_active() reflects later switches and cannot be mutated."""
+        active = manager.list_active()
+        manager.load_adapter('ocr', 'mock')
+
+        assert active['ocr'] == 'mock'
+        with pytest.raises(TypeError):
+            active['ocr'] = 'other'
+
+    def test_get_active_name(self, manager):
+        """Test the active adapter name is available per type."""
+        assert manager.get_active_name('ocr') is None
+        manager.load_adapter('ocr', 'mock')
+        assert manager.get_active_name('ocr') == 'mock'
+        assert manager.get_active_name('unknown') is None
+
+    def test_switch_history_is_bounded(self):
+        """Test switch history keeps only the most recent entries."""
+        manager = PluginManager(config={'max_switch_history': 2})
+        manager.register('ocr', 'a', MockOCRAdapter)
+        manager.register('ocr', 'b', MockOCRAdapter)
+
+        for name in ['a', 'b', 'a', 'b']:
+            manager.switch('ocr', name)
+
+        history = manager.get_switch_history('ocr')
+        assert [(h['from'], h['to']) for h in history] == [('b', 'a'), ('a', 'b')]
+
+    def test_switch_history_timestamps(self, manager):
+        """Test history entries expose ISO timestamps."""
+        manager.register('ocr', 'a', MockOCRAdapter)
+        manager.register('ocr', 'b', MockOCRAdapter)
+        manager.switch('ocr', 'a')
+        manager.switch('ocr', 'b')
+
+        (entry,) = manager.get_switch_history()
+        assert entry['type'] == 'ocr'
+        assert datetime.fromisoformat(entry['timestamp'])
+
+    def test_missing_module_without_fallback(self, manager):
+        """Test an unknown adapter raises when fallback is disabled."""
+        with pytest.raises(PluginLoadError, match="not found"):
+            manager.load_adapter('ocr', 'does-not-exist', fallback_to_mock=False)
+
+    def test_parallel_discovery_keeps_order(self, manager, tmp_path):
+        """Test large adapter directories give the same ordered results."""
+        ocr = tmp_path / "ocr"
+        ocr.mkdir()
+        for i in range(12):
+            (ocr / f"engine{i:02d}.py").write_text(f"class Engine{i:02d}Adapter:\n    pass\n")
+
+        plugins = manager.discover_plugins(base_path=tmp_path, adapter_types=['ocr'])
+        assert [p.name for p in plugins] == [f"engine{i:02d}" for i in range(12)]
+
+    def test_cached_switch_skips_config_lookup(self, manager, monkeypatch):
+        """Test switching back to a cached adapter does not read config."""
+        manager.register('ocr', 'a', MockOCRAdapter)
+        manager.register('ocr', 'b', MockOCRAdapter)
+        manager.switch('ocr', 'a')
+        adapter_a = manager.get_active('ocr')  # keeps the cached instance alive
+        manager.switch('ocr', 'b')
+
+        monkeypatch.setattr(PluginManager, 'get_adapter_config', lambda *a: pytest.fail("config read"))
+        manager.switch('ocr', 'a')
+        assert manager.list_active()['ocr'] == 'a'
+
+    def test_switched_away_adapter_is_released(self, manager):
+        """Test the instance cache does not keep inactive adapters alive."""
+        manager.register('ocr', 'a', MockOCRAdapter)
+        manager.register('ocr', 'b', MockOCRAdapter)
+        manager.switch('ocr', 'a')
+        ref = weakref.ref(manager.get_active('ocr'))
+
+        manager.switch('ocr', 'b')
+        gc.collect()
+        assert ref() is None
+        assert 'a' not in manager._state['ocr'].instances
+
+    def test_is_registered(self, manager):
+        """Test registry membership is checked per type."""
+        manager.register('ocr', 'mock', MockOCRAdapter)
+        assert manager.is_registered('ocr', 'mock')
+        assert not manager.is_registered('search', 'mock')
+        assert not manager.is_registered('unknown', 'mock')
+
+    def test_load_failures_expire(self, manager, monkeypatch):
+        """Test failed loads are remembered for LOAD_FAILURE_TTL seconds."""
+        now = [1000.0]
+        monkeypatch.setattr(plugin_manager.time, 'monotonic', lambda: now[0])
+
+        assert not manager.load_recently_failed('ocr', 'broken')
+        manager.record_load_failure('ocr', 'broken')
+        assert manager.load_recently_failed('ocr', 'broken')
+
+        now[0] += plugin_manager.LOAD_FAILURE_TTL
+        assert not manager.load_recently_failed('ocr', 'broken')
+
+    def test_register_clears_load_failure(self, manager):
+        """Test a successful registration forgets an earlier failure."""
+        manager.record_load_failure('ocr', 'mock')
+        manager.register('ocr', 'mock', MockOCRAdapter)
+        assert not manager.load_recently_failed('ocr', 'mock')
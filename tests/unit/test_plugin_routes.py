@@ -0,0 +1,57 @@
+"""Unit tests for indexao.plugin_routes module."""
+
+import pytest
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from indexao.plugin_manager import PluginManager
+from indexao.plugin_routes import router
+
+
+@pytest.fixture
+def manager():
+    """Empty plugin manager."""
+    return PluginManager()
+
+
+@pytest.fixture
+def client(manager):
+    """Test client for an app serving the plugin routes."""
+    app = FastAPI()
+    app.include_router(router)
+    app.state.plugin_manager = manager
+    return TestClient(app)
+
+
+class TestSwitchAdapter:
+    """Test POST /api/plugins/switch."""
+
+    def test_unknown_adapter_is_not_found(self, client, manager):
+        """Test an adapter that fails to load answers 404 instead of loading mock."""
+        response = client.post(
+            "/api/plugins/switch",
+            json={"adapter_type": "ocr", "adapter_name": "nonexistent"},
+        )
+
+        assert response.status_code == 404
+        assert manager.get_active('ocr') is None
+        assert manager.load_recently_failed('ocr', 'nonexistent')
+
+    def test_failed_load_is_not_retried(self, client, manager, monkeypatch):
+        """Test a repeated request is answered from the negative cache."""
+        payload = {"adapter_type": "ocr", "adapter_name": "nonexistent"}
+        client.post("/api/plugins/switch", json=payload)
+        monkeypatch.setattr(PluginManager, "load_adapter", lambda *a, **kw: pytest.fail("load retried"))
+
+        response = client.post("/api/plugins/switch", json=payload)
+
+        assert response.status_code == 404
@@ -0,0 +1,529 @@
+"""Unit tests for indexao.processor module."""
+
+import asyncio
+import os
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from indexao import processor as processor_module
+from indexao.adapters.ocr import MockOCRAdapter
+from indexao.config import Config
+from indexao.processor import DocumentProcessor, FileType, ProcessingStatus
+from indexao.scanner import FileMetadata, FileScanner
+from indexao.upload_handler import UploadHandler
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """Processor with mock adapters, database and queue under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    config = Config(input_dir=str(tmp_path / "input"))
+    return DocumentProcessor(config, UploadHandler(config))
+
+
+def queue_text_file(processor, name, content):
+    """Write a text file into the upload queue."""
+    path = processor.upload_handler.queue_dir / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestEnvWorkers:
+    """Test worker counts read from the environment."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("3", 3),
+        ("0", 1),
+        ("-2", 1),
+        ("many", os.cpu_count() or 1),
+        (None, os.cpu_count() or 1),
+    ])
+    def test_env_workers(self, monkeypatch, value, expected):
+        """Test malformed values fall back and counts are at least 1."""
+        if value is None:
+            monkeypatch.delenv("INDEXAO_TEST_WORKERS", raising=False)
+        else:
+            monkeypatch.setenv("INDEXAO_TEST_WORKERS", value)
+        assert processor_module._env_workers("INDEXAO_TEST_WORKERS") == expected
+
+
+class TestDetectFileType:
+    """Test file type detection."""
+
+    @pytest.mark.parametrize("mime_type,extension,expected", [
+        ("text/plain", ".txt", FileType.TEXT),
+        ("application/json", ".JSON", FileType.TEXT),
+        ("image/png", ".png", FileType.IMAGE),
+        ("application/pdf", ".bin", FileType.PDF),
+        ("application/octet-stream", ".docx", FileType.DOCUMENT),
+        ("text/plain", ".png", FileType.TEXT),
+        ("image/png", ".pdf", FileType.IMAGE),
+        ("application/octet-stream", ".zip", FileType.UNKNOWN),
+    ])
+    def test_detect_file_type(self, processor, mime_type, extension, expected):
+        """Test MIME type and extension are combined in priority order."""
+        metadata = FileMetadata(
+            path=Path(f"file{extension}"),
+            filename=f"file{extension}",
+            extension=extension,
+            size_bytes=1,
+            mime_type=mime_type,
+            modified_at=datetime.now()
+        )
+        assert processor._detect_file_type(metadata) == expected
+
+
+class TestProcessQueue:
+    """Test queue processing."""
+
+    def test_empty_queue(self, processor):
+        """Test an empty queue returns no results."""
+        assert processor.process_queue() == []
+
+    def test_results_in_queue_order(self, processor):
+        """Test parallel processing returns one result per file, in queue order."""
+        for i in range(6):
+            queue_text_file(processor, f"DOC_{i:04d}_note.txt", f"document {i}")
+
+        results = processor.process_queue(max_workers=4)
+
+        expected = [p.name for p in processor.upload_handler.list_queue()]
+        assert [r.file_metadata.filename for r in results] == expected
+        assert all(r.status == ProcessingStatus.COMPLETED for r in results)
+        assert processor.db.count_documents() == 6
+
+    def test_queue_directory_scanned_once(self, processor, monkeypatch):
+        """Test file metadata comes from a single scan of the queue directory."""
+        scans = []
+        scan = processor_module.FileScanner.scan
+        monkeypatch.setattr(
+            processor_module.FileScanner, "scan",
+            lambda self: scans.append(self) or scan(self)
+        )
+        for i in range(3):
+            queue_text_file(processor, f"DOC_{i:04d}_note.txt", f"document {i}")
+
+        assert len(processor.process_queue()) == 3
+        assert len(scans) == 1
+
+
+class TestTranslateText:
+    """Test the translation stage."""
+
+    def test_one_adapter_call_for_all_languages(self, processor, monkeypatch):
+        """Test all target languages are translated in a single adapter call."""
+        calls = []
+        translate_multi = processor._translator_adapter.translate_multi
+        monkeypatch.setattr(
+            processor._translator_adapter, "translate_multi",
+            lambda **kw: calls.append(kw["target_languages"]) or translate_multi(**kw)
+        )
+
+        translations = processor._translate_text("Hello", ["fr", "zh"])
+
+        assert translations == {"fr": "olleH", "zh": "olleH"}
+        assert calls == [["fr", "zh"]]
+
+    def test_translations_are_cached(self, processor, monkeypatch):
+        """Test a text already translated does not reach the adapter again."""
+        calls = []
+        translate_multi = processor._translator_adapter.translate_multi
+        monkeypatch.setattr(
+            processor._translator_adapter, "translate_multi",
+            lambda **kw: calls.append(kw["target_languages"]) or translate_multi(**kw)
+        )
+
+        processor._translate_text("Hello", ["fr"])
+        translations = processor._translate_text("Hello", ["zh", "fr"])
+
+        assert translations == {"zh": "olleH", "fr": "olleH"}
+        assert list(translations) == ["zh", "fr"]
+        assert calls == [["fr"], ["zh"]]
+
+
+class TestReadTextFile:
+    """Test streamed text file reading."""
+
+    def test_utf8_split_across_chunks(self, processor, tmp_path, monkeypatch):
+        """Test multi-byte characters spanning a chunk boundary are decoded."""
+        monkeypatch.setattr(processor_module, "TEXT_READ_CHUNK_SIZE", 3)
+        path = tmp_path / "note.txt"
+        path.write_text("  café 漢字  ", encoding="utf-8")
+
+        assert processor._read_text_file(path) == "café 漢字"
+
+    def test_latin1_fallback(self, processor, tmp_path):
+        """Test non UTF-8 files are read as latin-1."""
+        path = tmp_path / "legacy.txt"
+        path.write_bytes("déjà vu".encode("latin-1"))
+
+        assert processor._read_text_file(path) == "déjà vu"
+
+    def test_path_adapter_reused_per_directory(self, processor, tmp_path):
+        """Test files of the same directory share one path adapter."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        processor_module._cached_path_adapter.cache_clear()
+
+        processor._read_text_file(tmp_path / "a.txt")
+        processor._read_text_file(tmp_path / "b.txt")
+
+        info = processor_module._cached_path_adapter.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
+class TestProcessFile:
+    """Test single file processing."""
+
+    def test_indexed_document_has_translations(self, processor, monkeypatch):
+        """Test the document is indexed once, with its translations."""
+        path = queue_text_file(processor, "DOC_0001_note.txt", "Hello")
+        metadata = FileScanner(path.parent, recursive=False).scan()[0]
+        search = processor._search_adapter
+        index_calls = []
+        index_document = search.index_document
+        monkeypatch.setattr(search, "index_document", lambda doc: index_calls.append(doc) or index_document(doc))
+        monkeypatch.setattr(search, "update_document", lambda *a: pytest.fail("second index write"))
+
+        result = processor.process_file(path, metadata)
+
+        assert len(index_calls) == 1
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.search_indexed
+        indexed = processor._search_adapter.get_document(result.document_id)
+        assert indexed.content == "Hello"
+        assert indexed.metadata["translations"] == {"en": "olleH", "fr": "olleH"}
+
+
+class TestBatchedWrites:
+    """Test bulk indexing and database writes of queue runs."""
+
+    def test_queue_indexes_in_bulk(self, processor, monkeypatch):
+        """Test a queue run uses index_batch instead of per-document calls."""
+        monkeypatch.setattr(processor_module, "INDEX_BATCH_SIZE", 2)
+        monkeypatch.setattr(processor, "_index_document", lambda *a: pytest.fail("indexed one by one"))
+        batches = []
+        index_batch = processor._search_adapter.index_batch
+        monkeypatch.setattr(
+            processor._search_adapter, "index_batch",
+            lambda docs: batches.append(len(docs)) or index_batch(docs)
+        )
+        for i in range(3):
+            queue_text_file(processor, f"DOC_{i:04d}_note.txt", f"document {i}")
+
+        results = processor.process_queue()
+
+        assert sorted(batches) == [1, 2]
+        assert all(r.search_indexed for r in results)
+        indexed = processor._search_adapter.get_document(results[0].document_id)
+        assert indexed.metadata["translations"] == {"en": "0 tnemucod", "fr": "0 tnemucod"}
+        assert all(doc.indexed for doc in processor.db.list_documents())
+
+    def test_queue_saves_documents_in_one_transaction(self, processor, monkeypatch):
+        """Test queue runs save all documents with one bulk insert."""
+        monkeypatch.setattr(processor.db, "create_document", lambda doc: pytest.fail("saved one by one"))
+        for i in range(3):
+            queue_text_file(processor, f"DOC_{i:04d}_note.txt", f"document {i}")
+
+        processor.process_queue()
+
+        assert processor.db.count_documents() == 3
+
+    def test_bulk_insert_keeps_valid_rows(self, processor):
+        """Test a duplicate document does not prevent saving the others."""
+        queue_text_file(processor, "DOC_0001_note.txt", "Hello")
+        processor.process_queue()
+        existing = processor.db.get_document("DOC_DOC_0001")
+        other = processor.db.get_document("DOC_DOC_0001")
+        other.doc_id = "DOC_OTHER"
+
+        assert processor.db.bulk_create_documents([existing, other]) == 1
+        assert processor.db.count_documents() == 2
+
+
+class TestContentDedupe:
+    """Test files with already processed content skip the costly stages."""
+
+    def test_content_hash_is_upload_checksum(self, processor):
+        """Test the content hash is the SHA256 upload checksum."""
+        path = queue_text_file(processor, "DOC_0001_note.txt", "Hello")
+
+        assert processor._content_hash(path) == processor.upload_handler.calculate_checksum(path)
+
+    def test_duplicate_content_reuses_document(self, processor, monkeypatch):
+        """Test identical bytes under another name are neither read nor translated."""
+        first = processor.process_file(
+            queue_text_file(processor, "DOC_0001_note.txt", "Hello"),
+            FileScanner(processor.upload_handler.queue_dir, recursive=False).scan()[0]
+        )
+        monkeypatch.setattr(processor, "_extract_text", lambda *a: pytest.fail("text extracted again"))
+        monkeypatch.setattr(processor, "_translate_text", lambda *a: pytest.fail("translated again"))
+        path = queue_text_file(processor, "DOC_0002_copy.txt", "Hello")
+        metadata = FileScanner(path.parent, recursive=False).scan()[1]
+
+        result = processor.process_file(path, metadata)
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.content_hash == first.content_hash
+        assert result.extracted_text == "Hello"
+        assert result.translations == first.translations
+        saved = processor.db.get_document(result.document_id)
+        assert saved.metadata.content_hash == first.content_hash
+
+    def test_find_by_content_hash_ignores_failed_documents(self, processor):
+        """Test only completed documents are reused."""
+        queue_text_file(processor, "DOC_0001_note.txt", "Hello")
+        result = processor.process_queue()[0]
+        document = processor.db.get_document(result.document_id)
+        document.mark_failed("boom")
+        processor.db.update_document(document)
+
+        assert processor.db.find_by_content_hash(result.content_hash) is None
+
+
+class FakePdfPage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+
+class TestExtractTextFromPdf:
+    """Test PDF extraction prefers the embedded text layer."""
+
+    @pytest.fixture
+    def pdf_pages(self, monkeypatch):
+        """Make pypdf return the pages set by the test."""
+        pages = []
+        monkeypatch.setattr(processor_module, "PYPDF_AVAILABLE", True)
+        monkeypatch.setattr(
+            processor_module, "PdfReader",
+            lambda path: type("FakePdfReader", (), {"pages": pages})()
+        )
+        return pages
+
+    def test_text_layer_skips_ocr(self, processor, tmp_path, pdf_pages, monkeypatch):
+        """Test a PDF with text on every page is not sent to OCR."""
+        pdf_pages.extend([FakePdfPage("a" * 60), FakePdfPage("b" * 60)])
+        monkeypatch.setattr(processor, "_extract_text_from_image", lambda p: pytest.fail("OCR used"))
+
+        assert processor._extract_text_from_pdf(tmp_path / "doc.pdf") == ("a" * 60 + "\n" + "b" * 60, None)
+
+    def test_scanned_page_uses_ocr(self, processor, tmp_path, pdf_pages):
+        """Test a page without text layer sends the PDF to OCR."""
+        pdf_pages.extend([FakePdfPage("a" * 60), FakePdfPage("  ")])
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"%PDF-scan")
+
+        assert processor._extract_text_from_pdf(path) == (processor._ocr_adapter.mock_text, 0.95)
+
+
+class TestOcrConfidence:
+    """Test OCR confidence is kept and low-quality results are flagged."""
+
+    def queue_image(self, processor, name="DOC_0001_scan.png"):
+        path = processor.upload_handler.queue_dir / name
+        path.write_bytes(b"\x89PNG fake")
+        return path, FileScanner(path.parent, recursive=False).scan()[0]
+
+    def test_confident_ocr_is_recorded(self, processor):
+        """Test confidence reaches the result and the database."""
+        path, metadata = self.queue_image(processor)
+
+        result = processor.process_file(path, metadata)
+
+        assert result.ocr_confidence == 0.95
+        assert not result.needs_review
+        saved = processor.db.get_document(result.document_id)
+        assert saved.metadata.ocr_confidence == 0.95
+
+    def test_low_confidence_retries_then_flags_review(self, processor, monkeypatch):
+        """Test a low score is retried with other options, then flagged."""
+        calls = []
+        adapter = processor._ocr_adapter
+        adapter.mock_confidence = 0.4
+        process_image = adapter.process_image
+        monkeypatch.setattr(
+            adapter, "process_image",
+            lambda path, **kw: calls.append(kw) or process_image(path, **kw)
+        )
+        path, metadata = self.queue_image(processor)
+
+        result = processor.process_file(path, metadata)
+
+        assert calls == [{}, processor_module.OCR_RETRY_OPTIONS]
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.needs_review
+        assert processor.db.get_document(result.document_id).metadata.needs_review
+
+
+class TestOcrCache:
+    """Test OCR results are cached by content hash."""
+
+    def test_cached_result_skips_adapter(self, processor, tmp_path, monkeypatch):
+        """Test identical image bytes are only sent to the OCR adapter once."""
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"\x89PNG fake")
+        content_hash = processor._content_hash(path)
+        first = processor._extract_text_from_image(path, content_hash)
+        monkeypatch.setattr(
+            processor._ocr_adapter, "process_image", lambda *a, **kw: pytest.fail("OCR ran again")
+        )
+
+        cached = processor._extract_text_from_image(path, content_hash)
+
+        assert (cached.text, cached.confidence) == (first.text, first.confidence)
+
+    def test_cache_is_per_engine(self, processor):
+        """Test a result cached for one engine is not returned for another."""
+        result = processor_module.OCRResult(
+            text="scan", language="en", confidence=0.9, processing_time_ms=1.0, metadata={}
+        )
+        processor.db.put_ocr_cache("abc", "mock-ocr", result)
+
+        assert processor.db.get_ocr_cached("abc", "mock-ocr").text == "scan"
+        assert processor.db.get_ocr_cached("abc", "tesseract") is None
+
+
+class TestCpuPool:
+    """Test CPU-bound OCR engines run in worker processes."""
+
+    def test_in_process_adapter_skips_pool(self, processor, tmp_path):
+        """Test the mock adapter is called directly."""
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"\x89PNG fake")
+
+        processor._run_ocr(path)
+
+        assert processor._cpu_pool is None
+
+    def test_cpu_bound_adapter_runs_in_process_pool(self, processor, tmp_path, monkeypatch):
+        """Test a cpu_bound adapter is sent to the process pool."""
+        monkeypatch.setattr(processor_module, "OCR_PROCESSES", 1)
+        processor._ocr_adapter.cpu_bound = True
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"\x89PNG fake")
+
+        try:
+            result = processor._run_ocr(path)
+            assert result.text == processor._ocr_adapter.mock_text
+            assert isinstance(processor._cpu_pool, processor_module.ProcessPoolExecutor)
+        finally:
+            processor.close()
+        assert processor._cpu_pool is None
+
+    def test_tesseract_engine_uses_process_pool(self, tmp_path, monkeypatch):
+        """Test the tesseract engine is built and routed to the process pool."""
+        class FakeTesseract:
+            cpu_bound = True
+
+            def __init__(self, tesseract_cmd=None):
+                self.tesseract_cmd = tesseract_cmd
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(processor_module, "TesseractOCR", FakeTesseract)
+        config = Config(input_dir=str(tmp_path / "input"))
+        config.plugins.ocr.engine = "tesseract"
+        config.plugins.ocr.options = {"tesseract_cmd": "/opt/tesseract"}
+
+        processor = DocumentProcessor(config, UploadHandler(config))
+        try:
+            assert isinstance(processor._ocr_adapter, FakeTesseract)
+            assert processor._ocr_adapter.tesseract_cmd == "/opt/tesseract"
+        finally:
+            processor.close()
+
+    def test_tesseract_unavailable_falls_back_to_mock(self, tmp_path, monkeypatch):
+        """Test a missing Tesseract install falls back to the mock adapter."""
+        def unavailable(tesseract_cmd=None):
+            raise ImportError("pytesseract")
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(processor_module, "TesseractOCR", unavailable)
+        config = Config(input_dir=str(tmp_path / "input"))
+        config.plugins.ocr.engine = "tesseract"
+
+        processor = DocumentProcessor(config, UploadHandler(config))
+        try:
+            assert isinstance(processor._ocr_adapter, MockOCRAdapter)
+        finally:
+            processor.close()
+
+
+class TestSummarizeResults:
+    """Test the run summary."""
+
+    def test_counts_and_total_time(self):
+        """Test outcomes and durations are aggregated in one pass."""
+        results = [
+            processor_module.ProcessingResult("A", ProcessingStatus.COMPLETED, processing_time_seconds=1.5),
+            processor_module.ProcessingResult(
+                "B", ProcessingStatus.COMPLETED, needs_review=True, processing_time_seconds=0.5
+            ),
+            processor_module.ProcessingResult("C", ProcessingStatus.FAILED, processing_time_seconds=1.0),
+        ]
+
+        assert processor_module.summarize_results(results) == {
+            "processed": 3,
+            "completed": 2,
+            "failed": 1,
+            "needs_review": 1,
+            "total_time_seconds": 3.0,
+        }
+
+
+class TestTextCompression:
+    """Test large document text is stored compressed."""
+
+    def test_large_content_round_trips(self, processor):
+        """Test content and translations above the threshold are compressed, then restored."""
+        text = "Lorem ipsum dolor sit amet. " * 500
+        queue_text_file(processor, "DOC_0001_note.txt", text)
+        result = processor.process_queue()[0]
+
+        with processor.db._connection() as conn:
+            row = conn.execute(
+                "SELECT content, translations FROM documents WHERE doc_id = ?", (result.document_id,)
+            ).fetchone()
+        assert isinstance(row["content"], bytes)
+        assert len(row["content"]) < len(text)
+        assert isinstance(row["translations"], bytes)
+
+        saved = processor.db.get_document(result.document_id)
+        assert saved.content == text.strip()
+        assert saved.translations == result.translations
+
+    def test_small_content_stays_text(self, processor):
+        """Test short documents are stored as plain text."""
+        queue_text_file(processor, "DOC_0001_note.txt", "Hello")
+        result = processor.process_queue()[0]
+
+        with processor.db._connection() as conn:
+            row = conn.execute(
+                "SELECT content FROM documents WHERE doc_id = ?", (result.document_id,)
+            ).fetchone()
+        assert row["content"] == "Hello"
+
+
+class TestAsyncApi:
+    """Test the asyncio wrappers."""
+
+    def test_process_batch_async(self, processor):
+        """Test documents run in the processor pool and results keep input order."""
+        for i in range(3):
+            queue_text_file(processor, f"DOC_{i:04d}_note.txt", f"document {i}")
+        files = [
+            (m.path, m) for m in FileScanner(processor.upload_handler.queue_dir, recursive=False).scan()
+        ]
+
+        results = asyncio.run(processor_module.process_batch_async(processor, files))
+
+        assert [r.file_metadata.filename for r in results] == [m.filename for _, m in files]
+        assert all(r.status == ProcessingStatus.COMPLETED for r in results)
@@ -0,0 +1,220 @@
+"""Unit tests for indexao.scanner module."""
+
+import os
+import pytest
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from indexao import scanner as scanner_module
+from indexao.scanner import FileScanner
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Directory tree with visible, hidden and nested files."""
+    (tmp_path / "a.txt").write_text("aaaa")
+    (tmp_path / "b.PDF").write_bytes(b"%PDF-b")
+    (tmp_path / ".hidden.txt").write_text("h")
+    (tmp_path / "archive.tar.gz").write_bytes(b"gz")
+    (tmp_path / "README").write_text("readme")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "c.txt").write_text("c" * 100)
+    hidden_dir = tmp_path / ".git"
+    hidden_dir.mkdir()
+    (hidden_dir / "config").write_text("x")
+    return tmp_path
+
+
+def names(files):
+    return sorted(str(f.relative_path) for f in files)
+
+
+class TestScan:
+    """Test directory traversal and filters."""
+
+    def test_recursive_scan_skips_hidden(self, tree):
+        """Test hidden files and directories are skipped by default."""
+        files = FileScanner(tree).scan()
+
+        assert names(files) == ["README", "a.txt", "archive.tar.gz", "b.PDF", "sub/c.txt"]
+
+    def test_non_recursive_scan(self, tree):
+        """Test subdirectories are not visited when recursive is False."""
+        files = FileScanner(tree, recursive=False).scan()
+
+        assert "sub/c.txt" not in names(files)
+        assert len(files) == 4
+
+    def test_include_hidden(self, tree):
+        """Test hidden files and directories are returned on request."""
+        files = FileScanner(tree, include_hidden=True).scan()
+
+        assert {".hidden.txt", ".git/config"} <= set(names(files))
+
+    def test_extension_filters(self, tree):
+        """Test extension whitelist and blacklist are case-insensitive."""
+        assert names(FileScanner(tree, allowed_extensions={"pdf", ".TXT"}).scan()) == [
+            "a.txt", "b.PDF", "sub/c.txt"
+        ]
+        assert names(FileScanner(tree, excluded_extensions={".txt", ".gz"}).scan()) == [
+            "README", "b.PDF"
+        ]
+
+    def test_size_filters(self, tree):
+        """Test files outside the size limits are skipped."""
+        assert names(FileScanner(tree, min_size_bytes=50).scan()) == ["sub/c.txt"]
+        assert "sub/c.txt" not in names(FileScanner(tree, max_size_bytes=50).scan())
+
+    def test_filtered_files_are_not_stated(self, tree, monkeypatch):
+        """Test files rejected by name are never stat'ed."""
+        stated = []
+        scanner = FileScanner(tree, allowed_extensions={".pdf"})
+        monkeypatch.setattr(scanner, "_should_skip_size", lambda entry, st: stated.append(entry.name))
+
+        assert names(scanner.scan()) == ["b.PDF"]
+        assert stated == ["b.PDF"]
+
+    def test_metadata(self, tree):
+        """Test metadata fields of a scanned file."""
+        files = {f.filename: f for f in FileScanner(tree).scan()}
+
+        pdf = files["b.PDF"]
+        assert pdf.path == tree.resolve() / "b.PDF"
+        assert pdf.extension == ".pdf"
+        assert pdf.size_bytes == 6
+        assert pdf.mime_type == "application/pdf"
+        assert files["archive.tar.gz"].extension == ".gz"
+        assert files["README"].extension == ""
+        assert files["README"].mime_type == "application/octet-stream"
+        assert not hasattr(pdf, "__dict__")
+        assert pdf.to_dict()["relative_path"] == "b.PDF"
+
+    def test_deep_tree(self, tmp_path):
+        """Test trees deeper than the recursion limit are scanned."""
+        deep = tmp_path
+        for _ in range(sys.getrecursionlimit() + 10):
+            deep = deep / "d"
+            os.mkdir(deep)
+        (deep / "leaf.txt").write_text("x")
+
+        try:
+            assert [f.filename for f in FileScanner(tmp_path).scan()] == ["leaf.txt"]
+        finally:
+            # Removed here: pytest's tmp_path cleanup (shutil.rmtree) recurses per level
+            (deep / "leaf.txt").unlink()
+            while deep != tmp_path:
+                deep.rmdir()
+                deep = deep.parent
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_symlinks(self, tree):
+        """Test symlinks are skipped unless followed, broken links always."""
+        (tree / "link.txt").symlink_to(tree / "a.txt")
+        (tree / "broken.txt").symlink_to(tree / "missing.txt")
+
+        assert "link.txt" not in names(FileScanner(tree).scan())
+        followed = names(FileScanner(tree, follow_symlinks=True).scan())
+        assert "link.txt" in followed
+        assert "broken.txt" not in followed
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_followed_directory_symlink(self, tree):
+        """Test a followed directory symlink is scanned like a directory."""
+        (tree / "alias").symlink_to(tree / "sub", target_is_directory=True)
+
+        assert "alias/c.txt" not in names(FileScanner(tree).scan())
+        assert "alias/c.txt" in names(FileScanner(tree, follow_symlinks=True).scan())
+
+
+def describe(files):
+    return sorted((f.to_dict() for f in files), key=lambda d: d["path"])
+
+
+@pytest.mark.skipif(not scanner_module.SCANDIR_RS_AVAILABLE, reason="scandir-rs not installed")
+class TestScandirRsBackend:
+    """Test the scandir-rs traversal backend against the os.scandir walk."""
+
+    def test_backend_is_used(self, tree, monkeypatch):
+        """Test recursive scans go through scandir-rs."""
+        scanner = FileScanner(tree)
+        monkeypatch.setattr(scanner, "_scan_directory", None)
+
+        assert names(scanner.scan()) == ["README", "a.txt", "archive.tar.gz", "b.PDF", "sub/c.txt"]
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_same_metadata_as_scandir(self, tree, monkeypatch):
+        """Test both backends apply the same filters and build the same metadata."""
+        (tree / "link.txt").symlink_to(tree / "a.txt")
+        options = [
+            {},
+            {"include_hidden": True},
+            {"min_size_bytes": 50},
+            {"allowed_extensions": {".txt"}},
+        ]
+        with_rs = [describe(FileScanner(tree, **kwargs).scan()) for kwargs in options]
+
+        monkeypatch.setattr(scanner_module, "SCANDIR_RS_AVAILABLE", False)
+
+        assert [describe(FileScanner(tree, **kwargs).scan()) for kwargs in options] == with_rs
+
+
+class TestScanColumns:
+    """Test the columnar scan."""
+
+    def test_columns_match_scan(self, tree):
+        """Test columns hold the same files and fields as scan()."""
+        scanner = FileScanner(tree)
+        files = sorted(scanner.scan(), key=lambda f: str(f.path))
+        columns = scanner.scan_columns()
+        order = sorted(range(len(columns["paths"])), key=lambda i: columns["paths"][i])
+
+        assert [columns["paths"][i] for i in order] == [str(f.path) for f in files]
+        assert [columns["sizes"][i] for i in order] == [f.size_bytes for f in files]
+        assert [columns["extensions"][i] for i in order] == [f.extension for f in files]
+        assert [columns["mime_types"][i] for i in order] == [f.mime_type for f in files]
+        assert [columns["mtimes"][i] for i in order] == pytest.approx(
+            [f.modified_at.timestamp() for f in files], abs=1e-5
+        )
+        assert columns["sizes"].typecode == "q"
+
+
+class TestSummary:
+    """Test scan statistics."""
+
+    def test_summary(self, tree):
+        """Test totals and per-extension/MIME counts."""
+        summary = FileScanner(tree).get_summary()
+
+        assert summary["total_files"] == 5
+        assert summary["total_size_bytes"] == 4 + 6 + 2 + 6 + 100
+        assert summary["extensions"] == {".txt": 2, ".pdf": 1, ".gz": 1, "(no extension)": 1}
+        assert summary["mime_types"]["text/plain"] == 2
+        assert summary["filters"]["allowed_extensions"] == "all"
+
+
+class TestParallelScan:
+    """Test directory listing with several workers."""
+
+    def test_same_files_as_sequential(self, tree):
+        """Test a parallel scan finds the same files."""
+        for i in range(5):
+            nested = tree / f"d{i}" / "inner"
+            nested.mkdir(parents=True)
+            (nested / f"f{i}.txt").write_text("x")
+
+        sequential = names(FileScanner(tree).scan())
+        parallel = names(FileScanner(tree, max_workers=4).scan())
+
+        assert parallel == sequential
+        assert "d3/inner/f3.txt" in parallel
+
+    def test_early_stop(self, tree):
+        """Test a consumer can stop a parallel scan midway."""
+        iterator = FileScanner(tree, max_workers=4).scan_iter()
+
+        assert next(iterator).filename
+        iterator.close()
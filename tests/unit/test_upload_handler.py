@@ -0,0 +1,135 @@
+"""Unit tests for indexao.upload_handler module."""
+
+import errno
+import hashlib
+import pytest
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from indexao import upload_handler
+from indexao.config import Config
+from indexao.upload_handler import FileTooLargeError, InvalidFileTypeError, UploadError, UploadHandler
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """Upload handler with its input directory under tmp_path."""
+    return UploadHandler(Config(input_dir=str(tmp_path / "input")))
+
+
+class TestChecksum:
+    """Test file checksums."""
+
+    def test_sha256(self, handler, tmp_path):
+        """Test the checksum is the SHA256 of the file content."""
+        path = tmp_path / "doc.txt"
+        data = b"indexao" * 10000
+        path.write_bytes(data)
+
+        assert handler.calculate_checksum(path) == hashlib.sha256(data).hexdigest()
+
+    def test_large_file_uses_mmap(self, handler, tmp_path, monkeypatch):
+        """Test files above the mmap threshold hash to the same value."""
+        monkeypatch.setattr(upload_handler, "MMAP_CHECKSUM_MIN_BYTES", 1024)
+        path = tmp_path / "scan.pdf"
+        data = bytes(range(256)) * 64
+        path.write_bytes(data)
+
+        assert handler.calculate_checksum(path) == hashlib.sha256(data).hexdigest()
+
+    def test_empty_file(self, handler, tmp_path):
+        """Test an empty file has the SHA256 of no bytes."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert handler.calculate_checksum(path) == hashlib.sha256(b"").hexdigest()
+
+
+class TestDetectMimeType:
+    """Test MIME type detection."""
+
+    def test_by_extension(self, handler):
+        """Test the MIME type follows the (case-insensitive) extension."""
+        assert handler.detect_mime_type(Path("scan.PDF")) == "application/pdf"
+        assert handler.detect_mime_type(Path("notes.txt")) == "text/plain"
+        assert handler.detect_mime_type(Path("README")) == "application/octet-stream"
+
+
+class TestHandleUpload:
+    """Test the complete upload flow."""
+
+    def test_upload_moves_file_to_queue(self, handler, tmp_path):
+        """Test an accepted file is described and moved to the queue."""
+        path = tmp_path / "report.txt"
+        path.write_text("hello")
+
+        result = handler.handle_upload(path, "Report.txt")
+
+        metadata = result["metadata"]
+        queue_path = Path(metadata["queue_path"])
+        assert result["success"]
+        assert not path.exists()
+        assert queue_path.read_text() == "hello"
+        assert queue_path.name == f"{result['document_id']}_report.txt"
+        assert metadata["size_bytes"] == 5
+        assert metadata["extension"] == ".txt"
+        assert metadata["mime_type"] == "text/plain"
+        assert metadata["checksum"] == hashlib.sha256(b"hello").hexdigest()
+        assert metadata["original_filename"] == "Report.txt"
+        assert handler.list_queue() == [queue_path]
+
+    def test_upload_does_not_restat_path(self, handler, tmp_path, monkeypatch):
+        """Test validation and metadata reuse the fstat of the opened file."""
+        path = tmp_path / "report.txt"
+        path.write_text("hello")
+
+        def no_stat(self, *args, **kwargs):
+            raise AssertionError(f"unexpected stat of {self}")
+
+        monkeypatch.setattr(Path, "stat", no_stat)
+        result = handler.handle_upload(path)
+
+        assert result["metadata"]["size_bytes"] == 5
+        assert result["metadata"]["checksum"] == hashlib.sha256(b"hello").hexdigest()
+
+    def test_cross_device_move(self, handler, tmp_path, monkeypatch):
+        """Test the queue move falls back to shutil.move across filesystems."""
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(upload_handler.os, "replace", cross_device)
+        path = tmp_path / "report.txt"
+        path.write_text("hello")
+
+        queue_path = handler.move_to_queue(path, "DOC_00000001")
+
+        assert not path.exists()
+        assert queue_path.read_text() == "hello"
+
+    def test_rejects_disallowed_extension(self, handler, tmp_path):
+        """Test files with an extension outside the whitelist are refused."""
+        path = tmp_path / "tool.exe"
+        path.write_bytes(b"MZ")
+
+        with pytest.raises(InvalidFileTypeError):
+            handler.handle_upload(path)
+        assert path.exists()
+
+    def test_rejects_large_file(self, handler, tmp_path):
+        """Test files above the size limit are refused."""
+        handler.max_size_mb = 0
+        path = tmp_path / "big.txt"
+        path.write_text("too big")
+
+        with pytest.raises(FileTooLargeError):
+            handler.handle_upload(path)
+
+    def test_missing_file(self, handler, tmp_path):
+        """Test a missing file raises UploadError."""
+        with pytest.raises(UploadError):
+            handler.handle_upload(tmp_path / "missing.txt")
+        with pytest.raises(UploadError):
+            handler.validate_file(tmp_path / "missing.txt")